@@ -1,9 +1,25 @@
+import importlib
+
+from . import bitsets
+from . import compiled
 from . import en_words
 from . import letters
 from . import NATO
+from . import spelling
+from . import trie
 from . import utils
 from . import word_games
 
+# Modules that import numpy (which is optional and slow to import) are only 
+# imported when they are first used
+_LAZY_MODULES = ('matrices', 'wordle')
+
+def __getattr__(name: str):
+    if name in _LAZY_MODULES:
+        return importlib.import_module(f'.{name}', __name__)
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 # from en_words.en_words import (
 #     create_sorted_dict, 
 #     unsorted_words, 
@@ -0,0 +1,188 @@
+"""
+bitsets.py
+----------
+
+Bitset indexes over a list of words.
+
+A bitset is a plain int where bit i is set if word i (the position of the word
+in the list) is in the set. Python ints are arbitrary precision, so a single
+int can hold a set over any number of words and combining sets with & | ~ is
+done in C rather than a Python loop.
+"""
+
+from collections.abc import Iterator
+
+
+def bitset_from_ids(ids: list[int], size: int) -> int:
+    """
+    Creates a bitset from the positions of the words in the set.
+
+    Args:
+        ids (list[int]):
+            The positions of the words in the set.
+        size (int):
+            The number of words in the list.
+
+    Returns:
+        int
+    """
+    bits = bytearray((size + 7) // 8)
+
+    for i in ids:
+        bits[i >> 3] |= 1 << (i & 7)
+
+    return int.from_bytes(bits, 'little')
+
+def bit_positions(bitset: int) -> Iterator[int]:
+    """
+    Returns the positions of the set bits (the words in the set) in ascending
+    order. E.g. 0b10110 -> 1, 2, 4
+
+    Args:
+        bitset (int):
+            The bitset.
+
+    Returns:
+        Iterator[int]
+    """
+    # Reversed binary string, so the character at i is bit i
+    bits = bin(bitset)[:1:-1]
+    i = bits.find('1')
+
+    while i != -1:
+        yield i
+        i = bits.find('1', i + 1)
+
+
+class PositionalIndex:
+    """
+    A bitset index over words that all have the same length.
+
+    For every (position, letter) pair there is a bitset of the words with that
+    letter at that position, and for every letter a bitset of the words that
+    contain it. A partial word such as '?a?e?' is then matched with a few
+    bitwise ANDs rather than comparing it against every word.
+
+    Example:
+        >>> index = PositionalIndex(['cat', 'cot', 'dog'])
+        >>> list(bit_positions(index.matches('c?t')))
+        [0, 1]
+
+    Attributes:
+        length (int):
+            The number of letters in each word.
+        size (int):
+            The number of words.
+        all (int):
+            A bitset of every word.
+    """
+
+    def __init__(self, words: list[str]):
+        """
+        Builds the index.
+
+        Args:
+            words (list[str]):
+                Lowercase words, all of the same length.
+
+        Raises:
+            ValueError:
+                If the words are not all the same length.
+        """
+        self.length = len(words[0]) if words else 0
+        self.size = len(words)
+        self.all = (1 << self.size) - 1
+
+        if any(len(word) != self.length for word in words):
+            raise ValueError("Words must all be the same length")
+
+        contains = {}
+        self._positions = []
+
+        for position in range(self.length):
+            letter_ids = {}
+
+            for i, word in enumerate(words):
+                letter_ids.setdefault(word[position], []).append(i)
+
+            self._positions.append({
+                letter: bitset_from_ids(ids, self.size) for letter, ids in letter_ids.items()})
+
+            for letter, bitset in self._positions[-1].items():
+                contains[letter] = contains.get(letter, 0) | bitset
+
+        self._contains = contains
+
+    def characters(self) -> set[str]:
+        """
+        Returns every character used in the words.
+
+        Returns:
+            set[str]
+        """
+        return set(self._contains)
+
+    def at(self, position: int, letter: str) -> int:
+        """
+        Returns a bitset of the words with a letter at a position.
+
+        Args:
+            position (int):
+                The position in the word, starting at 0.
+            letter (str):
+                A lowercase letter.
+
+        Returns:
+            int
+        """
+        return self._positions[position].get(letter, 0)
+
+    def containing(self, letter: str) -> int:
+        """
+        Returns a bitset of the words that contain a letter.
+
+        Args:
+            letter (str):
+                A lowercase letter.
+
+        Returns:
+            int
+        """
+        return self._contains.get(letter, 0)
+
+    def matches(self,
+            partial_word: str,
+            ignore_letters: str='',
+            required_letters: str='',
+            missing_characters: str='?-_.') -> int:
+        """
+        Returns a bitset of the words that are a potential match for a partial
+        word, with the same rules as `en_words.is_potential_match`.
+
+        Args:
+            partial_word (str):
+                A lowercase word with letters missing, the same length as the
+                words in the index.
+            ignore_letters (str):
+                A string of letters that must not be in the word.
+            required_letters (str):
+                A string of letters that must be in the word.
+            missing_characters (str):
+                The characters that stand for a missing letter.
+
+        Returns:
+            int
+        """
+        bitset = self.all
+
+        for position, letter in enumerate(partial_word):
+            if letter not in missing_characters:
+                bitset &= self.at(position, letter)
+
+        for letter in required_letters:
+            bitset &= self.containing(letter)
+
+        for letter in ignore_letters:
+            bitset &= ~self.containing(letter)
+
+        return bitset
@@ -0,0 +1,510 @@
+"""
+compiled.py
+-----------
+
+Reads and writes the compiled (binary) form of a sorted dictionary.
+
+Parsing the text dictionary creates a Python string for every word each time a
+process starts. The compiled form is memory mapped instead, so it loads
+instantly, processes share the same pages and a string is only created for a
+word when it is asked for.
+
+File layout (little endian):
+    Header:
+        magic (4s), version (H), reserved (H), word count (I),
+        max word length (I), band count (I), checksum (I)
+    Band table:
+        band count x (length (I), start (I), end (I))
+    Offsets:
+        (word count + 1) x byte offset into the blob (I)
+    Blob:
+        Every word, lowercase and utf-8 encoded, concatenated in sorted order
+        (length and then alphabetical) with no separators.
+
+The checksum is the CRC-32 of the offsets and the blob. The header and band 
+table alone answer how many words there are, the longest word length and how 
+many words there are of each length, see `read_metadata`.
+
+Indexes built from a dictionary (e.g. the anagram index) are pickled to their
+own files alongside it, see `index_filename`, along with the checksum of the
+dictionary they were built from.
+"""
+
+import mmap
+import os
+import pickle
+import struct
+import sys
+import tempfile
+import zlib
+
+from array import array
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from typing import NamedTuple
+
+
+#region Globals
+
+MAGIC = b'ENWD'
+VERSION = 2
+
+HEADER = struct.Struct('<4sHHIIII')
+BAND = struct.Struct('<III')
+
+COMPILED_EXTENSION = '.bin'
+INDEX_EXTENSION = '.pickle'
+INDEX_VERSION = 2
+
+# The number of offsets buffered, and the bytes copied at a time, when 
+# writing a compiled dictionary
+_OFFSETS_BUFFER = 1 << 16
+_COPY_SIZE = 1 << 20
+
+#endregion
+
+
+class Metadata(NamedTuple):
+    """
+    The facts about a compiled dictionary that are stored in its header.
+
+    Attributes:
+        word_count (int):
+            The number of words.
+        max_len (int):
+            The length of the largest word.
+        length_counts (dict[int, int]):
+            The number of words of each length, in order of length.
+        checksum (int):
+            The CRC-32 of the words, see `CompiledWords.verify`.
+    """
+    word_count: int
+    max_len: int
+    length_counts: dict[int, int]
+    checksum: int
+
+
+def compiled_filename(filename_sorted: str) -> str:
+    """
+    Returns the name of the compiled file that sits alongside a sorted
+    dictionary. E.g. en_words_sorted.txt -> en_words_sorted.bin
+
+    Args:
+        filename_sorted (str):
+            The name of the file containing the sorted dictionary.
+
+    Returns:
+        str
+    """
+    return os.path.splitext(filename_sorted)[0] + COMPILED_EXTENSION
+
+def is_stale(filename_compiled: str, filename_sorted: str) -> bool:
+    """
+    Checks if a compiled dictionary is missing or older than the sorted
+    dictionary it was compiled from.
+
+    Args:
+        filename_compiled (str):
+            The name of the compiled dictionary.
+        filename_sorted (str):
+            The name of the file containing the sorted dictionary.
+
+    Returns:
+        bool:
+            True if the compiled dictionary needs to be (re)built.
+    """
+    if not os.path.exists(filename_compiled):
+        return True
+
+    if not os.path.exists(filename_sorted):
+        return False
+
+    return os.path.getmtime(filename_compiled) < os.path.getmtime(filename_sorted)
+
+def read_metadata(filename_compiled: str) -> Metadata:
+    """
+    Reads the metadata of a compiled dictionary from its header, without 
+    reading the words.
+
+    Args:
+        filename_compiled (str):
+            The name of the compiled dictionary.
+
+    Raises:
+        ValueError:
+            If the file is not a compiled dictionary or was written by an
+            incompatible version.
+
+    Returns:
+        Metadata
+    """
+    with open(filename_compiled, 'rb') as f:
+        header = f.read(HEADER.size)
+        word_count, max_len, band_count, checksum = _unpack_header(header, filename_compiled)
+        bands = _unpack_bands(f.read(band_count * BAND.size), band_count)
+
+    return Metadata(word_count, max_len, _length_counts(bands), checksum)
+
+def _unpack_header(buffer, filename: str) -> tuple[int, int, int, int]:
+    """
+    Unpacks and checks the header of a compiled dictionary, returning the 
+    word count, max word length, band count and checksum.
+    """
+    if len(buffer) < HEADER.size:
+        raise ValueError(f"Not a compiled dictionary: '{filename}'")
+
+    magic, version, _, word_count, max_len, band_count, checksum = HEADER.unpack_from(buffer)
+
+    if magic != MAGIC:
+        raise ValueError(f"Not a compiled dictionary: '{filename}'")
+
+    if version != VERSION:
+        raise ValueError(f"Unsupported compiled dictionary version {version}: '{filename}'")
+
+    return word_count, max_len, band_count, checksum
+
+def _unpack_bands(buffer, band_count: int, offset: int=0) -> dict[int, tuple[int, int]]:
+    """
+    Unpacks the band table, mapping each word length to its (start, end).
+    """
+    bands = {}
+
+    for i in range(band_count):
+        length, start, end = BAND.unpack_from(buffer, offset + i * BAND.size)
+        bands[length] = (start, end)
+
+    return bands
+
+def _length_counts(bands: dict[int, tuple[int, int]]) -> dict[int, int]:
+    return {length: end - start for length, (start, end) in sorted(bands.items())}
+
+def index_filename(filename_sorted: str, name: str) -> str:
+    """
+    Returns the name of the file holding an index of a sorted dictionary.
+    E.g. (en_words_sorted.txt, anagrams) -> en_words_sorted.anagrams.pickle
+
+    Args:
+        filename_sorted (str):
+            The name of the file containing the sorted dictionary.
+        name (str):
+            The name of the index.
+
+    Returns:
+        str
+    """
+    return f"{os.path.splitext(filename_sorted)[0]}.{name}{INDEX_EXTENSION}"
+
+def read_index(filename_index: str, name: str, checksum: int | None=None):
+    """
+    Reads an index written by `write_index`.
+
+    Args:
+        filename_index (str):
+            The name of the index file.
+        name (str):
+            The name of the index.
+        checksum (int | None):
+            The checksum of the compiled dictionary the index must have been 
+            built from, see `CompiledWords.checksum`.
+
+    Returns:
+        Any:
+            The index, or None if the file is missing, unreadable, was 
+            written by an incompatible version (including an older layout of
+            the index's class) or was built from a different dictionary.
+    """
+    try:
+        with open(filename_index, 'rb') as f:
+            version, index_name, index_checksum, index = pickle.load(f)
+
+    except (OSError, EOFError, ValueError, AttributeError, TypeError, ImportError, pickle.UnpicklingError):
+        return None
+
+    if version != INDEX_VERSION or index_name != name or index_checksum != checksum:
+        return None
+
+    return index
+
+def write_index(index, filename_index: str, name: str, checksum: int | None=None) -> None:
+    """
+    Writes an index of a dictionary, replacing the file in one go like 
+    `write_compiled`.
+
+    Args:
+        index (Any):
+            The index, anything that can be pickled.
+        filename_index (str):
+            The name of the index file to create.
+        name (str):
+            The name of the index.
+        checksum (int | None):
+            The checksum of the compiled dictionary the index was built from,
+            checked by `read_index`.
+    """
+    with _replace(filename_index) as f:
+        pickle.dump((INDEX_VERSION, name, checksum, index), f, protocol=pickle.HIGHEST_PROTOCOL)
+
+def write_compiled(words: Iterable[str], filename_compiled: str) -> None:
+    """
+    Writes a compiled dictionary.
+
+    The words are streamed, so only one word is held in memory at a time. The
+    offsets and the blob are written to their own temporary files as the words
+    are read, as their positions in the file aren't known until every word 
+    has been seen, and are then copied in after the header and band table.
+
+    The file is written to a temporary file first and then moved into place, so
+    a process loading the dictionary never sees a half written file.
+
+    Args:
+        words (Iterable[str]):
+            Lowercase words, sorted by length and then alphabetically.
+        filename_compiled (str):
+            The name of the compiled dictionary to create.
+
+    Raises:
+        ValueError:
+            If the words are not sorted by length.
+    """
+    directory = os.path.dirname(os.path.abspath(filename_compiled))
+    bands = {}
+    word_count = 0
+
+    with tempfile.TemporaryFile(dir=directory) as offsets_file, tempfile.TemporaryFile(dir=directory) as blob_file:
+        offsets = array('I', [0])
+        size = 0
+
+        for i, word in enumerate(words):
+            length = len(word)
+            start, _ = bands.get(length, (i, i))
+
+            if length not in bands and bands and length < max(bands):
+                raise ValueError(f"Words must be sorted by length: '{word}'")
+
+            bands[length] = (start, i + 1)
+            data = word.encode()
+            blob_file.write(data)
+            size += len(data)
+            offsets.append(size)
+            word_count += 1
+
+            if len(offsets) >= _OFFSETS_BUFFER:
+                _write_offsets(offsets, offsets_file)
+
+        _write_offsets(offsets, offsets_file)
+
+        max_len = max(bands, default=0)
+        checksum = 0
+
+        with _replace(filename_compiled) as f:
+            # The checksum is only known once the offsets and blob are copied
+            f.write(HEADER.pack(MAGIC, VERSION, 0, word_count, max_len, len(bands), checksum))
+
+            for length, (start, end) in bands.items():
+                f.write(BAND.pack(length, start, end))
+
+            for part in (offsets_file, blob_file):
+                part.seek(0)
+
+                while chunk := part.read(_COPY_SIZE):
+                    checksum = zlib.crc32(chunk, checksum)
+                    f.write(chunk)
+
+            f.seek(0)
+            f.write(HEADER.pack(MAGIC, VERSION, 0, word_count, max_len, len(bands), checksum))
+
+def _write_offsets(offsets: array, f) -> None:
+    """ Writes buffered offsets, little endian, and empties the buffer. """
+    if sys.byteorder != 'little':
+        offsets.byteswap()
+
+    f.write(offsets.tobytes())
+    del offsets[:]
+
+@contextmanager
+def _replace(filename: str):
+    """
+    Opens a temporary file for writing in binary mode and moves it over 
+    `filename` once it has been written, so nothing ever reads a half written 
+    file.
+    """
+    directory = os.path.dirname(os.path.abspath(filename))
+    fd, temp_filename = tempfile.mkstemp(dir=directory, suffix=os.path.splitext(filename)[1])
+
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            yield f
+
+        os.chmod(temp_filename, 0o644)
+        os.replace(temp_filename, filename)
+
+    except BaseException:
+        os.remove(temp_filename)
+        raise
+
+
+class CompiledWords:
+    """
+    A read only sequence of the words in a compiled dictionary, backed by a
+    memory mapped file.
+
+    Indexing returns a new string each time, slicing returns a list of strings.
+
+    Attributes:
+        filename (str):
+            The name of the compiled dictionary.
+        bands (dict[int, tuple[int, int]]):
+            The length band table, mapping each word length to the
+            (start, end) slice of the words of that length.
+        max_len (int):
+            The length of the largest word.
+        checksum (int):
+            The CRC-32 of the words stored in the header, see `verify`.
+    """
+
+    def __init__(self, filename: str):
+        """
+        Memory maps a compiled dictionary.
+
+        Args:
+            filename (str):
+                The name of the compiled dictionary.
+
+        Raises:
+            ValueError:
+                If the file is not a compiled dictionary or was written by an
+                incompatible version.
+        """
+        self.filename = filename
+
+        with open(filename, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        word_count, max_len, band_count, checksum = _unpack_header(self._mmap, filename)
+
+        self.max_len = max_len
+        self.checksum = checksum
+        self.bands = _unpack_bands(self._mmap, band_count, HEADER.size)
+
+        position = HEADER.size + band_count * BAND.size
+        offsets_size = (word_count + 1) * 4
+
+        if sys.byteorder == 'little':
+            self._offsets = memoryview(self._mmap)[position:position + offsets_size].cast('I')
+        else:
+            self._offsets = array('I', self._mmap[position:position + offsets_size])
+            self._offsets.byteswap()
+
+        self._blob_start = position + offsets_size
+        self._len = word_count
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __getitem__(self, index: int | slice) -> str | list[str]:
+        if isinstance(index, slice):
+            return self._slice(*index.indices(self._len))
+
+        if index < 0:
+            index += self._len
+
+        if not 0 <= index < self._len:
+            raise IndexError("CompiledWords index out of range")
+
+        return self.word_bytes(index).decode()
+
+    def __iter__(self) -> Iterator[str]:
+        for start, end in sorted(self.bands.values()):
+            yield from self._slice(start, end, 1)
+
+    def __repr__(self) -> str:
+        return f"CompiledWords({self.filename!r}, words={self._len})"
+
+    def metadata(self) -> Metadata:
+        """
+        Returns the metadata from the header, see `read_metadata`.
+
+        Returns:
+            Metadata
+        """
+        return Metadata(self._len, self.max_len, _length_counts(self.bands), self.checksum)
+
+    def verify(self) -> bool:
+        """
+        Checks the words against the checksum in the header, e.g. to detect a
+        corrupt or truncated file. Reads the whole file.
+
+        Returns:
+            bool:
+                True if the checksum matches.
+        """
+        offsets_start = HEADER.size + len(self.bands) * BAND.size
+        blob_end = self._blob_start + self._offsets[self._len]
+
+        if blob_end > len(self._mmap):
+            return False
+
+        checksum = zlib.crc32(self._mmap[offsets_start:self._blob_start])
+
+        return zlib.crc32(self._mmap[self._blob_start:blob_end], checksum) == self.checksum
+
+    def word_bytes(self, index: int) -> bytes:
+        """
+        Returns the encoded bytes of a word without decoding it.
+
+        Args:
+            index (int):
+                The position of the word.
+
+        Returns:
+            bytes
+        """
+        return self._mmap[self._blob_start + self._offsets[index]:self._blob_start + self._offsets[index + 1]]
+
+    def band_bytes(self, length: int) -> memoryview:
+        """
+        Returns a zero copy view of the encoded words of a certain length. For
+        ascii words this is `length` bytes per word, one after another.
+
+        Args:
+            length (int):
+                The number of letters in the words.
+
+        Returns:
+            memoryview
+        """
+        start, end = self.bands.get(length, (0, 0))
+        a, b = self._blob_start + self._offsets[start], self._blob_start + self._offsets[end]
+
+        return memoryview(self._mmap)[a:b]
+
+    def _slice(self, start: int, stop: int, step: int) -> list[str]:
+        """
+        Decodes a range of words. A contiguous range is decoded in one go.
+        """
+        if step != 1:
+            return [self[i] for i in range(start, stop, step)]
+
+        if start >= stop:
+            return []
+
+        base = self._offsets[start]
+        raw = self._mmap[self._blob_start + base:self._blob_start + self._offsets[stop]]
+        text = raw.decode()
+
+        # Not ascii, byte offsets can't be used to cut up the text
+        if len(text) != len(raw):
+            return [self[i] for i in range(start, stop)]
+
+        offsets = self._offsets[start:stop + 1].tolist()
+
+        return [text[a - base:b - base] for a, b in zip(offsets, offsets[1:])]
+
+    def close(self) -> None:
+        """
+        Releases the memory map. The object can't be used afterwards.
+        """
+        if isinstance(self._offsets, memoryview):
+            self._offsets.release()
+
+        self._mmap.close()
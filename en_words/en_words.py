@@ -16,47 +16,159 @@
 #
 #-------------------------------------------------------------------------------
 
+import heapq
 import os
-
-from en_words.letters import VOWELS, CONSONANTS
+import tempfile
+import time
+
+from array import array
+from bisect import bisect_left
+from collections import Counter
+from contextlib import ExitStack
+from itertools import islice, product
+from operator import le
+from collections.abc import Iterable, Iterator
+from typing import Self
+
+from en_words.bitsets import PositionalIndex, bit_positions
+from en_words.compiled import (
+    CompiledWords, 
+    _replace, 
+    compiled_filename, 
+    index_filename, 
+    is_stale, 
+    read_index, 
+    write_compiled, 
+    write_index)
+from en_words.letters import VOWELS, CONSONANTS, OTHER_CHARACTER_BIT, letter_counts, letter_mask
+from en_words.spelling import MAX_DISTANCE, DeletionIndex, edit_distance
+from en_words.trie import Trie
 
 # region Globals
 
 _PATH = os.path.dirname(__file__)
 _NAME = 'en_words'
 
-_FILENAME = _PATH + "\\" + _NAME + ".txt"
-_FILENAME_SORTED = _PATH + "\\" + _NAME + "_sorted.txt"
+_FILENAME = os.path.join(_PATH, _NAME + ".txt")
+_FILENAME_SORTED = os.path.join(_PATH, _NAME + "_sorted.txt")
 
 # Guess characters e.g. s?a_d -> salad
 MISSING_CHARACTERS = '?-_.' 
 
+# Set in a lexicon's letter masks for words that use a letter more than once
+_REPEATED_LETTER_BIT = 1 << 27
+
+# The engines a Lexicon can use to match words
+ENGINES = ('python', 'numpy', 'trie')
+
+# Lexicons that have already been loaded, keyed by their absolute filename
+_LEXICONS: dict[str, "Lexicon"] = {}
+
 #endregion
 
 #region Dictionary Functions
 
-def create_sorted_dict(filename=_FILENAME, filename_sorted=_FILENAME_SORTED):
-    """ Reads a dictionary in alphabetical order and then creates a file that is 
-        sorted by length and then alphabetically.
+def create_sorted_dict(filename: str | Iterable[str]=_FILENAME, 
+        filename_sorted: str=_FILENAME_SORTED,
+        chunk_size: int=1_000_000,
+        build_indexes: bool=True) -> None:
+    """ Reads one or more dictionaries in any order and then creates a file 
+        that is sorted by length and then alphabetically. A compiled (binary) 
+        copy of the sorted dictionary is written alongside it, see 
+        `compiled.py`, along with the indexes that `Lexicon` keeps on disk.
+
+        Words are lowercased, stripped of whitespace and duplicates removed.
+
+        The dictionaries are sorted with an external merge sort, so only 
+        `chunk_size` words are held in memory at a time. Each chunk is sorted 
+        into a temporary file and the chunks are then merged, writing the 
+        sorted and compiled dictionaries as the words are merged.
+
+        A lexicon of the file already returned by `get_lexicon` is closed, 
+        and the next call to `get_lexicon` loads the new dictionary.
 
     Args:
-        filename:
-            The name of the file containing the dictionary.
-        filename_sorted:
+        filename (str | Iterable[str]):
+            The name of the file containing the dictionary, or several files 
+            to merge into one dictionary.
+        filename_sorted (str):
             The name of the file to create containing the sorted dictionary.
+        chunk_size (int):
+            The number of words sorted in memory at a time.
+        build_indexes (bool):
+            Also build the indexes that `Lexicon` keeps on disk (e.g. the 
+            anagram index and trie), so the first lexicon loaded doesn't have 
+            to.
+
+    Raises:
+        ValueError:
+            If chunk_size is less than 1.
 
     Returns:
         None.
     """
-    lines = None
-
-    with open(filename) as f:
-        lines = f.readlines()
-        lines.sort(key=lambda item: (len(item), item)) # length then alphabetical
-    
-    with open(filename_sorted, 'w+') as f:
-        for line in lines:
-            f.write(line.lower())
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be at least 1: {chunk_size}")
+
+    filenames = [filename] if isinstance(filename, str) else list(filename)
+    directory = os.path.dirname(os.path.abspath(filename_sorted))
+
+    # Any lexicon already loaded from this file is about to be out of date, 
+    # and its compiled dictionary must be unmapped before it can be replaced
+    if (lexicon := _LEXICONS.pop(os.path.abspath(filename_sorted), None)) is not None:
+        try:
+            lexicon.close()
+        except BufferError:
+            # A view of it is still held elsewhere, it's unmapped once freed
+            pass
+
+    with tempfile.TemporaryDirectory(dir=directory) as temp_directory:
+        runs = []
+        words = _read_words(filenames)
+
+        while chunk := set(islice(words, chunk_size)):
+            runs.append(os.path.join(temp_directory, f"{len(runs)}.txt"))
+
+            with open(runs[-1], 'w') as f:
+                f.writelines(f"{word}\n" for word in sorted(chunk, key=_sort_key))
+
+        with ExitStack() as stack:
+            runs = [(line.rstrip('\n') for line in stack.enter_context(open(run))) for run in runs]
+            merged = _unique(heapq.merge(*runs, key=_sort_key))
+
+            write_compiled(_write_sorted(merged, filename_sorted), compiled_filename(filename_sorted))
+
+    if build_indexes:
+        get_lexicon(filename_sorted).build_indexes()
+
+def _read_words(filenames: list[str]) -> Iterator[str]:
+    """ Reads the words of dictionaries one line at a time, lowercased. """
+    for filename in filenames:
+        with open(filename) as f:
+            for line in f:
+                if word := line.strip().lower():
+                    yield word
+
+def _unique(words: Iterable[str]) -> Iterator[str]:
+    """ Removes consecutive duplicates from sorted words. """
+    previous = None
+
+    for word in words:
+        if word != previous:
+            yield word
+            previous = word
+
+def _write_sorted(words: Iterable[str], filename_sorted: str) -> Iterator[str]:
+    """ 
+    Writes words to the sorted dictionary as they are passed on. The file is 
+    moved into place once every word has been written, i.e. before anything 
+    that consumes the words (the compiled dictionary) is written, so that it 
+    isn't older than the sorted dictionary.
+    """
+    with _replace(filename_sorted) as f:
+        for word in words:
+            f.write(f"{word}\n".encode())
+            yield word
 
 def unsorted_words(filename: str=_FILENAME) -> list[str]:
     """ 
@@ -122,7 +234,7 @@ def sorted_words_gen(filename_sorted: str=_FILENAME_SORTED):
         for line in f:
             yield line.lower().strip()
 
-def word_count(filename=_FILENAME):
+def word_count(filename=_FILENAME_SORTED):
     """ Returns the number of words in the dictionary.
 
     Args:
@@ -132,14 +244,9 @@ def word_count(filename=_FILENAME):
     Returns:
         A int.
     """
-    counter = 0
+    return get_lexicon(filename).word_count()
 
-    for word in sorted_words_gen(filename):
-        counter += 1
-
-    return counter
-
-def find_largest_word(filename=_FILENAME):
+def find_largest_word(filename=_FILENAME_SORTED):
     """ Returns the largest word in the dictionary. If there is no largest word, 
         the first word of largest length is returned.
 
@@ -150,13 +257,21 @@ def find_largest_word(filename=_FILENAME):
     Returns:
         A string.
     """
-    max_word = ""
+    return get_lexicon(filename).find_largest_word()
 
-    for word in unsorted_words_gen(filename):
-        if len(word) > len(max_word):
-            max_word = word
+def length_histogram(filename_sorted: str=_FILENAME_SORTED) -> dict[int, int]:
+    """ 
+    Returns how many words there are of each length.
 
-    return max_word.lower()
+    Args:
+        filename_sorted (str):
+            The name of the file containing the sorted dictionary.
+
+    Returns:
+        dict[int, int]:
+            The number of words of each length, in order of length.
+    """
+    return get_lexicon(filename_sorted).length_histogram()
 
 # endregion
 
@@ -175,21 +290,7 @@ def words_of_length(length: int=3, filename_sorted: str=_FILENAME_SORTED) -> lis
     Returns:
         list[str]
     """
-    if length < 0:
-        return []
- 
-    words = []
-
-    for word in sorted_words_gen(filename_sorted):
-        letter_count = len(word)
-
-        if letter_count > length:
-            break
-
-        elif letter_count == length:
-            words.append(word.lower())
-
-    return words
+    return get_lexicon(filename_sorted).words_of_length(length)
 
 def words_of_length_gen(length: int=3, filename_sorted: str=_FILENAME_SORTED):
     """ 
@@ -204,17 +305,7 @@ def words_of_length_gen(length: int=3, filename_sorted: str=_FILENAME_SORTED):
     Returns:
         Generator
     """    
-    if length < 0:
-        return []
-
-    for word in sorted_words_gen(filename_sorted):
-        letter_count = len(word)
-
-        if letter_count > length:
-            break
-
-        elif letter_count == length:
-            yield word.lower()
+    return get_lexicon(filename_sorted).words_of_length_gen(length)
  
 def is_potential_match(partial_word, potential_word, ignore_letters='', required_letters=''):
     """ Compares two words to check if the words are a potential match. Returns 
@@ -277,16 +368,7 @@ def potential_words(partial_word, ignore_letters='', required_letters='', filena
     Returns:
         A list of words.
     """ 
-    partial_word = partial_word.lower()
-    ignore_letters, required_letters = ignore_letters.lower(), required_letters.lower()
-    
-    words = []
-
-    for potential_word in words_of_length_gen(len(partial_word), filename_sorted):
-        if is_potential_match(partial_word, potential_word, ignore_letters, required_letters):
-            words.append(potential_word.lower())
-
-    return words
+    return get_lexicon(filename_sorted).potential_words(partial_word, ignore_letters, required_letters)
 
 def letters_in_word(letters, word, remove_doubles=False):
     """ Checks that letters are in a word.
@@ -303,20 +385,18 @@ def letters_in_word(letters, word, remove_doubles=False):
         A bool.
     """ 
 
+    word_letters = set(word)
+
     # Words with unique characters
     if remove_doubles:
-        if len(set(word)) != len(word):
+        if len(word_letters) != len(word):
             return False
 
-    for letter in word:
-        if letter not in letters:
-            return False
-        
-    return True
+    return word_letters.issubset(letters)
 
 def words_from_letters(letters: str, 
         min_len: int=3,
-        max_len: int=6,
+        max_len: int | None=6,
         remove_doubles: bool=False,
         filename_sorted: str=_FILENAME_SORTED) -> list[str]:
     """ 
@@ -324,7 +404,8 @@ def words_from_letters(letters: str,
 
     Unlike an anagram search, each letter may be used any number of times.
     A word is considered valid if it contains only characters from `letters` and 
-    its length is between `min_len` and `max_len` (inclusive).
+    its length is between `min_len` and `max_len` (inclusive). A `max_len` of 
+    None places no upper limit on the word length.
 
     Remove doubles can be set so that only words with unique letters are returned.
 
@@ -333,42 +414,55 @@ def words_from_letters(letters: str,
             A string of letters used in a word.
         min_len (int):
             The minimum word length.
-        max_len (int):
-            The maximum word length.
+        max_len (int | None):
+            The maximum word length, or None for no maximum.
         remove_doubles (bool):
             Allow for or against double letters.
         filename_sorted (str):
             The name of the file containing the sorted dictionary.
 
+    Raises:
+        ValueError:
+            If `min_len` or `max_len` are less than 1, or `min_len` is bigger 
+            than `max_len`.
+
     Returns:
         list[str]:
             A list containing all the matching words.
     """ 
-    if min_len <= 0:
-        raise ValueError(f"min_len cannot be less than 1: {min_len}")
-
-    if max_len <= 0:
-        raise ValueError(f"max_len cannot be less than 1: {max_len}")
+    return get_lexicon(filename_sorted).words_from_letters(letters, min_len, max_len, remove_doubles)
 
-    if min_len > max_len:
-        raise ValueError(f"max_len cannot be bigger than min_len: {max_len} > {min_len}")
-
-
-    letters = letters.lower()    
-    words = []
+def words_from_rack(letters: str, 
+        min_len: int=1, 
+        max_len: int | None=None, 
+        filename_sorted: str=_FILENAME_SORTED) -> list[str]:
+    """ 
+    Return all words that can be formed from a rack of letters.
 
-    for word in sorted_words_gen(filename_sorted):
-        if len(word) < min_len:
-            continue
+    Unlike `words_from_letters`, each letter can only be used as many times as
+    it appears in `letters`, like the tiles in Scrabble or the letters in 
+    Countdown.
 
-        else:
-            if len(word) > max_len:
-                break
+    Args:
+        letters (str):
+            The letters in the rack.
+        min_len (int):
+            The minimum word length.
+        max_len (int | None):
+            The maximum word length, or None for no maximum.
+        filename_sorted (str):
+            The name of the file containing the sorted dictionary.
 
-        if letters_in_word(letters, word, remove_doubles):
-            words.append(word.lower())
+    Raises:
+        ValueError:
+            If `min_len` or `max_len` are less than 1, or `min_len` is bigger 
+            than `max_len`.
 
-    return(words)
+    Returns:
+        list[str]:
+            A list containing all the matching words.
+    """ 
+    return get_lexicon(filename_sorted).words_from_rack(letters, min_len, max_len)
 
 def vowel_count(word: str) -> int:
     """
@@ -412,8 +506,22 @@ def anagrams(word: str, filename_sorted: str = _FILENAME_SORTED) -> list[str]:
         list[str]:
             A list of all the anagrams found.
     """ 
-    return [_ for _ in anagrams_gen(word, filename_sorted)]
+    return get_lexicon(filename_sorted).anagrams(word)
+
+
+def anagram_signature(word: str) -> str:
+    """ 
+    Returns the letters of a word in alphabetical order. Words are anagrams of
+    each other if they have the same signature. E.g. 'stop' -> 'opst'
+
+    Args:
+        word (str):
+            The word, in lowercase.
 
+    Returns:
+        str
+    """
+    return ''.join(sorted(word))
 
 def anagrams_gen(word: str, filename_sorted: str = _FILENAME_SORTED):
     """ 
@@ -428,10 +536,1293 @@ def anagrams_gen(word: str, filename_sorted: str = _FILENAME_SORTED):
     Returns:
         Generator:
     """ 
-    word = word.lower()
+    return get_lexicon(filename_sorted).anagrams_gen(word)
+
+def phrase_anagrams(text: str, 
+        max_words: int=3, 
+        min_word_len: int=3, 
+        limit: int | None=None, 
+        timeout: float | None=None, 
+        filename_sorted: str=_FILENAME_SORTED) -> Iterator[tuple[str, ...]]:
+    """ 
+    Finds phrases of one or more words that are anagrams of some text. See 
+    `Lexicon.phrase_anagrams`.
+
+    Args:
+        text (str):
+            The letters to use. Any case.
+        max_words (int):
+            The maximum number of words in a phrase.
+        min_word_len (int):
+            The minimum length of each word.
+        limit (int | None):
+            The maximum number of phrases to find, None for all of them.
+        timeout (float | None):
+            Stop looking after this many seconds, None for no time limit.
+        filename_sorted (str):
+            The name of the file containing the sorted dictionary.
+
+    Returns:
+        Iterator[tuple[str, ...]]
+    """ 
+    return get_lexicon(filename_sorted).phrase_anagrams(text, max_words, min_word_len, limit, timeout)
+
+def words_with_prefix(prefix: str, 
+        limit: int | None=None, 
+        min_len: int | None=None, 
+        max_len: int | None=None, 
+        filename_sorted: str=_FILENAME_SORTED) -> Iterator[str]:
+    """ 
+    Finds the words that start with a prefix, e.g. for autocomplete. See 
+    `Lexicon.words_with_prefix`.
+
+    Args:
+        prefix (str):
+            The start of the words.
+        limit (int | None):
+            The maximum number of words to find, None for all of them.
+        min_len (int | None):
+            The minimum word length, None for no minimum.
+        max_len (int | None):
+            The maximum word length, None for no maximum.
+        filename_sorted (str):
+            The name of the file containing the sorted dictionary.
+
+    Returns:
+        Iterator[str]:
+            The words, in alphabetical order.
+    """ 
+    return get_lexicon(filename_sorted).words_with_prefix(prefix, limit, min_len, max_len)
+
+def words_with_suffix(suffix: str, 
+        limit: int | None=None, 
+        min_len: int | None=None, 
+        max_len: int | None=None, 
+        filename_sorted: str=_FILENAME_SORTED) -> Iterator[str]:
+    """ 
+    Finds the words that end with a suffix, in rhyming order. See 
+    `Lexicon.words_with_suffix`.
+
+    Args:
+        suffix (str):
+            The end of the words.
+        limit (int | None):
+            The maximum number of words to find, None for all of them.
+        min_len (int | None):
+            The minimum word length, None for no minimum.
+        max_len (int | None):
+            The maximum word length, None for no maximum.
+        filename_sorted (str):
+            The name of the file containing the sorted dictionary.
+
+    Returns:
+        Iterator[str]:
+            The words, in alphabetical order of the words spelt backwards.
+    """ 
+    return get_lexicon(filename_sorted).words_with_suffix(suffix, limit, min_len, max_len)
 
-    for _ in words_of_length_gen(len(word), filename_sorted):
-        if ''.join(sorted(_)) == ''.join(sorted(word)) and _ != word:
-            yield _
+def suggest(word: str, 
+        max_distance: int=MAX_DISTANCE, 
+        limit: int | None=None, 
+        filename_sorted: str=_FILENAME_SORTED) -> list[str]:
+    """ 
+    Suggests corrections for a misspelt word. See `Lexicon.suggest`.
 
-# endregion
\ No newline at end of file
+    Args:
+        word (str):
+            The word to correct.
+        max_distance (int):
+            The maximum number of edits, at most spelling.MAX_DISTANCE.
+        limit (int | None):
+            The maximum number of suggestions, None for all of them.
+        filename_sorted (str):
+            The name of the file containing the sorted dictionary.
+
+    Raises:
+        ValueError:
+            If max_distance is negative or more than spelling.MAX_DISTANCE.
+
+    Returns:
+        list[str]:
+            The words, closest first.
+    """ 
+    return get_lexicon(filename_sorted).suggest(word, max_distance, limit)
+
+# endregion
+
+#region Lexicon
+
+class Lexicon:
+    """
+    An in-memory dictionary that is loaded once and then queried many times.
+
+    The words are held in lowercase, sorted by length and then alphabetically, 
+    the same order as the sorted dictionary file. All of the word finder 
+    functions in this module are available as methods and the module level 
+    functions delegate to a shared lexicon (see `get_lexicon`), so the 
+    dictionary file is only read the first time it is needed.
+
+    When loaded from a file the lexicon memory maps the compiled copy of the 
+    dictionary (compiling it first if it is missing or out of date) rather 
+    than holding a list of strings, so processes share the same memory and 
+    strings are only created for the words that are looked at.
+
+    Words are found by one of three engines, which all give the same 
+    results. The 'python' engine (the default) matches partial words with 
+    positional bitsets (see `bitsets.py`) and letters with bit masks. The 
+    'numpy' engine does the same with whole array operations (see 
+    `matrices.py`) and needs numpy to be installed. The 'trie' engine 
+    searches a DAWG of the words (see `trie.py` and `Lexicon.trie`), 
+    skipping every word that starts with an impossible prefix, which suits 
+    small racks of letters.
+
+    Example:
+        >>> lexicon = Lexicon()
+        >>> lexicon.anagrams("opts")
+        ['post', 'pots', 'spot', 'stop', 'tops']
+
+    Attributes:
+        filename_sorted (str | None):
+            The name of the file the lexicon was loaded from, None if the 
+            lexicon was created from a list of words.
+        engine (str):
+            The engine used to match words, one of ENGINES.
+    """
+
+    def __init__(self, filename_sorted: str=_FILENAME_SORTED, compiled: bool=True, engine: str='python'):
+        """
+        Loads a lexicon from a dictionary file.
+
+        The file does not have to be sorted, but loading is quicker if it is.
+
+        Args:
+            filename_sorted (str):
+                The name of the file containing the sorted dictionary.
+            compiled (bool):
+                Use the compiled copy of the dictionary, creating it if needed.
+                If the compiled copy can't be written the text file is used.
+            engine (str):
+                The engine used to match words, one of ENGINES.
+
+        Raises:
+            ValueError:
+                If the engine is unknown.
+            ImportError:
+                If the engine is 'numpy' and numpy is not installed.
+        """
+        self.filename_sorted = filename_sorted
+        self.engine = _check_engine(engine)
+        self._cache_indexes = compiled
+
+        if compiled:
+            filename_compiled = compiled_filename(filename_sorted)
+
+            if not is_stale(filename_compiled, filename_sorted):
+                try:
+                    self._load_compiled(filename_compiled)
+                    return
+
+                except ValueError:
+                    # Written by another version, build it again
+                    pass
+
+        self._load_words(sorted_words(filename_sorted))
+
+        if compiled:
+            try:
+                write_compiled(self._words, filename_compiled)
+            except OSError:
+                return
+
+            self._load_compiled(filename_compiled)
+
+    @classmethod
+    def from_words(cls, words: Iterable[str], engine: str='python') -> Self:
+        """
+        Creates a lexicon from an iterable of words rather than a file.
+
+        Args:
+            words (Iterable[str]):
+                The words in the dictionary. Any case and any order.
+            engine (str):
+                The engine used to match words, one of ENGINES.
+
+        Raises:
+            ValueError:
+                If the engine is unknown.
+            ImportError:
+                If the engine is 'numpy' and numpy is not installed.
+
+        Returns:
+            Self:
+                A new Lexicon object.
+        """
+        lexicon = cls.__new__(cls)
+        lexicon.filename_sorted = None
+        lexicon.engine = _check_engine(engine)
+        lexicon._cache_indexes = False
+        lexicon._load_words(word.strip().lower() for word in words)
+
+        return lexicon
+
+    def _load_words(self, words: Iterable[str]) -> None:
+        """
+        Stores the words sorted by length and then alphabetically.
+
+        Args:
+            words (Iterable[str]):
+                Lowercase words in any order.
+        """
+        self._words = [word for word in words if word]
+        self._words.sort(key=_sort_key)
+        self._bands = _length_bands(self._words)
+        self._indexes = {}
+
+    def _load_compiled(self, filename_compiled: str) -> None:
+        """
+        Memory maps the words of a compiled dictionary.
+
+        Args:
+            filename_compiled (str):
+                The name of the compiled dictionary.
+        """
+        self._words = CompiledWords(filename_compiled)
+        self._bands = self._words.bands
+        self._indexes = {}
+
+    def close(self) -> None:
+        """
+        Releases the memory map of a lexicon loaded from a compiled
+        dictionary, so the file can be replaced (Windows won't replace a file
+        that is mapped). The lexicon can't be used afterwards.
+        """
+        # Drop the indexes first, some (e.g. word matrices) are views of the 
+        # memory map
+        self._indexes = {}
+
+        if isinstance(self._words, CompiledWords):
+            self._words.close()
+
+    def _index(self, name: str, build, persist: bool=True):
+        """
+        Returns an index of the lexicon, building it the first time it is 
+        asked for. 
+        
+        Lexicons loaded from a compiled dictionary keep their indexes on disk 
+        next to it, so an index is only built once per dictionary rather than 
+        once per process. An index is rebuilt if the file is older than the
+        dictionary or was built from a dictionary with a different checksum.
+
+        Args:
+            name (str):
+                The name of the index.
+            build (Callable[[], Any]):
+                Builds the index.
+            persist (bool):
+                Keep the index on disk. Indexes that are quick to build are 
+                only kept in memory.
+
+        Returns:
+            Any
+        """
+        if name in self._indexes:
+            return self._indexes[name]
+
+        index = None
+        persist = persist and self._cache_indexes
+
+        if persist:
+            filename_index = index_filename(self.filename_sorted, name)
+            checksum = self._words.checksum if isinstance(self._words, CompiledWords) else None
+
+            if not is_stale(filename_index, self.filename_sorted):
+                index = read_index(filename_index, name, checksum)
+
+        if index is None:
+            index = build()
+
+            if persist:
+                try:
+                    write_index(index, filename_index, name, checksum)
+                except OSError:
+                    pass
+
+        self._indexes[name] = index
+
+        return index
+
+    def _anagram_index(self) -> dict[str, list[int]]:
+        """
+        Returns the anagram index, mapping the anagram signature of every word 
+        (see `anagram_signature`) to the positions of the words with that 
+        signature.
+
+        Returns:
+            dict[str, list[int]]
+        """
+        def build():
+            index = {}
+
+            for i, word in enumerate(self._words):
+                index.setdefault(anagram_signature(word), []).append(i)
+
+            return index
+
+        return self._index('anagrams', build)
+
+    def cached(self, name: str, build):
+        """
+        Returns a value derived from the words of the lexicon, e.g. a lookup 
+        table used by a word game, building it the first time it is asked for.
+
+        The value is kept in memory with the lexicon's own indexes, so it lives
+        as long as the lexicon does and is dropped when the dictionary is 
+        rebuilt (see `create_sorted_dict`) and the lexicon reloaded.
+
+        Example:
+            >>> lexicon.cached('nine_letter_words', lambda: lexicon.words_of_length(9))
+
+        Args:
+            name (str):
+                A name for the value, unique among the values cached on the 
+                lexicon.
+            build (Callable[[], Any]):
+                Builds the value from the lexicon.
+
+        Returns:
+            Any
+        """
+        return self._index(f'cached_{name}', build, persist=False)
+
+    def build_indexes(self) -> None:
+        """
+        Builds every index that is kept on disk, if it hasn't been built 
+        already. Otherwise each index is built the first time it is used.
+
+        The deletion index for spelling suggestions (see `suggest`) is left 
+        out on purpose. It takes several seconds to build and about 40MB on 
+        disk for the full dictionary, so it is only built if it is used.
+        """
+        self._anagram_index()
+        self._letter_masks()
+        self._letter_counts()
+        self.letter_set_index()
+        self._alphabetical_order()
+        self._reversed_order()
+        _ = self.trie
+
+    def letter_set_index(self) -> dict[int, list[int]]:
+        """
+        Returns the letter set index, mapping the set of letters used by every 
+        word as a letter mask (see `letters.letter_mask`) to the positions of 
+        the words that use exactly those letters, in sorted order. Words with 
+        other characters (e.g. apostrophes) are left out.
+
+        E.g. 'tot', 'toot' and 'otto' all use the letters {o, t}.
+
+        Returns:
+            dict[int, list[int]]
+        """
+        def build():
+            index = {}
+
+            for i, mask in enumerate(self._letter_masks()):
+                if not mask & OTHER_CHARACTER_BIT:
+                    index.setdefault(mask & ~_REPEATED_LETTER_BIT, []).append(i)
+
+            return index
+
+        return self._index('letter_sets', build)
+
+    def positional_index(self, length: int) -> PositionalIndex:
+        """
+        Returns the positional bitset index of the words of a certain length, 
+        built the first time that length is asked for. Bit i of the bitsets 
+        is the i-th word of the length band, i.e. words_of_length(length)[i].
+
+        Args:
+            length (int):
+                The number of letters in the words.
+
+        Returns:
+            PositionalIndex
+        """
+        return self._index(f'positions_{length}', lambda: PositionalIndex(self.words_of_length(length)), persist=False)
+
+    def wildcard_index(self, length: int) -> dict[str, list[int]]:
+        """
+        Returns the wildcard index of the words of a certain length, built the
+        first time that length is asked for. Every word is put in a bucket for
+        each of its letters with that letter replaced by MISSING_CHARACTERS[0],
+        so the words in a bucket differ from each other by a single letter.
+        Words with other characters (e.g. apostrophes) are left out.
+
+        E.g. 'cat', 'cot' and 'cut' are all in the bucket 'c?t'.
+
+        Args:
+            length (int):
+                The number of letters in the words.
+
+        Returns:
+            dict[str, list[int]]:
+                The positions of the words in each bucket, where position i
+                is words_of_length(length)[i].
+        """
+        def build():
+            index = {}
+            wildcard = MISSING_CHARACTERS[0]
+
+            for i, word in enumerate(self.words_of_length(length)):
+                if not word.isalpha():
+                    continue
+
+                for position in range(length):
+                    index.setdefault(word[:position] + wildcard + word[position + 1:], []).append(i)
+
+            return index
+
+        return self._index(f'wildcards_{length}', build, persist=False)
+
+    @property
+    def trie(self) -> Trie:
+        """
+        The words of the lexicon as a minimised trie (DAWG), built the first 
+        time it is used. Lexicons loaded from a dictionary file keep it on disk 
+        next to the compiled dictionary.
+
+        Returns:
+            Trie
+        """
+        return self._index('trie', lambda: Trie(self._words))
+
+    def _letter_masks(self) -> array:
+        """
+        Returns the letter mask (see `letters.letter_mask`) of every word, in 
+        the same order as the words. Words that use a letter more than once 
+        also have _REPEATED_LETTER_BIT set.
+
+        Returns:
+            array:
+                An array of unsigned ints.
+        """
+        def build():
+            masks = array('I')
+
+            for word in self._words:
+                mask = letter_mask(word)
+
+                if len(set(word)) != len(word):
+                    mask |= _REPEATED_LETTER_BIT
+
+                masks.append(mask)
+
+            return masks
+
+        return self._index('letter_masks', build)
+
+    def _letter_counts(self) -> bytearray:
+        """
+        Returns how many times each letter of the alphabet is used in every 
+        word (see `letters.letter_counts`), 26 counts per word in the same 
+        order as the words. Can be viewed as an (n_words, 26) matrix.
+
+        Returns:
+            bytearray
+        """
+        def build():
+            counts = bytearray()
+
+            for word in self._words:
+                counts += letter_counts(word)
+
+            return counts
+
+        return self._index('letter_counts', build)
+
+    def _word_matrix(self, length: int):
+        """
+        Returns the words of a certain length as a numpy matrix, built the 
+        first time that length is asked for. Row i is the i-th word of the 
+        length band. A compiled dictionary's band is used without copying.
+
+        Args:
+            length (int):
+                The number of letters in the words.
+
+        Returns:
+            numpy.ndarray
+        """
+        from en_words.matrices import bytes_matrix, word_matrix
+
+        def build():
+            if isinstance(self._words, CompiledWords):
+                data = self._words.band_bytes(length)
+                start, end = self._band(length)
+
+                # Every word in the band is ascii, so the band is the matrix
+                if len(data) == (end - start) * length:
+                    return bytes_matrix(data, length)
+
+            return word_matrix(self.words_of_length(length), length)
+
+        return self._index(f'matrix_{length}', build, persist=False)
+
+    def _potential_ids(self, partial_word: str, ignore_letters: str, required_letters: str) -> Iterable[int]:
+        """
+        Returns the positions, within its length band, of the words that are a 
+        potential match for a partial word, using the lexicon's engine.
+
+        Args:
+            partial_word (str):
+                A lowercase word with letters missing.
+            ignore_letters (str):
+                A lowercase string of letters not needed.
+            required_letters (str):
+                A lowercase string of letters that are required.
+
+        Returns:
+            Iterable[int]
+        """
+        length = len(partial_word)
+
+        if self.engine == 'numpy':
+            from en_words.matrices import match_mask
+
+            mask = match_mask(self._word_matrix(length), partial_word, ignore_letters, required_letters, MISSING_CHARACTERS)
+            return mask.nonzero()[0].tolist()
+
+        index = self.positional_index(length)
+
+        return bit_positions(index.matches(partial_word, ignore_letters, required_letters, MISSING_CHARACTERS))
+
+    def _band(self, length: int) -> tuple[int, int]:
+        """
+        Returns the (start, end) slice of the words of a certain length. The 
+        slice is empty if there are no words of that length.
+
+        Args:
+            length (int):
+                The number of letters in the words.
+
+        Returns:
+            tuple[int, int]
+        """
+        return self._bands.get(length, (0, 0))
+
+    def _span(self, min_len: int, max_len: int | None) -> tuple[int, int]:
+        """
+        Returns the (start, end) slice of the words whose length is between 
+        `min_len` and `max_len` (inclusive). 
+
+        Args:
+            min_len (int):
+                The minimum word length.
+            max_len (int | None):
+                The maximum word length, or None for no maximum.
+
+        Returns:
+            tuple[int, int]
+        """
+        lengths = [length for length in self._bands 
+                   if length >= min_len and (max_len is None or length <= max_len)]
+
+        if not lengths:
+            return (0, 0)
+
+        return (self._bands[min(lengths)][0], self._bands[max(lengths)][1])
+
+    def __len__(self) -> int:
+        return len(self._words)
+
+    def __getitem__(self, index: int | slice) -> str | list[str]:
+        return self._words[index]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._words)
+
+    def __contains__(self, word: str) -> bool:
+        word = word.lower()
+        start, end = self._band(len(word))
+        i = bisect_left(self._words, word, start, end)
+
+        return i < end and self._words[i] == word
+
+    def __repr__(self) -> str:
+        return f"Lexicon({self.filename_sorted!r}, words={len(self)}, engine={self.engine!r})"
+
+    def sorted_words(self) -> list[str]:
+        """ 
+        Returns a list of all the words sorted by length and then 
+        alphabetically.
+
+        Returns:
+            list[str]:
+                A new list of lowercase words.
+        """
+        return list(self._words)
+
+    def word_count(self) -> int:
+        """ 
+        Returns the number of words in the lexicon.
+
+        Returns:
+            int
+        """
+        return len(self._words)
+
+    def find_largest_word(self) -> str:
+        """ 
+        Returns the largest word in the lexicon. If there is no largest word,
+        the first word (alphabetically) of largest length is returned.
+
+        Returns:
+            str:
+                The largest word, or an empty string if the lexicon is empty.
+        """
+        if not self._words:
+            return ""
+
+        return self._words[self._band(max(self._bands))[0]]
+
+    def length_histogram(self) -> dict[int, int]:
+        """ 
+        Returns how many words there are of each length. Read from the length 
+        band table, so it doesn't look at the words.
+
+        Returns:
+            dict[int, int]:
+                The number of words of each length, in order of length.
+        """
+        return {length: end - start for length, (start, end) in sorted(self._bands.items())}
+
+    def words_of_length(self, length: int=3) -> list[str]:
+        """ 
+        Returns a list of all words of a certain length.
+
+        Args:
+            length (int):
+                The number of letters in the words to find.
+
+        Returns:
+            list[str]
+        """
+        return list(self.words_of_length_gen(length))
+
+    def words_of_length_gen(self, length: int=3):
+        """ 
+        Returns a generator for finding all words of a certain length.
+
+        Args:
+            length (int):
+                The number of letters in the words to find.
+
+        Returns:
+            Generator
+        """
+        start, end = self._band(length)
+
+        for i in range(start, end):
+            yield self._words[i]
+
+    def potential_words(self, partial_word: str, ignore_letters: str='', required_letters: str='') -> list[str]:
+        """ 
+        Compares a partial word against the words in the lexicon. Returns a 
+        list of all potential matches. See `is_potential_match`.
+
+        Args:
+            partial_word (str):
+                A word with letters missing (represented by MISSING_CHARACTERS 
+                global variable).
+            ignore_letters (str):
+                A string of letters not needed.
+            required_letters (str):
+                A string of letters that are required.
+
+        Returns:
+            list[str]
+        """
+        partial_word = partial_word.lower()
+        ignore_letters, required_letters = ignore_letters.lower(), required_letters.lower()
+
+        start, end = self._band(len(partial_word))
+
+        if start == end:
+            return []
+
+        if self.engine == 'trie':
+            return self.trie.potential_words(partial_word, ignore_letters, required_letters, MISSING_CHARACTERS)
+
+        return [self._words[start + i] for i in self._potential_ids(partial_word, ignore_letters, required_letters)]
+
+    def words_from_letters(self, 
+            letters: str, 
+            min_len: int=3, 
+            max_len: int | None=6, 
+            remove_doubles: bool=False) -> list[str]:
+        """ 
+        Return all words that can be formed using the supplied letters. Each 
+        letter may be used any number of times. See `words_from_letters`.
+
+        Args:
+            letters (str):
+                A string of letters used in a word.
+            min_len (int):
+                The minimum word length.
+            max_len (int | None):
+                The maximum word length, or None for no maximum.
+            remove_doubles (bool):
+                Allow for or against double letters.
+
+        Raises:
+            ValueError:
+                If `min_len` or `max_len` are less than 1, or `min_len` is 
+                bigger than `max_len`.
+
+        Returns:
+            list[str]:
+                A list containing all the matching words.
+        """
+        _check_lengths(min_len, max_len)
+
+        letters = letters.lower()
+
+        if self.engine == 'trie':
+            return sorted(self.trie.words_from_letters(letters, min_len, max_len, remove_doubles), key=len)
+
+        return [self._words[i] for i in self._ids_from_letters(letters, min_len, max_len, remove_doubles)]
+
+    def words_from_rack(self, letters: str, min_len: int=1, max_len: int | None=None) -> list[str]:
+        """ 
+        Return all words that can be formed from a rack of letters. Unlike 
+        `words_from_letters` each letter can only be used as many times as it 
+        appears in `letters`. E.g. 'tees' can be made from 'steel' but not from 
+        'stel'. 
+
+        Args:
+            letters (str):
+                The letters in the rack.
+            min_len (int):
+                The minimum word length.
+            max_len (int | None):
+                The maximum word length, or None for no maximum.
+
+        Raises:
+            ValueError:
+                If `min_len` or `max_len` are less than 1, or `min_len` is 
+                bigger than `max_len`.
+
+        Returns:
+            list[str]:
+                A list containing all the matching words.
+        """
+        _check_lengths(min_len, max_len)
+
+        letters = letters.lower()
+
+        if self.engine == 'trie':
+            return sorted(self.trie.words_from_rack(letters, min_len, max_len), key=len)
+
+        ids = self._ids_from_letters(letters, min_len, max_len, False)
+
+        rack = letter_counts(letters)
+        counts = self._letter_counts()
+
+        if self.engine == 'numpy':
+            from en_words.matrices import counts_within
+
+            ids = counts_within(counts, rack, ids)
+        else:
+            ids = [i for i in ids if all(map(le, counts[i * 26:(i + 1) * 26], rack))]
+
+        # The counts are only of letters, check anything else properly
+        masks = self._letter_masks()
+        letters_counter = Counter(letters)
+
+        return [self._words[i] for i in ids 
+                if not masks[i] & OTHER_CHARACTER_BIT or Counter(self._words[i]) <= letters_counter]
+
+    def _ids_from_letters(self, letters: str, min_len: int, max_len: int | None, remove_doubles: bool) -> list[int]:
+        """
+        Returns the positions of the words that can be formed using the 
+        supplied letters, see `words_from_letters`.
+
+        Args:
+            letters (str):
+                A lowercase string of letters used in a word.
+            min_len (int):
+                The minimum word length.
+            max_len (int | None):
+                The maximum word length, or None for no maximum.
+            remove_doubles (bool):
+                Allow for or against double letters.
+
+        Returns:
+            list[int]
+        """
+        start, end = self._span(min_len, max_len)
+
+        # A word can only be made if it has no letters outside of `letters`
+        disallowed = ~letter_mask(letters) & (_REPEATED_LETTER_BIT - 1)
+
+        if remove_doubles:
+            disallowed |= _REPEATED_LETTER_BIT
+
+        masks = self._letter_masks()
+
+        if self.engine == 'numpy':
+            from en_words.matrices import masks_without
+
+            ids = masks_without(masks, disallowed, start, end)
+        else:
+            ids = [i for i in range(start, end) if not masks[i] & disallowed]
+
+        # Characters that aren't letters share a bit, so those words need 
+        # checking properly
+        if not disallowed & OTHER_CHARACTER_BIT:
+            ids = [i for i in ids if not masks[i] & OTHER_CHARACTER_BIT or letters_in_word(letters, self._words[i])]
+
+        return ids
+
+    def anagrams(self, word: str) -> list[str]:
+        """ 
+        Finds a list of words that are anagrams of a word.
+
+        Args:
+            word (str):
+                A string of letters to find anagrams for.
+
+        Returns:
+            list[str]:
+                A list of all the anagrams found.
+        """
+        return list(self.anagrams_gen(word))
+
+    def anagrams_gen(self, word: str):
+        """ 
+        Finds the words that are anagrams of a word and returns a generator.
+
+        Args:
+            word (str):
+                A string of letters to find anagrams for.
+
+        Returns:
+            Generator
+        """
+        word = word.lower()
+
+        for i in self._anagram_index().get(anagram_signature(word), []):
+            anagram = self._words[i]
+
+            if anagram != word:
+                yield anagram
+
+    def phrase_anagrams(self, 
+            text: str, 
+            max_words: int=3, 
+            min_word_len: int=3, 
+            limit: int | None=None, 
+            timeout: float | None=None) -> Iterator[tuple[str, ...]]:
+        """ 
+        Finds phrases that are anagrams of some text, i.e. that use exactly 
+        the same letters. E.g. 'dormitory' -> ('dirty', 'room')
+
+        Only the letters of the text are used, spaces and punctuation are 
+        ignored. Each phrase is found once, not in every order of its words.
+
+        The words that fit the letters are grouped by anagram signature, then 
+        the search picks groups in a fixed order, only keeping those that fit 
+        the letters still left. Letter counts are packed into an int with a 
+        byte per letter so checking a group fits is a single subtraction. 
+        Letters left over that are known to lead nowhere are remembered, so 
+        they are not searched again.
+
+        Example:
+            >>> next(lexicon.phrase_anagrams('clint eastwood'))
+            ('anecdotist', 'low')
+
+        Args:
+            text (str):
+                The letters to use. Any case.
+            max_words (int):
+                The maximum number of words in a phrase.
+            min_word_len (int):
+                The minimum length of each word.
+            limit (int | None):
+                The maximum number of phrases to find, None for all of them.
+            timeout (float | None):
+                Stop looking after this many seconds, None to search until 
+                every phrase is found.
+
+        Raises:
+            ValueError:
+                If `max_words` or `min_word_len` are less than 1, or the text 
+                uses a letter more than 127 times.
+
+        Returns:
+            Iterator[tuple[str, ...]]:
+                The phrases, as they are found. Longer words come first.
+        """
+        if max_words < 1 or min_word_len < 1:
+            raise ValueError(f"max_words and min_word_len must be at least 1: {max_words}, {min_word_len}")
+
+        letters = ''.join(c for c in text.lower() if 'a' <= c <= 'z')
+        counts = letter_counts(letters)
+
+        if max(counts) > 127:
+            raise ValueError(f"Letters can't be used more than 127 times: '{text}'")
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        original = tuple(sorted(text.lower().split()))
+
+        return islice(self._phrase_anagrams(letters, counts, max_words, min_word_len, deadline, original), limit)
+
+    def _phrase_anagrams(self, 
+            letters: str, 
+            counts: bytes, 
+            max_words: int, 
+            min_word_len: int, 
+            deadline: float | None, 
+            original: tuple[str, ...]) -> Iterator[tuple[str, ...]]:
+        """
+        The search behind `phrase_anagrams`.
+        """
+        if not letters:
+            return
+
+        groups = {}
+
+        for word in self.words_from_rack(letters, min_len=min_word_len):
+            if word.isalpha():
+                groups.setdefault(anagram_signature(word), []).append(word)
+
+        # Longest words first, they leave the fewest letters to fill
+        signatures = sorted(groups, key=lambda signature: (-len(signature), signature))
+        packed = [int.from_bytes(letter_counts(signature), 'little') for signature in signatures]
+        lengths = [len(signature) for signature in signatures]
+
+        # Bit 7 of each letter's byte, setting it lets a byte be subtracted 
+        # from without borrowing from the next letter
+        guard = int.from_bytes(b'\x80' * 26, 'little')
+
+        dead_ends = set()
+        timed_out = False
+
+        def search(remaining: int, remaining_len: int, candidates: list[int], words_left: int) -> Iterator[tuple[int, ...]]:
+            nonlocal timed_out
+
+            for n, i in enumerate(candidates):
+                if deadline is not None and time.monotonic() > deadline:
+                    timed_out = True
+                    return
+
+                if lengths[i] == remaining_len:
+                    yield (i,)
+                    continue
+
+                left = remaining_len - lengths[i]
+
+                if words_left == 1 or left < min_word_len:
+                    continue
+
+                rest = remaining - packed[i]
+                key = (rest, i, words_left - 1)
+
+                if key in dead_ends:
+                    continue
+
+                fits = [
+                    j for j in candidates[n:] 
+                    if lengths[j] <= left and ((rest | guard) - packed[j]) & guard == guard]
+
+                # Even the longest words that fit can't use up the letters
+                if not fits or lengths[fits[0]] * (words_left - 1) < left:
+                    dead_ends.add(key)
+                    continue
+
+                found = False
+
+                for phrase in search(rest, left, fits, words_left - 1):
+                    found = True
+                    yield (i,) + phrase
+
+                if not found and not timed_out:
+                    dead_ends.add(key)
+
+        all_letters = int.from_bytes(counts, 'little')
+
+        for phrase in search(all_letters, len(letters), list(range(len(signatures))), max_words):
+            for words in product(*(groups[signatures[i]] for i in phrase)):
+                if tuple(sorted(words)) != original:
+                    yield words
+
+    def _alphabetical_order(self) -> array:
+        """
+        Returns the positions of the words in alphabetical order, i.e. 
+        self._words[order[0]] is the first word alphabetically.
+
+        Returns:
+            array:
+                An array of unsigned ints.
+        """
+        def build():
+            words = self._words[:]
+
+            return array('I', sorted(range(len(words)), key=words.__getitem__))
+
+        return self._index('alphabetical', build)
+
+    def words_with_prefix(self, 
+            prefix: str, 
+            limit: int | None=None, 
+            min_len: int | None=None, 
+            max_len: int | None=None) -> Iterator[str]:
+        """ 
+        Finds the words that start with a prefix, including the prefix itself 
+        if it is a word.
+
+        The words that share a prefix are next to each other in alphabetical 
+        order, so the first one is found with a binary search and the rest are
+        read off in order, one at a time as they are asked for.
+
+        Example:
+            >>> list(lexicon.words_with_prefix('rec', limit=3))
+            ['rec', 'recalcitrance', 'recalcitrant']
+
+        Args:
+            prefix (str):
+                The start of the words.
+            limit (int | None):
+                The maximum number of words to find, None for all of them.
+            min_len (int | None):
+                The minimum word length, None for no minimum.
+            max_len (int | None):
+                The maximum word length, None for no maximum.
+
+        Returns:
+            Iterator[str]:
+                The words, in alphabetical order.
+        """
+        prefix = prefix.lower()
+        order = self._alphabetical_order()
+        start = bisect_left(order, prefix, key=self._words.__getitem__)
+
+        return self._words_in_order(order, start, lambda word: word.startswith(prefix), limit, min_len, max_len)
+
+    def _reversed_order(self) -> array:
+        """
+        Returns the positions of the words in alphabetical order of the words
+        spelt backwards, so words with the same ending are next to each other.
+
+        Returns:
+            array:
+                An array of unsigned ints.
+        """
+        def build():
+            words = [word[::-1] for word in self._words[:]]
+
+            return array('I', sorted(range(len(words)), key=words.__getitem__))
+
+        return self._index('reversed', build)
+
+    def words_with_suffix(self, 
+            suffix: str, 
+            limit: int | None=None, 
+            min_len: int | None=None, 
+            max_len: int | None=None) -> Iterator[str]:
+        """ 
+        Finds the words that end with a suffix, including the suffix itself if 
+        it is a word. 
+
+        Works like `words_with_prefix` on the words spelt backwards, so the 
+        words come in rhyming order, sorted by their endings. 
+
+        Example:
+            >>> list(lexicon.words_with_suffix('tion', limit=3))
+            ['bibation', 'cibation', 'libation']
+
+        Args:
+            suffix (str):
+                The end of the words.
+            limit (int | None):
+                The maximum number of words to find, None for all of them.
+            min_len (int | None):
+                The minimum word length, None for no minimum.
+            max_len (int | None):
+                The maximum word length, None for no maximum.
+
+        Returns:
+            Iterator[str]:
+                The words, in alphabetical order of the words spelt backwards.
+        """
+        suffix = suffix.lower()
+        order = self._reversed_order()
+        start = bisect_left(order, suffix[::-1], key=lambda i: self._words[i][::-1])
+
+        return self._words_in_order(order, start, lambda word: word.endswith(suffix), limit, min_len, max_len)
+
+    def _words_in_order(self, 
+            order: array, 
+            start: int, 
+            matches, 
+            limit: int | None, 
+            min_len: int | None, 
+            max_len: int | None) -> Iterator[str]:
+        """
+        Reads words from an order of the words (e.g. `_alphabetical_order`), 
+        from `start` for as long as they match, skipping any outside the length 
+        bounds.
+        """
+        found = 0
+
+        for i in range(start, len(order)):
+            if limit is not None and found >= limit:
+                return
+
+            word = self._words[order[i]]
+
+            if not matches(word):
+                return
+
+            if (min_len is None or len(word) >= min_len) and (max_len is None or len(word) <= max_len):
+                yield word
+                found += 1
+
+    def _deletion_index(self) -> DeletionIndex:
+        """
+        Returns the deletion index used for spelling suggestions (see 
+        `spelling.DeletionIndex`), built the first time it is used. It takes a 
+        few seconds to build for the full dictionary, so lexicons loaded from 
+        a dictionary file keep it on disk.
+
+        Returns:
+            DeletionIndex
+        """
+        return self._index('deletes', lambda: DeletionIndex(self._words))
+
+    def suggest(self, 
+            word: str, 
+            max_distance: int=MAX_DISTANCE, 
+            limit: int | None=None) -> list[str]:
+        """ 
+        Suggests corrections for a misspelt word, the words that are at most 
+        `max_distance` edits away (see `spelling.edit_distance`). A word that 
+        is spelt correctly is its own best suggestion.
+
+        Only the few words that share a delete with the word (see 
+        `spelling.DeletionIndex`) are compared against it, so lookups stay 
+        fast at a distance of 2.
+
+        Example:
+            >>> lexicon.suggest('recieve', limit=3)
+            ['receive', 'relieve', 'believe']
+
+        Args:
+            word (str):
+                The word to correct.
+            max_distance (int):
+                The maximum number of edits, at most spelling.MAX_DISTANCE.
+            limit (int | None):
+                The maximum number of suggestions, None for all of them.
+
+        Raises:
+            ValueError:
+                If max_distance is negative or more than spelling.MAX_DISTANCE.
+
+        Returns:
+            list[str]:
+                The words, closest first. Words the same distance away are 
+                ordered by how close their length is, then anagrams of the 
+                word (swapped letters) first and then alphabetically.
+        """
+        if max_distance < 0:
+            raise ValueError(f"max_distance cannot be negative: {max_distance}")
+
+        word = word.lower()
+        signature = anagram_signature(word)
+        found = []
+
+        for i in self._deletion_index().candidates(word, max_distance):
+            candidate = self._words[i]
+            distance = edit_distance(word, candidate, max_distance)
+
+            if distance <= max_distance:
+                found.append((
+                    distance, 
+                    abs(len(candidate) - len(word)), 
+                    anagram_signature(candidate) != signature, 
+                    candidate))
+
+        found.sort()
+
+        return [candidate for *_, candidate in found[:limit]]
+
+
+def _check_lengths(min_len: int, max_len: int | None) -> None:
+    """ Checks the word lengths given to `words_from_letters`. """
+    if min_len <= 0:
+        raise ValueError(f"min_len cannot be less than 1: {min_len}")
+
+    if max_len is not None:
+        if max_len <= 0:
+            raise ValueError(f"max_len cannot be less than 1: {max_len}")
+
+        if min_len > max_len:
+            raise ValueError(f"max_len cannot be bigger than min_len: {max_len} > {min_len}")
+
+def _check_engine(engine: str) -> str:
+    """ Checks that an engine is known and can be used, see ENGINES. """
+    if engine not in ENGINES:
+        raise ValueError(f"Unknown engine '{engine}', must be one of {ENGINES}")
+
+    if engine == 'numpy':
+        from en_words.matrices import require_numpy
+
+        require_numpy()
+
+    return engine
+
+def _sort_key(word: str) -> tuple[int, str]:
+    """ The order of the sorted dictionary, length and then alphabetical. """
+    return (len(word), word)
+
+def _length_bands(words: list[str]) -> dict[int, tuple[int, int]]:
+    """
+    Builds the length band table of a list sorted by length, mapping each 
+    word length to the (start, end) slice holding the words of that length.
+
+    Args:
+        words (list[str]):
+            Words sorted by length.
+
+    Returns:
+        dict[int, tuple[int, int]]
+    """
+    bands = {}
+
+    for length in sorted(set(map(len, words))):
+        start = bisect_left(words, length, key=len)
+        end = bisect_left(words, length + 1, start, key=len)
+        bands[length] = (start, end)
+
+    return bands
+
+def get_lexicon(filename_sorted: str=_FILENAME_SORTED) -> Lexicon:
+    """
+    Returns the shared lexicon for a dictionary file, loading it the first 
+    time it is asked for. 
+
+    Args:
+        filename_sorted (str):
+            The name of the file containing the sorted dictionary.
+
+    Returns:
+        Lexicon
+    """
+    key = os.path.abspath(filename_sorted)
+
+    if key not in _LEXICONS:
+        _LEXICONS[key] = Lexicon(filename_sorted)
+
+    return _LEXICONS[key]
+
+#endregion
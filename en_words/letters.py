@@ -27,6 +27,11 @@ CONSONANTS_LOWER = "bcdfghjklmnpqrstvwxyz"
 CONSONANTS_UPPER = "BCDFGHJKLMNPQRSTVWXYZ"
 CONSONANTS = "BCDFGHJKLMNPQRSTVWXYZbcdfghjklmnpqrstvwxyz"
 
+# Letter masks, bit 0 is 'a' ... bit 25 is 'z'. Anything else (e.g. an 
+# apostrophe) shares one extra bit
+LETTER_BITS = {letter: 1 << i for i, letter in enumerate(ALPHABET_LOWER)}
+OTHER_CHARACTER_BIT = 1 << 26
+
 #endregion
 
 
@@ -309,6 +314,46 @@ def random_letter():
 		"""    
 		return random.choice(ALPHABET_LOWER + ALPHABET_UPPER) 
 
+def letter_counts(word: str) -> bytes:
+		"""
+		Returns how many times each letter of the alphabet is used in a 
+		lowercase word, one count per letter from 'a' to 'z'. Other characters 
+		are not counted and counts stop at 255.
+		E.g. 'abba' -> (2, 2, 0, ..., 0)
+
+		Args:
+			word (str):
+				The lowercase word.
+
+		Returns:
+			bytes:
+				26 counts.
+		"""
+		return bytes(min(word.count(letter), 255) for letter in ALPHABET_LOWER)
+
+def letter_mask(word: str) -> int:
+		"""
+		Returns a bit mask of the letters used in a lowercase word, one bit per 
+		letter of the alphabet (see LETTER_BITS). Every other character sets 
+		OTHER_CHARACTER_BIT. E.g. 'cab' -> 0b111, 'abba' -> 0b11
+
+		A word can be spelt from a set of letters if its mask has no bits that 
+		aren't in the mask of the letters, i.e. mask & ~letters_mask == 0.
+
+		Args:
+			word (str):
+				The lowercase word.
+
+		Returns:
+			int
+		"""
+		mask = 0
+
+		for letter in set(word):
+			mask |= LETTER_BITS.get(letter, OTHER_CHARACTER_BIT)
+
+		return mask
+
 
 class LetterFrequency:
 	frequency_dict: dict[str, float] = {
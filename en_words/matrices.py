@@ -0,0 +1,194 @@
+"""
+matrices.py
+-----------
+
+Word matrices and vectorised filters for the numpy engine (see `Lexicon`).
+
+Words of the same length are stored as an (n_words, length) matrix of character
+codes, so a partial word is matched against every word at once with whole
+array comparisons instead of a Python loop per word.
+
+Requires numpy, which is optional. The functions raise an ImportError if it is
+not installed.
+"""
+
+try:
+    import numpy as np
+except ImportError: # pragma: no cover
+    np = None
+
+
+def require_numpy() -> None:
+    """
+    Checks that numpy is installed.
+
+    Raises:
+        ImportError:
+            If numpy is not installed.
+    """
+    if np is None:
+        raise ImportError("The numpy engine requires numpy to be installed: pip install numpy")
+
+def word_matrix(words: list[str], length: int):
+    """
+    Creates an (n_words, length) matrix of the character codes of words that
+    are all the same length. Ascii words are stored as uint8.
+
+    Args:
+        words (list[str]):
+            Lowercase words, all of the same length.
+        length (int):
+            The number of letters in each word.
+
+    Raises:
+        ImportError:
+            If numpy is not installed.
+
+    Returns:
+        numpy.ndarray
+    """
+    require_numpy()
+
+    text = ''.join(words)
+
+    if text.isascii():
+        return np.frombuffer(text.encode('ascii'), dtype=np.uint8).reshape(len(words), length)
+
+    return np.frombuffer(text.encode('utf-32-le'), dtype=np.uint32).reshape(len(words), length)
+
+def bytes_matrix(data, length: int):
+    """
+    Views ascii encoded words that are all the same length, one after another,
+    as an (n_words, length) uint8 matrix without copying them.
+
+    Args:
+        data (bytes-like):
+            The encoded words, e.g. a band of a compiled dictionary.
+        length (int):
+            The number of letters in each word.
+
+    Raises:
+        ImportError:
+            If numpy is not installed.
+
+    Returns:
+        numpy.ndarray
+    """
+    require_numpy()
+
+    return np.frombuffer(data, dtype=np.uint8).reshape(-1, length)
+
+def match_mask(matrix,
+        partial_word: str,
+        ignore_letters: str='',
+        required_letters: str='',
+        missing_characters: str='?-_.'):
+    """
+    Compares a partial word against every row of a word matrix, with the same
+    rules as `en_words.is_potential_match`.
+
+    Args:
+        matrix (numpy.ndarray):
+            A word matrix, see `word_matrix`.
+        partial_word (str):
+            A lowercase word with letters missing, the same length as the
+            words in the matrix.
+        ignore_letters (str):
+            A string of letters that must not be in the word.
+        required_letters (str):
+            A string of letters that must be in the word.
+        missing_characters (str):
+            The characters that stand for a missing letter.
+
+    Raises:
+        ImportError:
+            If numpy is not installed.
+
+    Returns:
+        numpy.ndarray:
+            A boolean array, True for each row that is a potential match.
+    """
+    require_numpy()
+
+    mask = np.ones(len(matrix), dtype=bool)
+
+    for position, letter in enumerate(partial_word):
+        if letter not in missing_characters:
+            mask &= matrix[:, position] == ord(letter)
+
+    if not (ignore_letters or required_letters):
+        return mask
+
+    # Only check the letters of the rows that are still a match
+    rows = np.flatnonzero(mask)
+    candidates = matrix[rows]
+    keep = np.ones(len(rows), dtype=bool)
+
+    for letter in set(required_letters):
+        keep &= (candidates == ord(letter)).any(axis=1)
+
+    if ignore_letters:
+        ignore_codes = np.array([ord(letter) for letter in set(ignore_letters)])
+        keep &= ~np.isin(candidates, ignore_codes).any(axis=1)
+
+    mask[rows] = keep
+
+    return mask
+
+def masks_without(masks, disallowed: int, start: int=0, end: int | None=None) -> list[int]:
+    """
+    Finds the masks that have none of the disallowed bits set, e.g. the words
+    that can be spelt from a set of letters (see `letters.letter_mask`).
+
+    Args:
+        masks (array):
+            An array of unsigned 32 bit masks.
+        disallowed (int):
+            The bits that must not be set.
+        start (int):
+            The first mask to check.
+        end (int | None):
+            One past the last mask to check, None for all of them.
+
+    Raises:
+        ImportError:
+            If numpy is not installed.
+
+    Returns:
+        list[int]:
+            The positions of the masks, in ascending order.
+    """
+    require_numpy()
+
+    masks = np.frombuffer(masks, dtype=np.uint32)[start:end]
+
+    return (np.flatnonzero((masks & np.uint32(disallowed)) == 0) + start).tolist()
+
+def counts_within(counts, rack: bytes, ids: list[int]) -> list[int]:
+    """
+    Finds the words whose letter counts are all within the counts of a rack,
+    i.e. the words that can be made from the rack's letters.
+
+    Args:
+        counts (bytes-like):
+            26 letter counts per word, see `letters.letter_counts`.
+        rack (bytes):
+            The 26 letter counts of the rack.
+        ids (list[int]):
+            The positions of the words to check.
+
+    Raises:
+        ImportError:
+            If numpy is not installed.
+
+    Returns:
+        list[int]:
+            The positions of the words that fit, in the same order as `ids`.
+    """
+    require_numpy()
+
+    ids = np.asarray(ids, dtype=np.intp)
+    matrix = np.frombuffer(counts, dtype=np.uint8).reshape(-1, 26)
+    rack = np.frombuffer(rack, dtype=np.uint8)
+
+    return ids[(matrix[ids] <= rack).all(axis=1)].tolist()
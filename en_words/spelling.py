@@ -0,0 +1,186 @@
+"""
+spelling.py
+-----------
+
+Spelling suggestions ("did you mean") using symmetric deletes (SymSpell).
+
+Two words are within n edits of each other only if deleting at most n letters
+from each of them gives the same string. So every string that can be made by
+deleting up to n letters from each word is indexed once, and the possible
+corrections of a misspelling are the words that share one of its deletes.
+Only those few words are compared letter by letter, rather than every word
+in the dictionary.
+
+Deletes are only made from the first PREFIX_LENGTH letters of each word,
+which keeps the index small without losing any matches, and each delete is
+stored as a 32 bit hash rather than a string. A hash collision only adds a
+word to be checked, the edit distance decides if it is a match.
+"""
+
+import zlib
+
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable, Iterator
+
+
+#region Globals
+
+MAX_DISTANCE = 2
+PREFIX_LENGTH = 7
+
+#endregion
+
+
+def deletes(word: str, max_distance: int=MAX_DISTANCE) -> set[str]:
+    """
+    Returns every string that can be made by deleting up to `max_distance`
+    letters from a word, including the word itself.
+    E.g. ('cat', 1) -> {'cat', 'at', 'ct', 'ca'}
+
+    Args:
+        word (str):
+            The word.
+        max_distance (int):
+            The maximum number of letters to delete.
+
+    Returns:
+        set[str]
+    """
+    found = {word}
+    edge = [word]
+
+    for _ in range(max_distance):
+        edge = [s[:i] + s[i + 1:] for s in edge for i in range(len(s))]
+        edge = [s for s in edge if s not in found]
+        found.update(edge)
+
+    return found
+
+def edit_distance(a: str, b: str, max_distance: int | None=None) -> int:
+    """
+    Returns the number of single letter edits (insertions, deletions,
+    substitutions and swaps of neighbouring letters) needed to turn one word
+    into another, i.e. the optimal string alignment distance.
+    E.g. ('form', 'from') -> 1
+
+    Args:
+        a (str):
+            The first word.
+        b (str):
+            The second word.
+        max_distance (int | None):
+            Stop as soon as the distance is known to be more than this.
+
+    Returns:
+        int:
+            The distance, or max_distance + 1 if it is more than max_distance.
+    """
+    limit = max(len(a), len(b)) if max_distance is None else max_distance
+
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+
+    previous2 = None
+    previous = list(range(len(b) + 1))
+
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+
+        for j in range(1, len(b) + 1):
+            cost = a[i - 1] != b[j - 1]
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                current[j] = min(current[j], previous2[j - 2] + 1)
+
+        if min(current) > limit:
+            return limit + 1
+
+        previous2, previous = previous, current
+
+    return previous[-1] if previous[-1] <= limit else limit + 1
+
+def _hash(s: str) -> int:
+    return zlib.crc32(s.encode())
+
+
+class DeletionIndex:
+    """
+    An index of the deletes of every word, for finding the words within a few
+    edits of a misspelling.
+
+    Stored as two parallel arrays sorted by hash, the hash of each delete and
+    the position of the word it was made from, so it pickles and loads
+    quickly, see `Lexicon.suggest`.
+
+    Example:
+        >>> words = ['cat', 'cart', 'dog']
+        >>> index = DeletionIndex(words)
+        >>> [words[i] for i in index.candidates('cta')]
+        ['cat', 'cart']
+    """
+
+    def __init__(self, words: Iterable[str], max_distance: int=MAX_DISTANCE):
+        """
+        Builds the index.
+
+        Args:
+            words (Iterable[str]):
+                Lowercase words.
+            max_distance (int):
+                The largest edit distance that will be searched for.
+        """
+        self.max_distance = max_distance
+
+        # The hash in the high bits and the word in the low bits, so one sort
+        # orders both arrays
+        entries = []
+
+        for i, word in enumerate(words):
+            entries.extend([(_hash(s) << 32) | i for s in deletes(word[:PREFIX_LENGTH], max_distance)])
+
+        entries.sort()
+
+        self._hashes = array('I', [entry >> 32 for entry in entries])
+        self._ids = array('I', [entry & 0xFFFFFFFF for entry in entries])
+
+    def __len__(self) -> int:
+        return len(self._hashes)
+
+    def candidates(self, word: str, max_distance: int | None=None) -> Iterator[int]:
+        """
+        Finds the words that might be within `max_distance` edits of a word.
+        Every word that is will be found, along with some that aren't.
+
+        Args:
+            word (str):
+                A lowercase word.
+            max_distance (int | None):
+                The maximum edit distance, at most the distance the index was
+                built for. None for that distance.
+
+        Raises:
+            ValueError:
+                If max_distance is more than the index was built for.
+
+        Returns:
+            Iterator[int]:
+                The positions of the words, each once, in no particular order.
+        """
+        max_distance = self.max_distance if max_distance is None else max_distance
+
+        if max_distance > self.max_distance:
+            raise ValueError(f"max_distance must be at most {self.max_distance}: {max_distance}")
+
+        seen = set()
+
+        for s in deletes(word[:PREFIX_LENGTH], max_distance):
+            h = _hash(s)
+            start = bisect_left(self._hashes, h)
+            end = bisect_right(self._hashes, h, start)
+
+            for i in self._ids[start:end]:
+                if i not in seen:
+                    seen.add(i)
+                    yield i
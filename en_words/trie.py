@@ -0,0 +1,369 @@
+"""
+trie.py
+-------
+
+A trie of words, minimised into a DAWG (directed acyclic word graph).
+
+A trie shares the starts of words, a DAWG also shares their endings, e.g.
+'nation' and 'station' share the nodes for 'ation'. Searching it depth first
+means that as soon as a prefix can't lead anywhere (no letters left in a rack,
+no word starts with it, ...) the whole branch is skipped, rather than every
+word being checked one at a time.
+
+The graph is stored as flat lists so it can be pickled and loaded quickly,
+see `Lexicon.trie`.
+"""
+
+from collections import Counter
+from collections.abc import Iterable, Iterator
+
+
+class Trie:
+    """
+    A minimised trie (DAWG) of lowercase words.
+
+    Nodes are numbered, the root is node 0. Each node has a dictionary of
+    edges from a letter to the next node, in alphabetical order, and a flag
+    marking whether the path to the node spells a word. So searches return
+    words in alphabetical order.
+
+    Example:
+        >>> trie = Trie(['cat', 'cats', 'cot'])
+        >>> list(trie.words_with_prefix('ca'))
+        ['cat', 'cats']
+    """
+
+    ROOT = 0
+
+    def __init__(self, words: Iterable[str]):
+        """
+        Builds the DAWG. Words are added in alphabetical order and each branch
+        is minimised as soon as no more words can be added to it.
+
+        Args:
+            words (Iterable[str]):
+                Lowercase words, in any order.
+        """
+        edges = [{}]
+        final = [False]
+        register = {}
+
+        # The nodes along the previous word, path[i] is the node after i letters
+        path = [Trie.ROOT]
+        previous = ''
+
+        def minimise(depth: int) -> None:
+            # Replace the nodes of the previous word below `depth` with an
+            # equivalent node if one has already been seen
+            for i in range(len(previous), depth, -1):
+                child = path[i]
+                signature = (final[child], tuple(edges[child].items()))
+                existing = register.setdefault(signature, child)
+
+                if existing != child:
+                    edges[path[i - 1]][previous[i - 1]] = existing
+                    edges[child] = None
+
+            del path[depth + 1:]
+
+        self._len = 0
+
+        for word in sorted(set(words)):
+            if not word:
+                continue
+
+            common = 0
+
+            for a, b in zip(word, previous):
+                if a != b:
+                    break
+
+                common += 1
+
+            minimise(common)
+
+            for letter in word[common:]:
+                edges.append({})
+                final.append(False)
+                edges[path[-1]][letter] = len(edges) - 1
+                path.append(len(edges) - 1)
+
+            final[path[-1]] = True
+            previous = word
+            self._len += 1
+
+        minimise(0)
+
+        self._compact(edges, final)
+
+    def _compact(self, edges: list[dict | None], final: list[bool]) -> None:
+        """
+        Renumbers the nodes that are still in use so they are contiguous.
+        """
+        numbers = {Trie.ROOT: 0}
+        order = [Trie.ROOT]
+
+        for node in order:
+            for child in edges[node].values():
+                if child not in numbers:
+                    numbers[child] = len(order)
+                    order.append(child)
+
+        self._edges = [{letter: numbers[child] for letter, child in edges[node].items()} for node in order]
+        self._final = bytearray(final[node] for node in order)
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __contains__(self, word: str) -> bool:
+        node = self.node(word)
+
+        return node is not None and self.is_word(node)
+
+    def __iter__(self) -> Iterator[str]:
+        return self.words_with_prefix('')
+
+    def __repr__(self) -> str:
+        return f"Trie(words={self._len}, nodes={self.node_count()})"
+
+    def node_count(self) -> int:
+        """
+        Returns the number of nodes in the graph.
+
+        Returns:
+            int
+        """
+        return len(self._edges)
+
+    def node(self, prefix: str, node: int=ROOT) -> int | None:
+        """
+        Follows the letters of a prefix from a node.
+
+        Args:
+            prefix (str):
+                The letters to follow.
+            node (int):
+                The node to start from, the root by default.
+
+        Returns:
+            int | None:
+                The node reached, or None if no word starts with the prefix.
+        """
+        for letter in prefix:
+            node = self._edges[node].get(letter)
+
+            if node is None:
+                return None
+
+        return node
+
+    def child(self, node: int, letter: str) -> int | None:
+        """
+        Returns the node after a letter, or None if there is no such edge.
+
+        Args:
+            node (int):
+                The node to start from.
+            letter (str):
+                The letter to follow.
+
+        Returns:
+            int | None
+        """
+        return self._edges[node].get(letter)
+
+    def children(self, node: int) -> dict[str, int]:
+        """
+        Returns the edges from a node, mapping each letter to the next node in
+        alphabetical order. Must not be modified.
+
+        Args:
+            node (int):
+                The node.
+
+        Returns:
+            dict[str, int]
+        """
+        return self._edges[node]
+
+    def is_word(self, node: int) -> bool:
+        """
+        Checks if the path to a node spells a word.
+
+        Args:
+            node (int):
+                The node.
+
+        Returns:
+            bool
+        """
+        return bool(self._final[node])
+
+    def has_prefix(self, prefix: str) -> bool:
+        """
+        Checks if any word starts with a prefix.
+
+        Args:
+            prefix (str):
+                The start of a word.
+
+        Returns:
+            bool
+        """
+        return self.node(prefix) is not None
+
+    def words_with_prefix(self, prefix: str) -> Iterator[str]:
+        """
+        Finds the words that start with a prefix, including the prefix itself
+        if it is a word.
+
+        Args:
+            prefix (str):
+                The start of a word.
+
+        Returns:
+            Iterator[str]:
+                The words, in alphabetical order.
+        """
+        node = self.node(prefix)
+
+        if node is None:
+            return
+
+        stack = [(prefix, node)]
+
+        while stack:
+            word, node = stack.pop()
+
+            if self._final[node]:
+                yield word
+
+            stack.extend((word + letter, child) for letter, child in reversed(self._edges[node].items()))
+
+    def words_from_letters(self,
+            letters: str,
+            min_len: int=1,
+            max_len: int | None=None,
+            remove_doubles: bool=False) -> list[str]:
+        """
+        Finds the words made only from the supplied letters, where each letter
+        may be used any number of times. See `en_words.words_from_letters`.
+
+        Args:
+            letters (str):
+                The lowercase letters that can be used.
+            min_len (int):
+                The minimum word length.
+            max_len (int | None):
+                The maximum word length, or None for no maximum.
+            remove_doubles (bool):
+                Only find words that don't repeat a letter.
+
+        Returns:
+            list[str]:
+                The words, in alphabetical order.
+        """
+        allowed = set(letters)
+        words = []
+
+        def walk(node: int, word: str) -> None:
+            if self._final[node] and len(word) >= min_len:
+                words.append(word)
+
+            if max_len is not None and len(word) >= max_len:
+                return
+
+            for letter, child in self._edges[node].items():
+                if letter in allowed and not (remove_doubles and letter in word):
+                    walk(child, word + letter)
+
+        walk(Trie.ROOT, '')
+
+        return words
+
+    def words_from_rack(self, letters: str, min_len: int=1, max_len: int | None=None) -> list[str]:
+        """
+        Finds the words that can be made from a rack of letters, where each
+        letter can only be used as many times as it is in the rack. See
+        `en_words.words_from_rack`.
+
+        Args:
+            letters (str):
+                The lowercase letters in the rack.
+            min_len (int):
+                The minimum word length.
+            max_len (int | None):
+                The maximum word length, or None for no maximum.
+
+        Returns:
+            list[str]:
+                The words, in alphabetical order.
+        """
+        rack = Counter(letters)
+        words = []
+
+        def walk(node: int, word: str) -> None:
+            if self._final[node] and len(word) >= min_len:
+                words.append(word)
+
+            if max_len is not None and len(word) >= max_len:
+                return
+
+            for letter, child in self._edges[node].items():
+                if rack[letter] > 0:
+                    rack[letter] -= 1
+                    walk(child, word + letter)
+                    rack[letter] += 1
+
+        walk(Trie.ROOT, '')
+
+        return words
+
+    def potential_words(self,
+            partial_word: str,
+            ignore_letters: str='',
+            required_letters: str='',
+            missing_characters: str='?-_.') -> list[str]:
+        """
+        Finds the words that are a potential match for a partial word, with the
+        same rules as `en_words.is_potential_match`.
+
+        Args:
+            partial_word (str):
+                A lowercase word with letters missing.
+            ignore_letters (str):
+                A string of letters that must not be in the word.
+            required_letters (str):
+                A string of letters that must be in the word.
+            missing_characters (str):
+                The characters that stand for a missing letter.
+
+        Returns:
+            list[str]:
+                The words, in alphabetical order.
+        """
+        ignore, required = set(ignore_letters), set(required_letters)
+        words = []
+
+        def walk(node: int, word: str) -> None:
+            i = len(word)
+
+            if i == len(partial_word):
+                if self._final[node] and required.issubset(word):
+                    words.append(word)
+
+                return
+
+            if partial_word[i] in missing_characters:
+                edges = self._edges[node].items()
+            else:
+                child = self._edges[node].get(partial_word[i])
+                edges = [] if child is None else [(partial_word[i], child)]
+
+            for letter, child in edges:
+                if letter not in ignore:
+                    walk(child, word + letter)
+
+        walk(Trie.ROOT, '')
+
+        return words
@@ -1,18 +1,23 @@
 from collections import Counter
+from operator import le
 from typing import Any
 
+from en_words.letters import letter_counts
+
 
 def is_sublist(a: list[Any]=None, b: list[Any]=None) -> bool:
     """
     Return True if `a`` can be formed from `b`, including duplicates.
 
     Both lists default to None but must be given, otherwise a ValueError is 
-    raised.
+    raised. Strings of letters of the same case can be given instead of lists,
+    in which case their letter counts (see `letters.letter_counts`) are 
+    compared without building a Counter for each.
 
     Args:
-        a (list[Any]):
+        a (list[Any] | str):
             The collection to test for containment.
-        b (list[b]):
+        b (list[Any] | str):
             The collection to test against.
 
     Raises:
@@ -26,4 +31,12 @@ def is_sublist(a: list[Any]=None, b: list[Any]=None) -> bool:
     if a is None or b is None:
         raise ValueError("Both lists must be given")
 
-    return Counter(a) <= Counter(b)
\ No newline at end of file
+    if isinstance(a, str) and isinstance(b, str) and _is_letters(a + b) and len(a) <= 255:
+        # Counts stop at 255, which can't change the answer if none of a's do
+        return len(a) <= len(b) and all(map(le, letter_counts(a.lower()), letter_counts(b.lower())))
+
+    return Counter(a) <= Counter(b)
+
+def _is_letters(s: str) -> bool:
+    """ Checks if a string is only ascii letters, all of the same case. """
+    return s.isascii() and s.isalpha() and (s.islower() or s.isupper())
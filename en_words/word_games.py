@@ -1,9 +1,25 @@
+import heapq
 import random
 
 from collections import Counter
-from typing import Self
-
-from en_words.en_words import words_from_letters, potential_words, vowel_count
+from collections.abc import Iterator
+from itertools import combinations, islice
+from multiprocessing import Pool
+from math import comb
+from typing import NamedTuple, Self
+
+from en_words.bitsets import bit_positions
+from en_words.en_words import (
+    MISSING_CHARACTERS, 
+    Lexicon, 
+    anagram_signature, 
+    get_lexicon, 
+    words_from_letters, 
+    words_from_rack, 
+    potential_words, 
+    vowel_count)
+from en_words.letters import ALPHABET_LOWER, letter_mask
+from en_words.trie import Trie
 from en_words.utils import is_sublist
 
 def spelling_bee(inner_letter, outer_letters):
@@ -46,57 +62,497 @@ def polygon(inner_letter, outer_letters):
     print("")
 
 
-def cash_square(word_list):
-    ''' From take a break magazine '''
-
-    # E.g.
-    #
-    # Given words
-    # a v e r
-    # f l a p
-    # g e n t
-    # l i m e
-    # n e w t
-    #
-    # Answer
-    # f l a p
-    # l i m e
-    # a v e r
-    # g e n t
+#region Polygon
+
+POLYGON_LETTER_COUNT = 9
+POLYGON_MIN_WORD_LEN = 4
+
+# The groups used by a worker process, see `polygon_batch`
+_worker_groups: dict[str, int] | None = None
+
 
+class PolygonPuzzle(NamedTuple):
+    """
+    A polygon puzzle and how many answers it has.
+
+    Attributes:
+        center (str):
+            The letter every answer must use.
+        letters (str):
+            All 9 letters, including the center, sorted alphabetically.
+        answer_count (int):
+            The number of answers.
+        words (tuple[str, ...]):
+            The 9 letter words that use every letter.
+    """
+    center: str
+    letters: str
+    answer_count: int
+    words: tuple[str, ...]
+
+
+def _polygon_groups(lexicon: Lexicon) -> dict[str, int]:
+    """
+    Returns the number of words of 4 to 9 letters with each anagram signature,
+    built the first time a lexicon is used and kept with the lexicon's other 
+    indexes.
+    """
+    def build():
+        groups = Counter()
+
+        for length in range(POLYGON_MIN_WORD_LEN, POLYGON_LETTER_COUNT + 1):
+            groups.update(anagram_signature(word) for word in lexicon.words_of_length(length) if word.isalpha())
+
+        return dict(groups)
+
+    return lexicon.cached('polygon_groups', build)
+
+def _polygon_counts(rack: str, groups: dict[str, int]) -> dict[str, int]:
+    """
+    Counts the answers for every center letter of a rack in one pass. Each 
+    distinct sub-rack of 4 or more letters is looked up once and its words are
+    credited to every letter it contains.
+    """
+    rack = anagram_signature(rack)
+    counts = dict.fromkeys(rack, 0)
+    repeats = len(set(rack)) != len(rack)
+    seen = set()
+
+    for length in range(POLYGON_MIN_WORD_LEN, len(rack) + 1):
+        for letters in combinations(rack, length):
+            # A repeated letter gives the same sub-rack more than once
+            if repeats:
+                if letters in seen:
+                    continue
+
+                seen.add(letters)
+
+            count = groups.get(''.join(letters))
+
+            if count:
+                for letter in set(letters):
+                    counts[letter] += count
+
+    return counts
+
+def _init_polygon_worker(groups: dict[str, int]) -> None:
+    global _worker_groups
+    _worker_groups = groups
+
+def _polygon_worker(rack: str) -> dict[str, int]:
+    return _polygon_counts(rack, _worker_groups)
+
+def polygon_batch(racks: list[str], processes: int | None=1, lexicon: Lexicon | None=None) -> list[dict[str, int]]:
+    """
+    Solves many polygons at once. For each rack of letters, counts the answers
+    (words of 4 or more letters that use each letter of the rack at most once)
+    for every choice of center letter.
+
+    Example:
+        >>> polygon_batch(['regretful'])
+        [{'e': 100, 'f': 47, 'g': 39, 'l': 60, 'r': 78, 't': 51, 'u': 53}]
+
+    Args:
+        racks (list[str]):
+            The letters of each polygon. Any case.
+        processes (int | None):
+            The number of processes to solve them with, None for one per cpu.
+        lexicon (Lexicon | None):
+            The words to use, the default dictionary if not given.
+
+    Returns:
+        list[dict[str, int]]:
+            For each rack, the number of answers for each center letter.
+    """
+    if lexicon is None:
+        lexicon = get_lexicon()
+
+    groups = _polygon_groups(lexicon)
+    racks = [rack.lower() for rack in racks]
+
+    if processes == 1:
+        return [_polygon_counts(rack, groups) for rack in racks]
+
+    with Pool(processes, initializer=_init_polygon_worker, initargs=(groups,)) as pool:
+        return pool.map(_polygon_worker, racks, chunksize=256)
+
+def polygon_puzzles(min_answers: int=1,
+        max_answers: int | None=None,
+        processes: int | None=1,
+        lexicon: Lexicon | None=None) -> Iterator[PolygonPuzzle]:
+    """
+    Generates every polygon puzzle: the letters of every 9 letter word, with 
+    each of its letters as the center. Anagrams give the same puzzle, so each
+    set of letters is solved once, see `polygon_batch`.
+
+    Args:
+        min_answers (int):
+            The minimum number of answers.
+        max_answers (int | None):
+            The maximum number of answers, None for no maximum.
+        processes (int | None):
+            The number of processes to solve them with, None for one per cpu.
+        lexicon (Lexicon | None):
+            The words to use, the default dictionary if not given.
+
+    Returns:
+        Iterator[PolygonPuzzle]:
+            The puzzles, in alphabetical order of their letters and then their 
+            center.
+    """
+    if lexicon is None:
+        lexicon = get_lexicon()
+
+    racks = {}
+
+    for word in lexicon.words_of_length(POLYGON_LETTER_COUNT):
+        if word.isalpha():
+            racks.setdefault(anagram_signature(word), []).append(word)
+
+    racks = dict(sorted(racks.items()))
+
+    for (letters, words), counts in zip(racks.items(), polygon_batch(list(racks), processes, lexicon)):
+        for center, count in counts.items():
+            if count >= min_answers and (max_answers is None or count <= max_answers):
+                yield PolygonPuzzle(center, letters, count, tuple(words))
+
+#endregion
+
+
+#region Cash Square
+
+class CashSquareSolution(NamedTuple):
+    """
+    A solved cash square.
+
+    Attributes:
+        rows (tuple[str, ...]):
+            The words reading across, from top to bottom.
+        columns (tuple[str, ...]):
+            The words reading down, from left to right.
+        unused (tuple[str, ...]):
+            The given words that aren't in the grid, the answer to the puzzle.
+    """
+    rows: tuple[str, ...]
+    columns: tuple[str, ...]
+    unused: tuple[str, ...]
+
+
+def cash_square(word_list: list[str]) -> list[CashSquareSolution]:
+    """ 
+    From take a break magazine.
+
+    Given one more word than fits in the grid, put words on top of each other 
+    so that more words are formed reading downwards. The word left over is 
+    the answer. Each column can only use the letters given in that position.
+
+    E.g.
+
+    Given words
+        a v e r
+        f l a p
+        g e n t
+        l i m e
+        n e w t
+
+    Answer (newt)
+        f l a p
+        l i m e
+        a v e r
+        g e n t
+
+    The grid is filled a column at a time, letter by letter. Each letter must 
+    continue both a possible column word and a possible row word (checked 
+    with a trie of each), so a dead end is dropped after a single letter 
+    rather than after building the whole grid.
+
+    Args:
+        word_list (list[str]):
+            The given words, all the same length. Any case.
+
+    Raises:
+        ValueError:
+            If the words are not all the same length.
+
+    Returns:
+        list[CashSquareSolution]:
+            Every solution, in the order found.
+    """
     rows = [w.lower() for w in word_list]
+    size = len(rows[0]) if rows else 0
+
+    if any(len(row) != size for row in rows):
+        raise ValueError(f"Words must all be the same length: {word_list}")
+
     cols = [''.join(zipped) for zipped in zip(*rows)]
 
-    # Precompute words that might be a soultion to a column
-    potentials_col_1 = words_from_letters(cols[0], 4, 4)
-    potentials_col_2 = words_from_letters(cols[1], 4, 4)
-    potentials_col_3 = words_from_letters(cols[2], 4, 4)
-    potentials_col_4 = words_from_letters(cols[3], 4, 4)
-
-    for a in potentials_col_1:
-        for b in potentials_col_2:
-            for c in potentials_col_3:
-                for d in potentials_col_4:
-                    # recreate the rows
-                    row_1 = ''.join([a[0], b[0], c[0], d[0]])
-                    row_2 = ''.join([a[1], b[1], c[1], d[1]])
-                    row_3 = ''.join([a[2], b[2], c[2], d[2]])
-                    row_4 = ''.join([a[3], b[3], c[3], d[3]])
-
-                    grid_set = set([row_1, row_2, row_3, row_4])
-
-                    if grid_set.issubset(word_list):
-                        answer = set(word_list).difference(grid_set)
-
-                        print(f'Cash Grid: ({rows})')
-                        
-                        for r in [row_1, row_2, row_3, row_4]:
-                            print(f'\t{" ".join(r).upper()}')
-
-                        print(f'{answer.pop()}')
-    
+    # Precompute words that might be a solution to a column
+    row_trie = Trie(rows)
+    column_tries = [Trie(words_from_letters(col, size, size)) for col in cols]
+
+    solutions = []
+    grid = [[''] * size for _ in range(size)]
+    row_nodes = [Trie.ROOT] * size
+
+    def fill(column: int, row: int, column_node: int) -> None:
+        if column == size:
+            found = tuple(''.join(r) for r in grid)
+
+            if len(set(found)) == size:
+                columns = tuple(''.join(c) for c in zip(*grid))
+                unused = tuple(w for w in rows if w not in found)
+                solutions.append(CashSquareSolution(found, columns, unused))
+
+            return
+
+        if row == size:
+            if column_tries[column].is_word(column_node):
+                fill(column + 1, 0, Trie.ROOT)
+
+            return
+
+        row_node = row_nodes[row]
+
+        for letter, next_column_node in column_tries[column].children(column_node).items():
+            next_row_node = row_trie.child(row_node, letter)
+
+            # Rows are only complete once the last column is placed
+            if next_row_node is None or (column == size - 1 and not row_trie.is_word(next_row_node)):
+                continue
+
+            grid[row][column] = letter
+            row_nodes[row] = next_row_node
+            fill(column, row + 1, next_column_node)
+
+        row_nodes[row] = row_node
+
+    if size:
+        fill(0, 0, Trie.ROOT)
+
+    return solutions
+
+def cash_square_and_display(word_list: list[str]) -> None:
+    """
+    Solves a cash square (see `cash_square`) and prints the solutions to the 
+    terminal.
+
+    Args:
+        word_list (list[str]):
+            The given words, all the same length. Any case.
+    """
+    for solution in cash_square(word_list):
+        print(f'Cash Grid: ({[w.lower() for w in word_list]})')
+
+        for r in solution.rows:
+            print(f'\t{" ".join(r).upper()}')
+
+        print(f'{", ".join(solution.unused)}')
+
     print("")
 
+#endregion
+
+
+#region Word Grid
+
+class WordGrid(NamedTuple):
+    """
+    A grid of letters where every row and every column is a word.
+
+    Attributes:
+        rows (tuple[str, ...]):
+            The words reading across, from top to bottom.
+        columns (tuple[str, ...]):
+            The words reading down, from left to right.
+    """
+    rows: tuple[str, ...]
+    columns: tuple[str, ...]
+
+
+def word_grid(n_rows: int, 
+        n_cols: int | None=None, 
+        pattern: list[str] | None=None, 
+        symmetric: bool=False, 
+        shuffle: bool=False,
+        limit: int | None=None,
+        lexicon: Lexicon | None=None) -> Iterator[WordGrid]:
+    """
+    Finds grids of letters where every row and every column is a word in the 
+    dictionary, like a cash square of any size made from the whole dictionary.
+
+    A symmetric grid is a classic word square, the rows are the same words 
+    as the columns. E.g.
+
+        h e a r t
+        e m b e r
+        a b u s e
+        r e s i n
+        t r e n d
+
+    Otherwise no word is used twice in the grid.
+
+    The grid is filled a word at a time. The next word placed is always in the
+    row or column with the fewest possible words, given the letters already 
+    in the grid, and the search backs up as soon as any row or column has 
+    none. The possible words are counted with the lexicon's positional bitset
+    indexes (see `Lexicon.positional_index`).
+
+    Args:
+        n_rows (int):
+            The number of rows, the length of the column words.
+        n_cols (int | None):
+            The number of columns, the length of the row words. The same as 
+            `n_rows` if not given.
+        pattern (list[str] | None):
+            Letters that must be in the grid, one string per row with missing 
+            letters represented by MISSING_CHARACTERS. E.g. ['h????', ...]
+        symmetric (bool):
+            Find word squares where the rows and columns are the same words.
+        shuffle (bool):
+            Try the possible words in a random order rather than 
+            alphabetically, to find different grids each time.
+        limit (int | None):
+            The maximum number of grids to find, None for all of them.
+        lexicon (Lexicon | None):
+            The words to use, the default dictionary if not given.
+
+    Raises:
+        ValueError:
+            If the size or pattern is invalid, or a symmetric grid isn't square.
+
+    Returns:
+        Iterator[WordGrid]:
+            The grids, as they are found.
+    """
+    n_cols = n_rows if n_cols is None else n_cols
+
+    if n_rows <= 0 or n_cols <= 0:
+        raise ValueError(f"Grid must have at least 1 row and column: {n_rows} x {n_cols}")
+
+    if symmetric and n_rows != n_cols:
+        raise ValueError(f"A symmetric grid must be square: {n_rows} x {n_cols}")
+
+    pattern = pattern or [MISSING_CHARACTERS[0] * n_cols] * n_rows
+
+    if len(pattern) != n_rows or any(len(row) != n_cols for row in pattern):
+        raise ValueError(f"Pattern must be {n_rows} rows of {n_cols} letters: {pattern}")
+
+    if lexicon is None:
+        lexicon = get_lexicon()
+
+    grid = [[None if c in MISSING_CHARACTERS else c.lower() for c in row] for row in pattern]
+
+    # A slot is a row or column, as the list of cells it covers
+    slots = [[(i, j) for j in range(n_cols)] for i in range(n_rows)]
+
+    if not symmetric:
+        slots += [[(i, j) for i in range(n_rows)] for j in range(n_cols)]
+
+    # Only words made entirely of letters can go in the grid
+    indexes, words, letter_words = {}, {}, {}
+
+    for length in {len(slot) for slot in slots}:
+        indexes[length] = lexicon.positional_index(length)
+        words[length] = lexicon.words_of_length(length)
+        letter_words[length] = indexes[length].all
+
+        for c in indexes[length].characters() - set(ALPHABET_LOWER):
+            letter_words[length] &= ~indexes[length].containing(c)
+
+    def possible_words(slot: list[tuple[int, int]]) -> int:
+        index = indexes[len(slot)]
+        bitset = letter_words[len(slot)]
+
+        for position, (i, j) in enumerate(slot):
+            if grid[i][j] is not None:
+                bitset &= index.at(position, grid[i][j])
+
+        return bitset
+
+    def place(slot: list[tuple[int, int]], word: str) -> list[tuple[int, int]]:
+        changed = []
+
+        for (i, j), letter in zip(slot, word):
+            cells = [(i, j), (j, i)] if symmetric else [(i, j)]
+
+            for a, b in cells:
+                if grid[a][b] is None:
+                    grid[a][b] = letter
+                    changed.append((a, b))
+
+        return changed
+
+    used = set()
+    unfilled = set(range(len(slots)))
+
+    def search() -> Iterator[WordGrid]:
+        if not unfilled:
+            rows = tuple(''.join(row) for row in grid)
+            yield WordGrid(rows, tuple(''.join(column) for column in zip(*rows)))
+            return
+
+        best, best_bitset, best_count = None, 0, None
+
+        for s in unfilled:
+            bitset = possible_words(slots[s])
+            count = bitset.bit_count()
+
+            if count == 0:
+                return
+
+            if best is None or count < best_count:
+                best, best_bitset, best_count = s, bitset, count
+
+        ids = list(bit_positions(best_bitset))
+
+        if shuffle:
+            random.shuffle(ids)
+
+        unfilled.remove(best)
+
+        for i in ids:
+            word = words[len(slots[best])][i]
+
+            if word in used:
+                continue
+
+            changed = place(slots[best], word)
+            used.add(word)
+
+            yield from search()
+
+            used.remove(word)
+
+            for a, b in changed:
+                grid[a][b] = None
+
+        unfilled.add(best)
+
+    return islice(search(), limit)
+
+def word_square(size: int, limit: int | None=1, shuffle: bool=False, lexicon: Lexicon | None=None) -> list[WordGrid]:
+    """
+    Finds classic word squares, where the words reading across are the same 
+    as the words reading down. See `word_grid`.
+
+    Args:
+        size (int):
+            The length of the words.
+        limit (int | None):
+            The maximum number of squares to find, None for all of them.
+        shuffle (bool):
+            Try the possible words in a random order, to find different 
+            squares each time.
+        lexicon (Lexicon | None):
+            The words to use, the default dictionary if not given.
+
+    Returns:
+        list[WordGrid]
+    """
+    return list(word_grid(size, symmetric=True, shuffle=shuffle, limit=limit, lexicon=lexicon))
+
+#endregion
+
 
 #region Countdown
 
@@ -153,10 +609,14 @@ class Countdown:
             Finds all words that can be formed from the selected letters, groups 
             them by word count and then prints to the terminal.
 
-        find_9_letter_game(cls) -> Self:
+        find_9_letter_game(cls, lexicon) -> Self:
             A class method to find a Countdown game that has one or more 9 letter
             solutions. 
 
+        draw_probability(cls, letters: str) -> float:
+            A class method that returns the chance of a random game (see 
+            `from_vowel_count`) drawing a selection of letters.
+
         __repr__(self) -> str:
             Returns a string representing the Countdown letters game. 
     '''
@@ -193,6 +653,8 @@ class Countdown:
         + ["Z"] * 2
     )
 
+    _POOL_COUNTS: Counter = Counter(VOWEL_POOL + CONSONANT_POOL)
+
     MIN_WORD_LEN = 3
     MIN_VOWEL_COUNT = 3
     MAX_VOWEL_COUNT = 5
@@ -248,7 +710,7 @@ class Countdown:
         if not Countdown.MIN_VOWEL_COUNT <= vowel_count(letters) <= Countdown.MAX_VOWEL_COUNT:
             return False
         
-        if not is_sublist(list(letters.upper()), Countdown.VOWEL_POOL + Countdown.CONSONANT_POOL):
+        if not is_sublist(letters.upper(), ''.join(Countdown.VOWEL_POOL + Countdown.CONSONANT_POOL)):
             return False
                 
         return True    
@@ -305,12 +767,8 @@ class Countdown:
         """
         d = { i:[] for i in range(3, 9+1) }
 
-        letters_counter = Counter(self.letters.lower())
-        words = words_from_letters(self.letters, self.MIN_WORD_LEN, 9, False)
-
-        for word in words:
-            if Counter(word) <= letters_counter:
-                d[len(word)].append(word)
+        for word in words_from_rack(self.letters, self.MIN_WORD_LEN, 9):
+            d[len(word)].append(word)
 
         return d
 
@@ -346,22 +804,82 @@ class Countdown:
         print("")  
 
     @classmethod
-    def find_9_letter_game(cls) -> Self:
+    def find_9_letter_game(cls, lexicon: Lexicon | None=None) -> Self:
         """
         A class method to find a Countdown game that has one or more 9 letter
         solutions. 
 
+        Rather than drawing games until one can be solved, a selection is 
+        picked straight from the valid selections that spell a 9 letter word, 
+        weighted by how likely each is to be drawn (see `draw_probability`). 
+        So games turn up as often as they would by drawing until one is 
+        solvable, with the vowel count chosen at random. The selections are 
+        found the first time this is called for a lexicon, and kept with it.
+
+        Args:
+            lexicon (Lexicon | None):
+                The words to find the 9 letter words in, the default dictionary
+                if not given.
+
         Returns:
             Self:
                 A new Countdown object.
         """       
-        while True:
-            vowel_count = random.choice([i for i in range(Countdown.MIN_VOWEL_COUNT, Countdown.MAX_VOWEL_COUNT + 1)])
-            c = Countdown.from_vowel_count(vowel_count)
-            d = c.solve()
+        if lexicon is None:
+            lexicon = get_lexicon()
+
+        def build():
+            selections = {}
+
+            for word in lexicon.words_of_length(9):
+                letters = anagram_signature(word.upper())
+
+                if letters not in selections:
+                    selections[letters] = Countdown.draw_probability(letters)
+
+            selections = {letters: p for letters, p in selections.items() if p > 0}
 
-            if len(d[9]) > 0:
-                return c
+            return list(selections), list(selections.values())
+
+        selections, weights = lexicon.cached('countdown_selections', build)
+        letters = list(random.choices(selections, weights)[0])
+        random.shuffle(letters)
+
+        return Countdown("".join(letters))
+
+    @classmethod
+    def draw_probability(cls, letters: str) -> float:
+        """
+        Returns the chance of a random game drawing a selection of letters, in 
+        any order. The vowel count is chosen at random (each valid count is 
+        equally likely) and the letters are then drawn from the vowel and 
+        consonant pools, as in `from_vowel_count`.
+
+        Args:
+            letters (str):
+                A selection of letters. Any case.
+
+        Returns:
+            float:
+                The probability, 0.0 if the selection can't be drawn.
+        """
+        if not Countdown.is_valid_selection(letters):
+            return 0.0
+
+        counts = Counter(letters.upper())
+        vowels = sum(n for letter, n in counts.items() if letter in Countdown.VOWEL_POOL)
+        vowel_counts = range(Countdown.MIN_VOWEL_COUNT, Countdown.MAX_VOWEL_COUNT + 1)
+
+        # Ways of drawing these letters from the pools, out of all the ways of 
+        # drawing that many vowels and consonants
+        ways = 1
+
+        for letter, n in counts.items():
+            ways *= comb(Countdown._POOL_COUNTS[letter], n)
+
+        draws = comb(len(Countdown.VOWEL_POOL), vowels) * comb(len(Countdown.CONSONANT_POOL), 9 - vowels)
+
+        return ways / draws / len(vowel_counts)
             
     def __repr__(self) -> str:
         """ 
@@ -376,4 +894,871 @@ class Countdown:
         """
         return f'Countdown("{self.letters}")'
 
-#endregion
\ No newline at end of file
+#endregion
+
+#region Spelling Bee
+
+class SpellingBeePuzzle(NamedTuple):
+    """
+    A Spelling Bee puzzle and how many answers it has.
+
+    Attributes:
+        center (str):
+            The letter every answer must use.
+        letters (str):
+            All 7 letters, including the center, sorted alphabetically.
+        answer_count (int):
+            The number of answers.
+        score (int):
+            The total score of the answers, see `SpellingBee.word_score`.
+        pangram_count (int):
+            The number of answers that use all 7 letters.
+    """
+    center: str
+    letters: str
+    answer_count: int
+    score: int
+    pangram_count: int
+
+
+def _submasks(mask: int) -> Iterator[int]:
+    """
+    Returns every non empty subset of the bits of a mask. E.g. 0b101 -> 0b101, 
+    0b100, 0b001
+    """
+    submask = mask
+
+    while submask:
+        yield submask
+        submask = (submask - 1) & mask
+
+
+class SpellingBee:
+    '''
+    A class representing a game of Spelling Bee. https://www.nytimes.com/puzzles/spelling-bee
+
+    There are 7 different letters, one of them in the center. Answers are 
+    words of 4 letters or more that use the center letter and only the 7 
+    letters, any number of times. A pangram uses all 7.
+
+    Each word is reduced to the set of letters it uses (a 26 bit letter mask, 
+    see `letters.letter_mask`), so a puzzle's answers are the words whose set 
+    is one of the 64 subsets of its 7 letters that include the center. The 
+    words are grouped by set once (`Lexicon.letter_set_index`) and each puzzle
+    is then a few dictionary lookups rather than a scan of the dictionary.
+
+    Scoring: a 4 letter word is worth 1 point, a longer word 1 point per 
+    letter and a pangram 7 extra points.
+
+    Class Attributes:
+        LETTER_COUNT (int):
+            The number of letters in a puzzle. 7
+        MIN_WORD_LEN (int):
+            The minimum answer length. 4
+        PANGRAM_BONUS (int):
+            The extra points for a pangram. 7
+
+    Instance Attributes:
+        center (str):
+            The center letter
+        letters (str):
+            All 7 letters, including the center, sorted alphabetically
+
+    Methods:
+        __init__(self, center: str, outer_letters: str, lexicon: Lexicon | None=None):
+            Constructs a SpellingBee object from the center and outer letters.
+
+        solve(self) -> list[str]:
+            Finds all the answers.
+
+        solve_and_display(self) -> None:
+            Finds all the answers and prints them to the terminal.
+
+        pangrams(self) -> list[str]:
+            Finds the answers that use all 7 letters.
+
+        score(self) -> int:
+            Returns the total score of all the answers.
+
+        word_score(word: str) -> int:
+            A static method that returns the score of a single answer.
+
+        puzzles(cls, ...) -> Iterator[SpellingBeePuzzle]:
+            A class method that generates every puzzle that has a pangram.
+    '''
+
+    LETTER_COUNT = 7
+    MIN_WORD_LEN = 4
+    PANGRAM_BONUS = 7
+
+    def __init__(self, center: str, outer_letters: str, lexicon: Lexicon | None=None):
+        """
+        Constructs a SpellingBee object.
+
+        Args:
+            center (str):
+                The center letter. Any case.
+            outer_letters (str):
+                The 6 other letters. Any case.
+            lexicon (Lexicon | None):
+                The words to use, the default dictionary if not given.
+
+        Raises:
+            ValueError:
+                If the letters aren't 7 different letters.
+        """
+        center, outer_letters = center.lower(), outer_letters.lower()
+        letters = set(outer_letters) | {center}
+
+        if len(center) != 1 or len(outer_letters) != SpellingBee.LETTER_COUNT - 1 or \
+                len(letters) != SpellingBee.LETTER_COUNT or not letters <= set(ALPHABET_LOWER):
+            raise ValueError(
+                f"Invalid Spelling Bee letters. '{center}', '{outer_letters}' " \
+                f"Must be {SpellingBee.LETTER_COUNT} different letters, 1 in the center and {SpellingBee.LETTER_COUNT - 1} outside")
+
+        self.center = center
+        self.letters = ''.join(sorted(letters))
+
+        self._lexicon = get_lexicon() if lexicon is None else lexicon
+        self._mask = letter_mask(self.letters)
+        self._center_mask = letter_mask(center)
+
+    def solve(self) -> list[str]:
+        """
+        Finds all the answers.
+
+        Example:
+            >>> SpellingBee('g', 'aimnor').solve()
+            ['agar', 'agin', 'agio', ..., 'grammarian', 'ingraining', 'anagramming']
+
+        Returns:
+            list[str]:
+                The answers, sorted by length and then alphabetically.
+        """
+        index = self._lexicon.letter_set_index()
+        ids = []
+
+        for submask in _submasks(self._mask):
+            if submask & self._center_mask:
+                ids.extend(index.get(submask, ()))
+
+        return [self._lexicon[i] for i in sorted(ids) if len(self._lexicon[i]) >= SpellingBee.MIN_WORD_LEN]
+
+    def solve_and_display(self) -> None:
+        """
+        Finds all the answers and prints them to the terminal.
+
+        Example:
+            >>> SpellingBee('g', 'aimnor').solve_and_display()
+
+            Spelling Bee: (g, agimnor), count: 259, score: 1400
+                ['agar', 'agin', 'agio', ..., 'ingraining', 'anagramming']
+        """
+        words = self.solve()
+
+        print(f'Spelling Bee: ({self.center}, {self.letters}), count: {len(words)}, score: {sum(map(SpellingBee.word_score, words))}')
+        print(f"\t{words}")
+        print("")
+
+    def pangrams(self) -> list[str]:
+        """
+        Finds the answers that use all 7 letters.
+
+        Returns:
+            list[str]:
+                The pangrams, sorted by length and then alphabetically.
+        """
+        ids = self._lexicon.letter_set_index().get(self._mask, [])
+
+        return [self._lexicon[i] for i in ids if len(self._lexicon[i]) >= SpellingBee.MIN_WORD_LEN]
+
+    def score(self) -> int:
+        """
+        Returns the total score of all the answers.
+
+        Returns:
+            int
+        """
+        return sum(map(SpellingBee.word_score, self.solve()))
+
+    @staticmethod
+    def word_score(word: str) -> int:
+        """
+        Returns the score of an answer. A 4 letter word is worth 1 point, a 
+        longer word 1 point per letter and a pangram 7 extra points.
+
+        Args:
+            word (str):
+                An answer.
+
+        Returns:
+            int
+        """
+        score = 1 if len(word) == SpellingBee.MIN_WORD_LEN else len(word)
+
+        if len(set(word)) == SpellingBee.LETTER_COUNT:
+            score += SpellingBee.PANGRAM_BONUS
+
+        return score
+
+    @classmethod
+    def _letter_set_scores(cls, lexicon: Lexicon) -> dict[int, tuple[int, int]]:
+        """
+        Returns the (answer count, score) of the words that use each set of at 
+        most 7 letters, built the first time a lexicon is used and kept with 
+        the lexicon's other indexes.
+        """
+        def build():
+            scores = {}
+
+            for mask, ids in lexicon.letter_set_index().items():
+                if mask.bit_count() <= cls.LETTER_COUNT:
+                    words = [lexicon[i] for i in ids if len(lexicon[i]) >= cls.MIN_WORD_LEN]
+
+                    if words:
+                        scores[mask] = (len(words), sum(map(cls.word_score, words)))
+
+            return scores
+
+        return lexicon.cached('spelling_bee_scores', build)
+
+    @classmethod
+    def puzzles(cls,
+            min_answers: int=1,
+            max_answers: int | None=None,
+            exclude: str='s',
+            lexicon: Lexicon | None=None) -> Iterator[SpellingBeePuzzle]:
+        """
+        Generates every puzzle that has at least one pangram, i.e. every set of
+        7 letters that some word uses exactly, with each of its letters as the
+        center.
+
+        The answer counts and scores of all 7 centers are found together, by 
+        looking up each subset of the 7 letters once in the words grouped by 
+        letter set.
+
+        Example:
+            >>> next(SpellingBee.puzzles(min_answers=20))
+            SpellingBeePuzzle(center='a', letters='abcdefk', answer_count=82, score=285, pangram_count=1)
+
+        Args:
+            min_answers (int):
+                The minimum number of answers.
+            max_answers (int | None):
+                The maximum number of answers, None for no maximum.
+            exclude (str):
+                Letters that can't be in a puzzle. The New York Times never 
+                uses 's'.
+            lexicon (Lexicon | None):
+                The words to use, the default dictionary if not given.
+
+        Returns:
+            Iterator[SpellingBeePuzzle]:
+                The puzzles, in alphabetical order of their letters and then 
+                their center.
+        """
+        if lexicon is None:
+            lexicon = get_lexicon()
+
+        scores = cls._letter_set_scores(lexicon)
+        excluded = letter_mask(exclude.lower()) if exclude else 0
+
+        pangram_sets = sorted(
+            (''.join(c for i, c in enumerate(ALPHABET_LOWER) if mask >> i & 1), mask) 
+            for mask in scores if mask.bit_count() == cls.LETTER_COUNT and not mask & excluded)
+
+        for letters, mask in pangram_sets:
+            bits = [1 << i for i in range(26) if mask >> i & 1]
+            counts = [0] * cls.LETTER_COUNT
+            totals = [0] * cls.LETTER_COUNT
+
+            for submask in _submasks(mask):
+                if submask in scores:
+                    count, score = scores[submask]
+
+                    for j, bit in enumerate(bits):
+                        if submask & bit:
+                            counts[j] += count
+                            totals[j] += score
+
+            for j, center in enumerate(letters):
+                if counts[j] >= min_answers and (max_answers is None or counts[j] <= max_answers):
+                    yield SpellingBeePuzzle(center, letters, counts[j], totals[j], scores[mask][0])
+
+#endregion
+
+
+#region Word Ladder
+
+class LadderBand(NamedTuple):
+    """
+    How well connected the words of one length are by word ladders, see
+    `ladder_report`.
+
+    Attributes:
+        length (int):
+            The number of letters in the words.
+        word_count (int):
+            The number of words of that length.
+        component_count (int):
+            The number of groups of words that can be laddered between.
+        largest (int):
+            The number of words in the largest group.
+        isolated (int):
+            The number of words that differ by one letter from no other word.
+    """
+    length: int
+    word_count: int
+    component_count: int
+    largest: int
+    isolated: int
+
+
+def _ladder_ids(word: str, index: dict[str, list[int]]) -> Iterator[int]:
+    """ The positions of the words in every wildcard bucket of a word, see `Lexicon.wildcard_index`. """
+    for position in range(len(word)):
+        yield from index.get(word[:position] + MISSING_CHARACTERS[0] + word[position + 1:], ())
+
+def ladder_neighbors(word: str, lexicon: Lexicon | None=None) -> list[str]:
+    """
+    Finds the words that differ from a word by exactly one letter, the next 
+    steps of a word ladder.
+    E.g. 'cat' -> ['bat', 'cab', 'cad', ..., 'cot', 'cut', ...]
+
+    Args:
+        word (str):
+            The word.
+        lexicon (Lexicon | None):
+            The words to use, the default dictionary if not given.
+
+    Returns:
+        list[str]:
+            The words, in alphabetical order.
+    """
+    if lexicon is None:
+        lexicon = get_lexicon()
+
+    word = word.lower()
+    words = lexicon.words_of_length(len(word))
+    ids = set(_ladder_ids(word, lexicon.wildcard_index(len(word))))
+
+    return sorted(words[i] for i in ids if words[i] != word)
+
+def word_ladder(start: str, end: str, lexicon: Lexicon | None=None) -> list[str] | None:
+    """
+    Finds one of the shortest word ladders (doublets) between two words, 
+    changing one letter at a time so every step is a word.
+    E.g. ('cold', 'warm') -> ['cold', 'cord', 'card', 'ward', 'warm']
+
+    Searches outwards from both words at once, a whole step at a time from 
+    whichever side has fewer words to try, until the two searches meet. The 
+    next steps from a word are found with a few lookups in the lexicon's 
+    wildcard index (see `Lexicon.wildcard_index`) rather than comparing 
+    against every word of that length.
+
+    Args:
+        start (str):
+            The first word.
+        end (str):
+            The last word, the same length as the first.
+        lexicon (Lexicon | None):
+            The words to use, the default dictionary if not given.
+
+    Raises:
+        ValueError:
+            If the words are empty or not the same length.
+
+    Returns:
+        list[str] | None:
+            The ladder from start to end, including both, or None if there 
+            isn't one.
+    """
+    start, end = start.lower(), end.lower()
+
+    if not start or len(start) != len(end):
+        raise ValueError(f"Words must be the same length and not empty: '{start}', '{end}'")
+
+    if start == end:
+        return [start]
+
+    if lexicon is None:
+        lexicon = get_lexicon()
+
+    words = lexicon.words_of_length(len(start))
+    index = lexicon.wildcard_index(len(start))
+
+    # The word each word was reached from, on each side
+    parents = ({start: None}, {end: None})
+    frontiers = ([start], [end])
+
+    while frontiers[0] and frontiers[1]:
+        side = 0 if len(frontiers[0]) <= len(frontiers[1]) else 1
+        parent, other = parents[side], parents[1 - side]
+        frontier, meeting = [], None
+
+        for word in frontiers[side]:
+            for i in _ladder_ids(word, index):
+                neighbor = words[i]
+
+                if neighbor in parent:
+                    continue
+
+                parent[neighbor] = word
+                frontier.append(neighbor)
+
+                if meeting is None and neighbor in other:
+                    meeting = neighbor
+
+        if meeting is not None:
+            return _ladder_path(meeting, parents[0], parents[1])
+
+        frontiers = (frontier, frontiers[1]) if side == 0 else (frontiers[0], frontier)
+
+    return None
+
+def _ladder_path(meeting: str, forward: dict[str, str | None], backward: dict[str, str | None]) -> list[str]:
+    """ Joins the two halves of a ladder found by `word_ladder` where they meet. """
+    path = []
+    word = meeting
+
+    while word is not None:
+        path.append(word)
+        word = forward[word]
+
+    path.reverse()
+    word = backward[meeting]
+
+    while word is not None:
+        path.append(word)
+        word = backward[word]
+
+    return path
+
+def ladder_components(length: int, lexicon: Lexicon | None=None) -> list[list[str]]:
+    """
+    Splits the words of a certain length into groups, where there is a word 
+    ladder between any two words in the same group and none between words 
+    in different groups.
+
+    Every wildcard bucket (see `Lexicon.wildcard_index`) is merged into one 
+    group, which is much quicker than searching from every word.
+
+    Args:
+        length (int):
+            The number of letters in the words.
+        lexicon (Lexicon | None):
+            The words to use, the default dictionary if not given.
+
+    Returns:
+        list[list[str]]:
+            The groups, largest first, each in alphabetical order. Words with 
+            other characters (e.g. apostrophes) are left out.
+    """
+    if lexicon is None:
+        lexicon = get_lexicon()
+
+    words = lexicon.words_of_length(length)
+    parent = list(range(len(words)))
+
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+
+        return i
+
+    for ids in lexicon.wildcard_index(length).values():
+        root = find(ids[0])
+
+        for i in ids[1:]:
+            parent[find(i)] = root
+            root = find(root)
+
+    groups = {}
+
+    for i, word in enumerate(words):
+        if word.isalpha():
+            groups.setdefault(find(i), []).append(word)
+
+    return sorted(groups.values(), key=len, reverse=True)
+
+def ladder_report(min_len: int=2, max_len: int | None=None, lexicon: Lexicon | None=None) -> list[LadderBand]:
+    """
+    Reports how well connected the words of each length are by word ladders, 
+    see `ladder_components`.
+
+    Args:
+        min_len (int):
+            The shortest words to report on.
+        max_len (int | None):
+            The longest words to report on, None for the longest in the 
+            dictionary.
+        lexicon (Lexicon | None):
+            The words to use, the default dictionary if not given.
+
+    Returns:
+        list[LadderBand]:
+            One band for each length with words, in order of length.
+    """
+    if lexicon is None:
+        lexicon = get_lexicon()
+
+    report = []
+
+    for length, count in lexicon.length_histogram().items():
+        if length < min_len or (max_len is not None and length > max_len):
+            continue
+
+        components = ladder_components(length, lexicon)
+
+        if components:
+            report.append(LadderBand(
+                length, 
+                sum(map(len, components)), 
+                len(components), 
+                len(components[0]), 
+                sum(len(component) == 1 for component in components)))
+
+    return report
+
+#endregion
+
+
+#region Boggle
+
+BOGGLE_MIN_WORD_LEN = 3
+
+# The 16 dice of modern Boggle, a 'q' face is read as 'qu'
+BOGGLE_DICE = (
+    'aaeegn', 'abbjoo', 'achops', 'affkps', 'aoottw', 'cimotu', 'deilrx', 'delrvy', 
+    'distty', 'eeghnw', 'eeinsu', 'ehrtvw', 'eiosst', 'elrtty', 'himnqu', 'hlnnrz')
+
+# Points for each word length, longer words score the same as the longest
+BOGGLE_SCORES = {3: 1, 4: 1, 5: 2, 6: 3, 7: 5, 8: 11}
+
+# The trie used by a worker process, see `boggle_batch`
+_worker_trie: Trie | None = None
+
+
+def random_boggle(size: int=4, rng: random.Random | None=None) -> list[str]:
+    """
+    Shakes a random Boggle grid, rolling the Boggle dice (BOGGLE_DICE) in a 
+    random order. Grids bigger than 4 x 4 use the dice more than once.
+
+    Args:
+        size (int):
+            The number of rows and columns.
+        rng (random.Random | None):
+            The random number generator, the random module if not given.
+
+    Raises:
+        ValueError:
+            If size is less than 1.
+
+    Returns:
+        list[str]:
+            The rows of the grid.
+    """
+    if size <= 0:
+        raise ValueError(f"size cannot be less than 1: {size}")
+
+    rng = rng or random
+    dice = [BOGGLE_DICE[i % len(BOGGLE_DICE)] for i in range(size * size)]
+    rng.shuffle(dice)
+    letters = [rng.choice(die) for die in dice]
+
+    return [''.join(letters[i:i + size]) for i in range(0, size * size, size)]
+
+def _boggle_cells(grid: list[str] | list[list[str]]) -> tuple[list[str], list[list[int]]]:
+    """
+    Returns the letters of every cell of a grid, row by row, with 'q' read as
+    'qu', and the cells next to (including diagonally) each cell.
+    """
+    if not grid or not grid[0] or any(len(row) != len(grid[0]) for row in grid):
+        raise ValueError(f"Grid must have at least 1 row and all rows must be the same length: {grid}")
+
+    n_rows, n_cols = len(grid), len(grid[0])
+    cells = ['qu' if cell.lower() == 'q' else cell.lower() for row in grid for cell in row]
+    neighbours = []
+
+    for i in range(n_rows):
+        for j in range(n_cols):
+            neighbours.append([
+                a * n_cols + b 
+                for a in range(max(i - 1, 0), min(i + 2, n_rows)) 
+                for b in range(max(j - 1, 0), min(j + 2, n_cols)) 
+                if (a, b) != (i, j)])
+
+    return cells, neighbours
+
+def _boggle_words(grid: list[str] | list[list[str]], min_len: int, trie: Trie) -> list[str]:
+    """
+    Finds the words in a grid by walking the trie along every path, see 
+    `boggle`.
+    """
+    cells, neighbours = _boggle_cells(grid)
+    found = set()
+
+    def walk(cell: int, node: int, word: str, used: int) -> None:
+        if len(word) >= min_len and trie.is_word(node):
+            found.add(word)
+
+        for n in neighbours[cell]:
+            if not used & (1 << n):
+                child = trie.node(cells[n], node)
+
+                if child is not None:
+                    walk(n, child, word + cells[n], used | (1 << n))
+
+    for cell, letters in enumerate(cells):
+        node = trie.node(letters)
+
+        if node is not None:
+            walk(cell, node, letters, 1 << cell)
+
+    return sorted(found)
+
+def boggle(grid: list[str] | list[list[str]], 
+        min_len: int=BOGGLE_MIN_WORD_LEN, 
+        lexicon: Lexicon | None=None) -> list[str]:
+    """
+    Solves a Boggle grid, finding every word that can be spelt by moving from 
+    letter to neighbouring letter (including diagonally) without using a 
+    letter twice.
+
+    The paths are walked along the lexicon's trie (see `Lexicon.trie`), so a 
+    path is given up as soon as no word starts with its letters.
+
+    Example:
+        >>> boggle(['cat', 'ore', 'dog'], min_len=6)
+        ['coater', 'doater', 'odorate', 'orgeat']
+
+    Args:
+        grid (list[str] | list[list[str]]):
+            The rows of the grid, any size. Each row is a string of letters or
+            a list of cells. A 'q' cell is read as 'qu', as on the dice.
+        min_len (int):
+            The minimum word length.
+        lexicon (Lexicon | None):
+            The words to use, the default dictionary if not given.
+
+    Raises:
+        ValueError:
+            If the rows are empty or not all the same length.
+
+    Returns:
+        list[str]:
+            The words, in alphabetical order.
+    """
+    if lexicon is None:
+        lexicon = get_lexicon()
+
+    return _boggle_words(grid, min_len, lexicon.trie)
+
+def boggle_score(words: list[str]) -> int:
+    """
+    Returns the Boggle score of a list of words, see BOGGLE_SCORES. Words
+    shorter than 3 letters score nothing.
+
+    Args:
+        words (list[str]):
+            The words.
+
+    Returns:
+        int
+    """
+    longest = max(BOGGLE_SCORES)
+
+    return sum(BOGGLE_SCORES.get(min(len(word), longest), 0) for word in words)
+
+def _init_boggle_worker(trie: Trie) -> None:
+    global _worker_trie
+    _worker_trie = trie
+
+def _boggle_worker(args: tuple[list[str] | list[list[str]], int]) -> list[str]:
+    grid, min_len = args
+
+    return _boggle_words(grid, min_len, _worker_trie)
+
+def boggle_batch(grids: list[list[str]] | list[list[list[str]]], 
+        min_len: int=BOGGLE_MIN_WORD_LEN, 
+        processes: int | None=1, 
+        lexicon: Lexicon | None=None) -> list[list[str]]:
+    """
+    Solves many Boggle grids at once, e.g. to grade random grids. See 
+    `boggle`.
+
+    Example:
+        >>> grids = [random_boggle() for _ in range(1000)]
+        >>> scores = [boggle_score(words) for words in boggle_batch(grids, processes=None)]
+
+    Args:
+        grids (list[list[str]] | list[list[list[str]]]):
+            The grids.
+        min_len (int):
+            The minimum word length.
+        processes (int | None):
+            The number of processes to solve them with, None for one per cpu.
+            Each process is sent the trie once.
+        lexicon (Lexicon | None):
+            The words to use, the default dictionary if not given.
+
+    Raises:
+        ValueError:
+            If a grid's rows are empty or not all the same length.
+
+    Returns:
+        list[list[str]]:
+            The words in each grid, in alphabetical order.
+    """
+    if lexicon is None:
+        lexicon = get_lexicon()
+
+    trie = lexicon.trie
+
+    if processes == 1:
+        return [_boggle_words(grid, min_len, trie) for grid in grids]
+
+    with Pool(processes, initializer=_init_boggle_worker, initargs=(trie,)) as pool:
+        return pool.map(_boggle_worker, [(grid, min_len) for grid in grids], chunksize=64)
+
+#endregion
+
+
+#region Scrabble
+
+SCRABBLE_BLANK = '?'
+SCRABBLE_RACK_SIZE = 7
+
+# Using every tile of a full rack in one word scores a bonus
+SCRABBLE_BINGO_BONUS = 50
+
+SCRABBLE_LETTER_SCORES = {
+    'a': 1, 'b': 3, 'c': 3, 'd': 2, 'e': 1, 'f': 4, 'g': 2, 'h': 4, 'i': 1, 
+    'j': 8, 'k': 5, 'l': 1, 'm': 3, 'n': 1, 'o': 1, 'p': 3, 'q': 10, 'r': 1, 
+    's': 1, 't': 1, 'u': 1, 'v': 4, 'w': 4, 'x': 8, 'y': 4, 'z': 10}
+
+
+class ScrabbleWord(NamedTuple):
+    """
+    A word that can be played from a Scrabble rack.
+
+    Attributes:
+        word (str):
+            The word.
+        score (int):
+            The points for the word's tiles, plus SCRABBLE_BINGO_BONUS if it 
+            uses every tile of a full rack. Board premium squares aren't 
+            counted.
+        blanks (tuple[int, ...]):
+            The positions in the word of the letters played with blanks.
+    """
+    word: str
+    score: int
+    blanks: tuple[int, ...]
+
+
+def scrabble(rack: str, 
+        top: int | None=10, 
+        min_len: int=2, 
+        lexicon: Lexicon | None=None) -> list[ScrabbleWord]:
+    """
+    Finds the highest scoring words that can be made from a Scrabble rack, 
+    where each tile is used at most once and a blank (SCRABBLE_BLANK) can be 
+    any letter but scores nothing. 
+
+    The words are found by walking the lexicon's trie (see `Lexicon.trie`), 
+    using a real tile for a letter when there is one, as a blank would score 
+    less. Only the best `top` words are kept, and once there are that many a
+    branch is skipped if even using every tile left couldn't beat the worst 
+    of them.
+
+    Example:
+        >>> scrabble('quizeb?', top=2)
+        [ScrabbleWord(word='bezique', score=76, blanks=(6,)), ScrabbleWord(word='quinze', score=23, blanks=(3,))]
+
+    Args:
+        rack (str):
+            The tiles, letters and blanks. Any case.
+        top (int | None):
+            The number of words to find, None for every word.
+        min_len (int):
+            The minimum word length.
+        lexicon (Lexicon | None):
+            The words to use, the default dictionary if not given.
+
+    Raises:
+        ValueError:
+            If the rack has anything other than letters and blanks, or top is
+            less than 1.
+
+    Returns:
+        list[ScrabbleWord]:
+            The words, highest score first and then alphabetically.
+    """
+    rack = rack.lower()
+
+    if any(tile != SCRABBLE_BLANK and tile not in SCRABBLE_LETTER_SCORES for tile in rack):
+        raise ValueError(f"Rack must only have letters and '{SCRABBLE_BLANK}': '{rack}'")
+
+    if top is not None and top <= 0:
+        raise ValueError(f"top cannot be less than 1: {top}")
+
+    if lexicon is None:
+        lexicon = get_lexicon()
+
+    trie = lexicon.trie
+    tiles = Counter(rack)
+    bonus = SCRABBLE_BINGO_BONUS if len(rack) == SCRABBLE_RACK_SIZE else 0
+
+    # (score, -order found) so the worst word, lowest score and then last 
+    # alphabetically, is at the top of the heap
+    heap = []
+    word, blanks = [], []
+    found = 0
+
+    def walk(node: int, score: int, left: int) -> None:
+        nonlocal found
+
+        if len(word) >= min_len and trie.is_word(node):
+            total = score + (bonus if len(word) == len(rack) else 0)
+            entry = (total, -found, ScrabbleWord(''.join(word), total, tuple(blanks)))
+            found += 1
+
+            if top is None or len(heap) < top:
+                heapq.heappush(heap, entry)
+            elif total > heap[0][0]:
+                heapq.heapreplace(heap, entry)
+
+        if len(word) == len(rack):
+            return
+
+        # The best any longer word could do is use every tile left
+        if top is not None and len(heap) == top and score + left + bonus <= heap[0][0]:
+            return
+
+        for letter, child in trie.children(node).items():
+            if tiles[letter]:
+                tile, value = letter, SCRABBLE_LETTER_SCORES[letter]
+            elif tiles[SCRABBLE_BLANK] and letter in SCRABBLE_LETTER_SCORES:
+                tile, value = SCRABBLE_BLANK, 0
+                blanks.append(len(word))
+            else:
+                continue
+
+            tiles[tile] -= 1
+            word.append(letter)
+
+            walk(child, score + value, left - value)
+
+            word.pop()
+            tiles[tile] += 1
+
+            if tile == SCRABBLE_BLANK:
+                blanks.pop()
+
+    walk(Trie.ROOT, 0, sum(SCRABBLE_LETTER_SCORES.get(tile, 0) for tile in rack))
+
+    return [entry[-1] for entry in sorted(heap, key=lambda entry: (-entry[0], -entry[1]))]
+
+#endregion
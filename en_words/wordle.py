@@ -0,0 +1,623 @@
+"""
+wordle.py
+---------
+
+A Wordle solver that ranks guesses by how much they are expected to narrow
+down the answer.
+
+The feedback for a guess against an answer is a pattern of 5 colours, stored
+as a base 3 number (0 to 242) so the whole guess x answer table fits in a
+uint8 matrix. Position i is the digit 3 ** i and each colour is a digit,
+b (grey) = 0, y (yellow) = 1, g (green) = 2. E.g. 'gybbb' -> 2 + 1 * 3 = 5
+Longer words need a wider matrix, see `pattern_dtype`.
+
+The matrix for the dictionary's 5 letter words is built once (in parallel if
+asked for) and saved alongside the dictionary as a .npy file, which is memory
+mapped on every later run, see `WordleSolver`.
+
+Requires numpy, which is optional. `WordleSolver` raises an ImportError if it
+is not installed. `WordleConstraints` narrows down the answer from the 
+feedback to each guess without numpy.
+"""
+
+import os
+
+from multiprocessing import Pool
+from typing import Self
+
+from en_words.bitsets import bit_positions, bitset_from_ids
+from en_words.compiled import _replace, is_stale
+from en_words.en_words import _FILENAME_SORTED, Lexicon, get_lexicon
+from en_words.matrices import np, require_numpy, word_matrix
+
+
+#region Globals
+
+WORD_LENGTH = 5
+
+# Grey (black), yellow, green
+FEEDBACK_CHARACTERS = 'byg'
+
+PATTERN_COUNT = 3 ** WORD_LENGTH
+
+# The longest words whose patterns fit in a uint16 matrix
+MAX_LENGTH = 10
+
+MATRIX_EXTENSION = '.wordle.npy'
+
+#endregion
+
+
+def wordle_feedback(guess: str, answer: str) -> str:
+    """
+    Scores a guess against an answer. A letter is green (g) if it is in the
+    right place, yellow (y) if it is elsewhere in the answer and grey (b)
+    otherwise. A repeated letter is only yellow as many times as the answer
+    has spare copies of it, e.g. ('eerie', 'there') -> 'ybybg'
+
+    Args:
+        guess (str):
+            The lowercase guess.
+        answer (str):
+            The lowercase answer, the same length as the guess.
+
+    Returns:
+        str
+    """
+    feedback = ['b'] * len(guess)
+    spare = {}
+
+    for i, (g, a) in enumerate(zip(guess, answer)):
+        if g == a:
+            feedback[i] = 'g'
+        else:
+            spare[a] = spare.get(a, 0) + 1
+
+    for i, g in enumerate(guess):
+        if feedback[i] != 'g' and spare.get(g, 0) > 0:
+            feedback[i] = 'y'
+            spare[g] -= 1
+
+    return ''.join(feedback)
+
+def pattern_from_feedback(feedback: str) -> int:
+    """
+    Converts feedback to its base 3 pattern. E.g. 'gybbb' -> 5
+
+    Args:
+        feedback (str):
+            The feedback, a string of FEEDBACK_CHARACTERS.
+
+    Raises:
+        ValueError:
+            If the feedback contains any other characters.
+
+    Returns:
+        int
+    """
+    pattern = 0
+
+    for c in reversed(feedback.lower()):
+        if c not in FEEDBACK_CHARACTERS:
+            raise ValueError(f"Feedback must only contain '{FEEDBACK_CHARACTERS}': '{feedback}'")
+
+        pattern = pattern * 3 + FEEDBACK_CHARACTERS.index(c)
+
+    return pattern
+
+def feedback_from_pattern(pattern: int, length: int=WORD_LENGTH) -> str:
+    """
+    Converts a base 3 pattern back to feedback. E.g. 5 -> 'gybbb'
+
+    Args:
+        pattern (int):
+            The pattern.
+        length (int):
+            The number of letters in the guess.
+
+    Returns:
+        str
+    """
+    feedback = []
+
+    for _ in range(length):
+        pattern, digit = divmod(pattern, 3)
+        feedback.append(FEEDBACK_CHARACTERS[digit])
+
+    return ''.join(feedback)
+
+def pattern_dtype(length: int=WORD_LENGTH):
+    """
+    Returns the unsigned integer type of the feedback matrix for a word
+    length, the smallest that holds every pattern, 0 to 3 ** length - 1.
+    E.g. 5 -> uint8, 6 -> uint16
+
+    Args:
+        length (int):
+            The number of letters.
+
+    Raises:
+        ImportError:
+            If numpy is not installed.
+        ValueError:
+            If the length is more than MAX_LENGTH.
+
+    Returns:
+        numpy.dtype
+    """
+    require_numpy()
+
+    if length > MAX_LENGTH:
+        raise ValueError(f"Words must be at most {MAX_LENGTH} letters: {length}")
+
+    return np.dtype(np.uint8 if 3 ** length <= 256 else np.uint16)
+
+def feedback_matrix(guesses: list[str], answers: list[str], processes: int | None=1):
+    """
+    Creates the (n_guesses, n_answers) matrix of the patterns of every guess
+    against every answer, see `wordle_feedback`.
+
+    Args:
+        guesses (list[str]):
+            Lowercase words, all of the same length, at most MAX_LENGTH.
+        answers (list[str]):
+            Lowercase words, the same length as the guesses.
+        processes (int | None):
+            The number of processes to build the matrix with, None for one per
+            cpu.
+
+    Raises:
+        ImportError:
+            If numpy is not installed.
+        ValueError:
+            If the words are more than MAX_LENGTH letters.
+
+    Returns:
+        numpy.ndarray:
+            A matrix of `pattern_dtype` of the length, uint8 for 5 letters.
+    """
+    require_numpy()
+
+    length = len(guesses[0]) if guesses else WORD_LENGTH
+    pattern_dtype(length)
+
+    guess_matrix = word_matrix(guesses, length)
+    answer_matrix = word_matrix(answers, length)
+
+    processes = processes or os.cpu_count() or 1
+
+    if processes == 1 or len(guesses) < 1000:
+        return _feedback_rows((guess_matrix, answer_matrix))
+
+    chunks = [(rows, answer_matrix) for rows in np.array_split(guess_matrix, processes * 4)]
+
+    with Pool(processes) as pool:
+        return np.vstack(pool.map(_feedback_rows, chunks))
+
+def _feedback_rows(args: tuple):
+    """
+    Creates the pattern matrix for a block of guesses against every answer, a
+    few hundred guesses at a time with whole array operations.
+    """
+    guess_matrix, answer_matrix = args
+    length = answer_matrix.shape[1]
+    dtype = pattern_dtype(length)
+
+    # How many times each character is in each answer
+    codes, answer_codes = np.unique(answer_matrix, return_inverse=True)
+    answer_codes = answer_codes.reshape(answer_matrix.shape)
+    counts = np.zeros((len(codes) + 1, len(answer_matrix)), dtype=np.int8)
+
+    for k in range(length):
+        np.add.at(counts, (answer_codes[:, k], np.arange(len(answer_matrix))), 1)
+
+    # Guess characters not in any answer use the last (empty) row of counts
+    guess_codes = np.searchsorted(codes, guess_matrix)
+    guess_codes[(guess_codes == len(codes)) | (codes[np.minimum(guess_codes, len(codes) - 1)] != guess_matrix)] = len(codes)
+
+    patterns = np.zeros((len(guess_matrix), len(answer_matrix)), dtype=dtype)
+    block = max(1, 2 ** 21 // max(1, len(answer_matrix)))
+
+    for start in range(0, len(guess_matrix), block):
+        guesses = guess_matrix[start:start + block]
+        codes_block = guess_codes[start:start + block]
+        green = [guesses[:, k:k + 1] == answer_matrix[:, k] for k in range(length)]
+        pattern = np.zeros((len(guesses), len(answer_matrix)), dtype=dtype)
+
+        for i in range(length):
+            # A letter that isn't green is yellow if the answer has more
+            # copies of it that aren't green than there are earlier copies in
+            # the guess that aren't green, i.e. copies in the answer minus all
+            # earlier copies in the guess and any later green copies
+            spare = counts[codes_block[:, i]]
+
+            for k in range(length):
+                same = (guesses[:, k] == guesses[:, i])[:, None]
+                spare = spare - same if k < i else spare - (same & green[k])
+
+            yellow = ~green[i] & (spare > 0)
+
+            pattern += dtype.type(3 ** i) * (green[i] * dtype.type(2) + yellow)
+
+        patterns[start:start + block] = pattern
+
+    return patterns
+
+def matrix_filename(filename_sorted: str) -> str:
+    """
+    Returns the name of the feedback matrix file that sits alongside a sorted
+    dictionary. E.g. en_words_sorted.txt -> en_words_sorted.wordle.npy
+
+    Args:
+        filename_sorted (str):
+            The name of the file containing the sorted dictionary.
+
+    Returns:
+        str
+    """
+    return os.path.splitext(filename_sorted)[0] + MATRIX_EXTENSION
+
+
+class WordleSolver:
+    """
+    Ranks Wordle guesses by their expected information gain (entropy).
+
+    Each guess splits the remaining candidates into groups by the feedback
+    they would give. The more evenly it splits them, the less is left to guess
+    on average, so the best guess is the one whose groups have the highest
+    entropy. The groups are counted with a histogram of a slice of the
+    feedback matrix.
+
+    Example:
+        >>> solver = WordleSolver()
+        >>> solver.best_guess()
+        'tares'
+        >>> candidates = solver.candidates([('tares', 'byyyb')])
+        >>> solver.rank_guesses(candidates, top=3)
+        [...]
+
+    Attributes:
+        words (list[str]):
+            The words that can be guessed and can be the answer.
+        matrix (numpy.ndarray):
+            The (n_words, n_words) matrix of guess x answer patterns, uint8
+            for 5 letter words, see `pattern_dtype`.
+    """
+
+    def __init__(self,
+            words: list[str] | None=None,
+            filename_sorted: str=_FILENAME_SORTED,
+            processes: int | None=1):
+        """
+        Loads or builds the feedback matrix.
+
+        Without a list of words the dictionary's 5 letter words are used, and
+        the matrix is memory mapped from the file alongside the dictionary,
+        see `matrix_filename`. It is (re)built and saved if it is missing or
+        older than the dictionary.
+
+        Args:
+            words (list[str] | None):
+                Lowercase words of the same length, at most MAX_LENGTH, or
+                None for the 5 letter words of the dictionary.
+            filename_sorted (str):
+                The name of the file containing the sorted dictionary.
+            processes (int | None):
+                The number of processes to build the matrix with, None for one
+                per cpu. Scripts that use more than one process must be 
+                guarded by `if __name__ == '__main__':` on platforms that 
+                spawn processes (Windows and macOS).
+
+        Raises:
+            ImportError:
+                If numpy is not installed.
+            ValueError:
+                If the words are not all the same length, or are more than
+                MAX_LENGTH letters.
+        """
+        require_numpy()
+
+        if words is not None:
+            self.words = sorted(set(words))
+
+            if len({len(word) for word in self.words}) > 1:
+                raise ValueError("Words must all be the same length")
+
+            self.matrix = feedback_matrix(self.words, self.words, processes)
+
+        else:
+            words = get_lexicon(filename_sorted).words_of_length(WORD_LENGTH)
+            self.words = [word for word in words if word.isalpha()]
+            self.matrix = self._load_matrix(matrix_filename(filename_sorted), filename_sorted, processes)
+
+        self._ids = {word: i for i, word in enumerate(self.words)}
+
+    def _load_matrix(self, filename_matrix: str, filename_sorted: str, processes: int | None):
+        """
+        Memory maps the saved matrix, building and saving it first if needed.
+        """
+        shape = (len(self.words), len(self.words))
+
+        if not is_stale(filename_matrix, filename_sorted):
+            try:
+                matrix = np.load(filename_matrix, mmap_mode='r')
+
+                if matrix.shape == shape and matrix.dtype == pattern_dtype(WORD_LENGTH):
+                    return matrix
+
+            except (OSError, ValueError):
+                pass
+
+        matrix = feedback_matrix(self.words, self.words, processes)
+
+        try:
+            with _replace(filename_matrix) as f:
+                np.save(f, matrix)
+
+        except OSError:
+            # Read only install, build it each time
+            pass
+
+        return matrix
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+    def __repr__(self) -> str:
+        return f"WordleSolver(words={len(self.words)})"
+
+    def _id(self, word: str) -> int:
+        try:
+            return self._ids[word.lower()]
+        except KeyError:
+            raise ValueError(f"Not a known word: '{word}'") from None
+
+    def feedback(self, guess: str, answer: str) -> str:
+        """
+        Looks up the feedback for a guess against an answer, see
+        `wordle_feedback`.
+
+        Args:
+            guess (str):
+                The guess, a known word.
+            answer (str):
+                The answer, a known word.
+
+        Raises:
+            ValueError:
+                If either word isn't known.
+
+        Returns:
+            str
+        """
+        length = len(self.words[0])
+
+        return feedback_from_pattern(int(self.matrix[self._id(guess), self._id(answer)]), length)
+
+    def candidates(self, history: list[tuple[str, str]], candidates: list[str] | None=None) -> list[str]:
+        """
+        Finds the words that could still be the answer.
+
+        Args:
+            history (list[tuple[str, str]]):
+                The (guess, feedback) pairs so far. E.g. [('tares', 'byyyb')]
+            candidates (list[str] | None):
+                The words to narrow down, None for every word.
+
+        Raises:
+            ValueError:
+                If a guess isn't known or the feedback is invalid.
+
+        Returns:
+            list[str]:
+                The words, in alphabetical order.
+        """
+        ids = self._candidate_ids(candidates)
+
+        for guess, feedback in history:
+            ids = ids[self.matrix[self._id(guess), ids] == pattern_from_feedback(feedback)]
+
+        return [self.words[i] for i in ids.tolist()]
+
+    def _candidate_ids(self, candidates: list[str] | None):
+        if candidates is None:
+            return np.arange(len(self.words))
+
+        return np.array(sorted({self._id(word) for word in candidates}), dtype=np.intp)
+
+    def rank_guesses(self,
+            candidates: list[str] | None=None,
+            top: int | None=10,
+            hard_mode: bool=False) -> list[tuple[str, float]]:
+        """
+        Ranks guesses by their expected information gain, in bits. A guess
+        that could be the answer wins a tie.
+
+        Args:
+            candidates (list[str] | None):
+                The words that could still be the answer, None for every word.
+            top (int | None):
+                The number of guesses to return, None for all of them.
+            hard_mode (bool):
+                Only guess words that could still be the answer.
+
+        Raises:
+            ValueError:
+                If a candidate isn't known.
+
+        Returns:
+            list[tuple[str, float]]:
+                The (guess, entropy) pairs, best first.
+        """
+        ids = self._candidate_ids(candidates)
+
+        if len(ids) == 0:
+            return []
+
+        guesses = ids if hard_mode else np.arange(len(self.words))
+        entropy = np.empty(len(guesses))
+
+        # Histogram a block of guesses at a time, offsetting each row's
+        # patterns so one bincount counts every row separately
+        pattern_count = 3 ** len(self.words[0])
+        block = max(1, 2 ** 22 // max(len(ids), pattern_count))
+
+        for start in range(0, len(guesses), block):
+            rows = guesses[start:start + block]
+            patterns = self.matrix[np.ix_(rows, ids)].astype(np.intp)
+            patterns += (np.arange(len(rows)) * pattern_count)[:, None]
+
+            counts = np.bincount(patterns.ravel(), minlength=len(rows) * pattern_count)
+            counts = counts.reshape(len(rows), pattern_count)
+
+            with np.errstate(divide='ignore', invalid='ignore'):
+                weighted = np.where(counts > 0, counts * np.log2(counts), 0.0)
+
+            entropy[start:start + len(rows)] = np.log2(len(ids)) - weighted.sum(axis=1) / len(ids)
+
+        is_candidate = np.isin(guesses, ids)
+        order = np.lexsort((~is_candidate, -entropy))[:top]
+
+        return [(self.words[guesses[i]], float(entropy[i])) for i in order.tolist()]
+
+    def best_guess(self, candidates: list[str] | None=None, hard_mode: bool=False) -> str | None:
+        """
+        Returns the guess with the highest expected information gain, see
+        `rank_guesses`.
+
+        Args:
+            candidates (list[str] | None):
+                The words that could still be the answer, None for every word.
+            hard_mode (bool):
+                Only guess words that could still be the answer.
+
+        Returns:
+            str | None:
+                The guess, or None if there are no candidates.
+        """
+        ranked = self.rank_guesses(candidates, top=1, hard_mode=hard_mode)
+
+        return ranked[0][0] if ranked else None
+
+
+class WordleConstraints:
+    """
+    The words that could still be the answer, given the feedback to each 
+    guess so far.
+
+    Unlike `potential_words`, the feedback is used exactly: a yellow letter is
+    in the word but not at that position, and repeated letters limit how many
+    copies the word has. E.g. 'speed' -> 'bbyby' means one e, not at position
+    2 or 3.
+
+    The survivors are held as a bitset over the words of the right length
+    (see `Lexicon.positional_index`). Each guess is first turned into bitset
+    operations (greens, yellows and letters that are missing), then only the
+    words that survive those are checked against the exact feedback. So a 
+    guess costs a few bitwise ANDs plus work for the survivors, not a scan of
+    the dictionary.
+
+    Example:
+        >>> constraints = WordleConstraints()
+        >>> constraints.add('tares', 'byyyb').add('beard', 'bygyb')
+        WordleConstraints(length=5, guesses=2, candidates=12)
+        >>> constraints.words()
+        ['arame', 'crake', 'crane', ..., 'grave', 'graze']
+
+    Attributes:
+        length (int):
+            The number of letters in the answer.
+        history (list[tuple[str, str]]):
+            The (guess, feedback) pairs added so far.
+    """
+
+    def __init__(self, length: int=WORD_LENGTH, lexicon: Lexicon | None=None):
+        """
+        Starts with every word of the length made only of letters.
+
+        Args:
+            length (int):
+                The number of letters in the answer.
+            lexicon (Lexicon | None):
+                The words to use, the default dictionary if not given.
+        """
+        if lexicon is None:
+            lexicon = get_lexicon()
+
+        self.length = length
+        self.history = []
+
+        self._words = lexicon.words_of_length(length)
+        self._index = lexicon.positional_index(length)
+        self._survivors = self._index.all
+
+        for c in self._index.characters():
+            if not c.isalpha():
+                self._survivors &= ~self._index.containing(c)
+
+    def __len__(self) -> int:
+        return self._survivors.bit_count()
+
+    def __contains__(self, word: str) -> bool:
+        return word in self.words()
+
+    def __repr__(self) -> str:
+        return f"WordleConstraints(length={self.length}, guesses={len(self.history)}, candidates={len(self)})"
+
+    def add(self, guess: str, feedback: str) -> Self:
+        """
+        Narrows down the candidates with the feedback to a guess.
+
+        Args:
+            guess (str):
+                The word that was guessed, it doesn't have to be a known word.
+            feedback (str):
+                The feedback, a string of FEEDBACK_CHARACTERS. E.g. 'byyyb'
+
+        Raises:
+            ValueError:
+                If the guess or feedback is the wrong length, or the feedback 
+                is invalid.
+
+        Returns:
+            Self:
+                The constraints, so calls can be chained.
+        """
+        guess, feedback = guess.lower(), feedback.lower()
+
+        if len(guess) != self.length or len(feedback) != self.length:
+            raise ValueError(f"Guess and feedback must be {self.length} letters: '{guess}', '{feedback}'")
+
+        if any(c not in FEEDBACK_CHARACTERS for c in feedback):
+            raise ValueError(f"Feedback must only contain '{FEEDBACK_CHARACTERS}': '{feedback}'")
+
+        survivors = self._survivors
+        present = {g for g, f in zip(guess, feedback) if f != 'b'}
+
+        for i, (g, f) in enumerate(zip(guess, feedback)):
+            if f == 'g':
+                survivors &= self._index.at(i, g)
+            elif f == 'y':
+                survivors &= self._index.containing(g) & ~self._index.at(i, g)
+            elif g in present:
+                survivors &= ~self._index.at(i, g)
+            else:
+                survivors &= ~self._index.containing(g)
+
+        # The bitsets can't count letters, so check the exact feedback
+        ids = [i for i in bit_positions(survivors) if wordle_feedback(guess, self._words[i]) == feedback]
+
+        self._survivors = bitset_from_ids(ids, self._index.size)
+        self.history.append((guess, feedback))
+
+        return self
+
+    def words(self) -> list[str]:
+        """
+        Returns the words that could still be the answer.
+
+        Returns:
+            list[str]:
+                The words, in alphabetical order.
+        """
+        return [self._words[i] for i in bit_positions(self._survivors)]
@@ -0,0 +1,92 @@
+import unittest
+
+from en_words.bitsets import PositionalIndex, bit_positions, bitset_from_ids
+
+
+class TestBitsetFromIds(unittest.TestCase):
+    def test_empty(self):
+        result = bitset_from_ids([], 10)
+        expected = 0
+
+        self.assertEqual(result, expected)
+
+    def test_bitset_from_ids(self):
+        result = bitset_from_ids([1, 2, 4, 9], 10)
+        expected = 0b1000010110
+
+        self.assertEqual(result, expected)
+
+
+class TestBitPositions(unittest.TestCase):
+    def test_empty(self):
+        result = list(bit_positions(0))
+        expected = []
+
+        self.assertEqual(result, expected)
+
+    def test_bit_positions(self):
+        result = list(bit_positions(0b1000010110))
+        expected = [1, 2, 4, 9]
+
+        self.assertEqual(result, expected)
+
+
+class TestPositionalIndex(unittest.TestCase):
+    def setUp(self):
+        self.index = PositionalIndex(['bat', 'cat', 'cot', 'dog', 'tab'])
+
+    def test_different_lengths_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            _ = PositionalIndex(['cat', 'cart'])
+
+    def test_all(self):
+        result = list(bit_positions(self.index.all))
+        expected = [0, 1, 2, 3, 4]
+
+        self.assertEqual(result, expected)
+
+    def test_at(self):
+        result = list(bit_positions(self.index.at(0, 'c')))
+        expected = [1, 2]
+
+        self.assertEqual(result, expected)
+
+    def test_at_missing_letter(self):
+        result = self.index.at(0, 'z')
+        expected = 0
+
+        self.assertEqual(result, expected)
+
+    def test_containing(self):
+        result = list(bit_positions(self.index.containing('b')))
+        expected = [0, 4]
+
+        self.assertEqual(result, expected)
+
+    def test_matches_pattern(self):
+        result = list(bit_positions(self.index.matches('c?t')))
+        expected = [1, 2]
+
+        self.assertEqual(result, expected)
+
+    def test_matches_ignore_letters(self):
+        result = list(bit_positions(self.index.matches('??t', ignore_letters='o')))
+        expected = [0, 1]
+
+        self.assertEqual(result, expected)
+
+    def test_matches_required_letters(self):
+        result = list(bit_positions(self.index.matches('???', required_letters='ab')))
+        expected = [0, 4]
+
+        self.assertEqual(result, expected)
+
+    def test_matches_ignored_letter_in_pattern(self):
+        result = self.index.matches('c??', ignore_letters='c')
+        expected = 0
+
+        self.assertEqual(result, expected)
+
+
+if __name__ == '__main__': # pragma no cover
+    unittest.main()
@@ -0,0 +1,247 @@
+import os
+import tempfile
+import unittest
+
+from en_words import compiled
+from en_words.en_words import Lexicon
+
+
+class TestCompiledFilename(unittest.TestCase):
+    def test_compiled_filename(self):
+        result = compiled.compiled_filename(os.path.join("foo", "en_words_sorted.txt"))
+        expected = os.path.join("foo", "en_words_sorted.bin")
+
+        self.assertEqual(result, expected)
+
+
+class TestIndexFile(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.filename = compiled.index_filename(os.path.join(self.directory.name, "words_sorted.txt"), "test")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_index_filename(self):
+        result = os.path.basename(self.filename)
+        expected = "words_sorted.test.pickle"
+
+        self.assertEqual(result, expected)
+
+    def test_write_and_read_index(self):
+        index = {'opst': [1, 2, 3]}
+        compiled.write_index(index, self.filename, "test")
+
+        result = compiled.read_index(self.filename, "test")
+
+        self.assertEqual(result, index)
+
+    def test_read_index_checksum(self):
+        index = {'opst': [1, 2, 3]}
+        compiled.write_index(index, self.filename, "test", checksum=1234)
+
+        result = [compiled.read_index(self.filename, "test", checksum=1234), compiled.read_index(self.filename, "test", checksum=4321)]
+        expected = [index, None]
+
+        self.assertEqual(result, expected)
+
+    def test_read_index_missing_file(self):
+        result = compiled.read_index(self.filename, "test")
+
+        self.assertIsNone(result)
+
+    def test_read_index_wrong_name(self):
+        compiled.write_index({}, self.filename, "test")
+
+        result = compiled.read_index(self.filename, "other")
+
+        self.assertIsNone(result)
+
+    def test_read_index_missing_class(self):
+        # An index of a class that has since been renamed or removed
+        class OldIndex:
+            pass
+
+        OldIndex.__module__, OldIndex.__qualname__ = compiled.__name__, "OldIndex"
+        compiled.OldIndex = OldIndex
+
+        try:
+            compiled.write_index(OldIndex(), self.filename, "test")
+        finally:
+            del compiled.OldIndex
+
+        result = compiled.read_index(self.filename, "test")
+
+        self.assertIsNone(result)
+
+
+class TestCompiledWords(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.directory.name, "words.bin")
+        self.words = ['a', 'i', 'at', 'cat', "i'd", 'post', 'stop', 'café']
+
+        compiled.write_compiled(self.words, self.filename)
+        self.compiled_words = compiled.CompiledWords(self.filename)
+
+    def tearDown(self):
+        self.compiled_words.close()
+        self.directory.cleanup()
+
+    def test_len(self):
+        result = len(self.compiled_words)
+        expected = 8
+
+        self.assertEqual(result, expected)
+
+    def test_write_in_small_buffers(self):
+        filename = os.path.join(self.directory.name, "buffered.bin")
+        buffer_size = compiled._OFFSETS_BUFFER
+        compiled._OFFSETS_BUFFER = 3
+
+        try:
+            compiled.write_compiled(iter(self.words), filename)
+        finally:
+            compiled._OFFSETS_BUFFER = buffer_size
+
+        with open(filename, 'rb') as f, open(self.filename, 'rb') as expected:
+            self.assertEqual(f.read(), expected.read())
+
+    def test_iter(self):
+        result = list(self.compiled_words)
+        expected = self.words
+
+        self.assertEqual(result, expected)
+
+    def test_index(self):
+        self.assertEqual(self.compiled_words[0], 'a')
+        self.assertEqual(self.compiled_words[3], 'cat')
+        self.assertEqual(self.compiled_words[-1], 'café')
+
+    def test_index_out_of_range(self):
+        with self.assertRaises(IndexError):
+            _ = self.compiled_words[8]
+
+    def test_slice(self):
+        result = self.compiled_words[3:7]
+        expected = ['cat', "i'd", 'post', 'stop']
+
+        self.assertEqual(result, expected)
+
+    def test_bands(self):
+        result = self.compiled_words.bands
+        expected = {1: (0, 2), 2: (2, 3), 3: (3, 5), 4: (5, 8)}
+
+        self.assertEqual(result, expected)
+
+    def test_max_len(self):
+        result = self.compiled_words.max_len
+        expected = 4
+
+        self.assertEqual(result, expected)
+
+    def test_band_bytes(self):
+        result = bytes(self.compiled_words.band_bytes(3))
+        expected = b"cati'd"
+
+        self.assertEqual(result, expected)
+
+    def test_metadata(self):
+        result = self.compiled_words.metadata()
+
+        self.assertEqual(result.word_count, 8)
+        self.assertEqual(result.max_len, 4)
+        self.assertEqual(result.length_counts, {1: 2, 2: 1, 3: 2, 4: 3})
+
+    def test_read_metadata(self):
+        result = compiled.read_metadata(self.filename)
+        expected = self.compiled_words.metadata()
+
+        self.assertEqual(result, expected)
+
+    def test_verify(self):
+        self.assertTrue(self.compiled_words.verify())
+
+    def test_verify_corrupt_file(self):
+        with open(self.filename, 'r+b') as f:
+            f.seek(-1, os.SEEK_END)
+            f.write(b'x')
+
+        corrupt = compiled.CompiledWords(self.filename)
+
+        self.assertFalse(corrupt.verify())
+        corrupt.close()
+
+    def test_checksum_depends_on_words(self):
+        filename = os.path.join(self.directory.name, "other.bin")
+        compiled.write_compiled(['a', 'i', 'at', 'cat', "i'd", 'post', 'stop', 'cafe'], filename)
+
+        self.assertNotEqual(compiled.read_metadata(filename).checksum, self.compiled_words.checksum)
+
+    def test_not_compiled_file_raises_value_error(self):
+        filename = os.path.join(self.directory.name, "words.txt")
+
+        with open(filename, 'w') as f:
+            f.write("not a compiled dictionary")
+
+        with self.assertRaises(ValueError):
+            _ = compiled.CompiledWords(filename)
+
+    def test_unsorted_words_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            compiled.write_compiled(['cat', 'a'], self.filename)
+
+
+class TestLexiconCompiled(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.filename_sorted = os.path.join(self.directory.name, "words_sorted.txt")
+
+        with open(self.filename_sorted, 'w') as f:
+            f.write("Stop\npost\ncat\ntops\n")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_lexicon_creates_compiled_file(self):
+        lexicon = Lexicon(self.filename_sorted)
+
+        self.assertTrue(os.path.exists(compiled.compiled_filename(self.filename_sorted)))
+        self.assertEqual(lexicon.anagrams("opts"), ['post', 'stop', 'tops'])
+
+    def test_lexicon_rebuilds_old_version(self):
+        filename_compiled = compiled.compiled_filename(self.filename_sorted)
+        _ = Lexicon(self.filename_sorted)
+
+        with open(filename_compiled, 'r+b') as f:
+            f.seek(4)
+            f.write((compiled.VERSION - 1).to_bytes(2, 'little'))
+
+        lexicon = Lexicon(self.filename_sorted)
+
+        self.assertEqual(lexicon.sorted_words(), ['cat', 'post', 'stop', 'tops'])
+        self.assertEqual(compiled.read_metadata(filename_compiled).word_count, 4)
+
+    def test_lexicon_loads_compiled_file(self):
+        _ = Lexicon(self.filename_sorted)
+        lexicon = Lexicon(self.filename_sorted)
+
+        self.assertIsInstance(lexicon._words, compiled.CompiledWords)
+        self.assertEqual(lexicon.sorted_words(), ['cat', 'post', 'stop', 'tops'])
+
+    def test_lexicon_writes_anagram_index(self):
+        lexicon = Lexicon(self.filename_sorted)
+        _ = lexicon.anagrams("opts")
+
+        self.assertTrue(os.path.exists(compiled.index_filename(self.filename_sorted, "anagrams")))
+        self.assertEqual(Lexicon(self.filename_sorted).anagrams("opts"), ['post', 'stop', 'tops'])
+
+    def test_lexicon_not_compiled(self):
+        lexicon = Lexicon(self.filename_sorted, compiled=False)
+
+        self.assertFalse(os.path.exists(compiled.compiled_filename(self.filename_sorted)))
+        self.assertEqual(lexicon.sorted_words(), ['cat', 'post', 'stop', 'tops'])
+
+
+if __name__ == '__main__': # pragma no cover
+    unittest.main()
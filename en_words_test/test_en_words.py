@@ -1,7 +1,17 @@
+import os
+import subprocess
+import sys
+import tempfile
 import types
 import unittest
 
+from collections.abc import Iterator
+from unittest.mock import patch
+
+from en_words import compiled
 from en_words import en_words
+from en_words import letters
+from en_words import matrices
 
 class TestWords(unittest.TestCase):
     def test_dict_length(self):
@@ -14,6 +24,13 @@ class TestWords(unittest.TestCase):
         expected = 'dichlorodiphenyltrichloroethane'
         self.assertEqual(result, expected)
 
+    def test_length_histogram(self):
+        result = en_words.length_histogram()
+
+        self.assertEqual(sum(result.values()), en_words.word_count())
+        self.assertEqual(max(result), len(en_words.find_largest_word()))
+        self.assertEqual(result[5], len(en_words.words_of_length(5)))
+
     def test_potential_words(self):
         word = '_?tt-e'
         result = len(en_words.potential_words(word))
@@ -41,6 +58,109 @@ class TestWords(unittest.TestCase):
         self.assertEqual(result, expected)
 
 
+class TestCreateSortedDict(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.filename_sorted = os.path.join(self.directory.name, "words_sorted.txt")
+        self.filenames = [os.path.join(self.directory.name, f"words_{i}.txt") for i in range(2)]
+
+        with open(self.filenames[0], 'w') as f:
+            f.write("Stop\ncat\npost\n  zebra \n\nA\n")
+
+        with open(self.filenames[1], 'w') as f:
+            f.write("tops\nstop\nCAT\nact\n")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_sorted_lowercase_and_unique(self):
+        en_words.create_sorted_dict(self.filenames, self.filename_sorted, chunk_size=2, build_indexes=False)
+        result = en_words.sorted_words(self.filename_sorted)
+        expected = ['a', 'act', 'cat', 'post', 'stop', 'tops', 'zebra']
+
+        self.assertEqual(result, expected)
+
+    def test_single_file(self):
+        en_words.create_sorted_dict(self.filenames[1], self.filename_sorted, build_indexes=False)
+        result = en_words.sorted_words(self.filename_sorted)
+        expected = ['act', 'cat', 'stop', 'tops']
+
+        self.assertEqual(result, expected)
+
+    def test_chunk_size_does_not_change_result(self):
+        en_words.create_sorted_dict(self.filenames, self.filename_sorted, chunk_size=1, build_indexes=False)
+        result = en_words.sorted_words(self.filename_sorted)
+
+        en_words.create_sorted_dict(self.filenames, self.filename_sorted, build_indexes=False)
+        expected = en_words.sorted_words(self.filename_sorted)
+
+        self.assertEqual(result, expected)
+
+    def test_writes_compiled_and_indexes(self):
+        en_words.create_sorted_dict(self.filenames, self.filename_sorted)
+
+        self.assertTrue(os.path.exists(compiled.compiled_filename(self.filename_sorted)))
+        self.assertFalse(compiled.is_stale(compiled.compiled_filename(self.filename_sorted), self.filename_sorted))
+
+        for name in ['anagrams', 'letter_masks', 'letter_counts', 'letter_sets', 'alphabetical', 'reversed', 'trie']:
+            self.assertTrue(os.path.exists(compiled.index_filename(self.filename_sorted, name)))
+
+        # Only built when it is used
+        self.assertFalse(os.path.exists(compiled.index_filename(self.filename_sorted, 'deletes')))
+
+    def test_lexicon_reloaded(self):
+        en_words.create_sorted_dict(self.filenames[1], self.filename_sorted, build_indexes=False)
+        _ = en_words.get_lexicon(self.filename_sorted)
+
+        en_words.create_sorted_dict(self.filenames, self.filename_sorted, build_indexes=False)
+        result = en_words.get_lexicon(self.filename_sorted).word_count()
+        expected = 7
+
+        self.assertEqual(result, expected)
+
+    def test_loaded_lexicon_closed_before_replacing(self):
+        en_words.create_sorted_dict(self.filenames[1], self.filename_sorted, build_indexes=False)
+        lexicon = en_words.get_lexicon(self.filename_sorted)
+        closed = []
+
+        def replace(source, destination):
+            closed.append(lexicon._words._mmap.closed)
+            os_replace(source, destination)
+
+        os_replace = os.replace
+
+        with patch.object(compiled.os, 'replace', replace):
+            en_words.create_sorted_dict(self.filenames, self.filename_sorted, build_indexes=False)
+
+        self.assertTrue(closed)
+        self.assertTrue(all(closed))
+
+    def test_index_from_other_dictionary_rebuilt(self):
+        en_words.create_sorted_dict(self.filenames[1], self.filename_sorted)
+        filename_index = compiled.index_filename(self.filename_sorted, 'anagrams')
+
+        with open(filename_index, 'rb') as f:
+            old_index = f.read()
+
+        en_words.create_sorted_dict(self.filenames, self.filename_sorted, build_indexes=False)
+
+        # Newer than the dictionary, but built from the old one
+        with open(filename_index, 'wb') as f:
+            f.write(old_index)
+
+        mtime = os.path.getmtime(self.filename_sorted) + 10
+        os.utime(filename_index, (mtime, mtime))
+
+        result = sorted(en_words.get_lexicon(self.filename_sorted).anagrams('tops'))
+        expected = ['post', 'stop']
+
+        self.assertEqual(result, expected)
+
+    def test_chunk_size_zero_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            en_words.create_sorted_dict(self.filenames, self.filename_sorted, chunk_size=0)
+
+
 class TestUnsortedWords(unittest.TestCase):
     def test_unsorted_words_returns_list(self):
         result = en_words.unsorted_words()
@@ -237,6 +357,20 @@ class TestAnagrams(unittest.TestCase):
         self.assertEqual(result, expected)
 
 
+class TestAnagramSignature(unittest.TestCase):
+    def test_anagram_signature(self):
+        result = en_words.anagram_signature("stop")
+        expected = "opst"
+
+        self.assertEqual(result, expected)
+
+    def test_anagrams_share_signature(self):
+        result = en_words.anagram_signature("spot")
+        expected = en_words.anagram_signature("tops")
+
+        self.assertEqual(result, expected)
+
+
 class TestAnagramsGen(unittest.TestCase):
     def test_anagrams_gen(self):
         result = list(en_words.anagrams_gen("opts"))
@@ -254,5 +388,381 @@ class TestAnagramsGen(unittest.TestCase):
             self.assertIsInstance(_, str)
 
 
+class TestPhraseAnagrams(unittest.TestCase):
+    def test_finds_phrase(self):
+        result = list(en_words.phrase_anagrams("Clint Eastwood"))
+
+        self.assertIn(('action', 'west', 'old'), result)
+
+    def test_uses_every_letter(self):
+        for phrase in en_words.phrase_anagrams("dormitory"):
+            self.assertEqual(sorted(''.join(phrase)), sorted("dormitory"))
+
+    def test_each_phrase_once(self):
+        result = [tuple(sorted(phrase)) for phrase in en_words.phrase_anagrams("dormitory")]
+
+        self.assertEqual(len(result), len(set(result)))
+
+    def test_returns_iterator(self):
+        result = en_words.phrase_anagrams("dormitory")
+
+        self.assertIsInstance(result, Iterator)
+
+    def test_limit(self):
+        result = list(en_words.phrase_anagrams("dormitory", limit=5))
+
+        self.assertEqual(len(result), 5)
+
+    def test_timeout(self):
+        result = list(en_words.phrase_anagrams("william shakespeare", max_words=4, timeout=0.2))
+
+        self.assertTrue(all(sorted(''.join(phrase)) == sorted("williamshakespeare") for phrase in result))
+
+
+class TestWordsWithPrefix(unittest.TestCase):
+    def test_words_with_prefix(self):
+        result = list(en_words.words_with_prefix("rec", limit=3))
+        expected = ['rec', 'recalcitrance', 'recalcitrant']
+
+        self.assertEqual(result, expected)
+
+    def test_returns_iterator(self):
+        result = en_words.words_with_prefix("rec")
+
+        self.assertIsInstance(result, types.GeneratorType)
+
+    def test_all_start_with_prefix(self):
+        result = list(en_words.words_with_prefix("recon"))
+
+        self.assertTrue(all(word.startswith("recon") for word in result))
+        self.assertEqual(result, sorted(result))
+
+    def test_length_bounds(self):
+        result = list(en_words.words_with_prefix("recon", min_len=12, max_len=12))
+
+        self.assertTrue(result)
+        self.assertTrue(all(len(word) == 12 for word in result))
+
+    def test_no_match(self):
+        result = list(en_words.words_with_prefix("zzzq"))
+        expected = []
+
+        self.assertEqual(result, expected)
+
+
+class TestWordsWithSuffix(unittest.TestCase):
+    def test_words_with_suffix(self):
+        result = list(en_words.words_with_suffix("tion", limit=3))
+        expected = ['bibation', 'cibation', 'libation']
+
+        self.assertEqual(result, expected)
+
+    def test_finds_every_word(self):
+        result = sorted(en_words.words_with_suffix("tion"))
+        expected = [word for word in en_words.sorted_words() if word.endswith("tion")]
+
+        self.assertEqual(result, sorted(expected))
+
+    def test_rhyming_order(self):
+        result = [word[::-1] for word in en_words.words_with_suffix("ough")]
+
+        self.assertEqual(result, sorted(result))
+
+    def test_no_match(self):
+        result = list(en_words.words_with_suffix("qzx"))
+        expected = []
+
+        self.assertEqual(result, expected)
+
+
+class TestSuggest(unittest.TestCase):
+    def test_suggest(self):
+        result = en_words.suggest("recieve", limit=3)
+        expected = ['receive', 'relieve', 'believe']
+
+        self.assertEqual(result, expected)
+
+    def test_correct_word_first(self):
+        result = en_words.suggest("form", limit=2)
+        expected = ['form', 'from']
+
+        self.assertEqual(result, expected)
+
+    def test_distance_two(self):
+        result = en_words.suggest("acommodate", limit=1)
+        expected = ['accommodate']
+
+        self.assertEqual(result, expected)
+
+    def test_max_distance(self):
+        result = en_words.suggest("acommodat", max_distance=1)
+        expected = []
+
+        self.assertEqual(result, expected)
+
+    def test_uppercase(self):
+        result = en_words.suggest("Definately", limit=1)
+        expected = ['definitely']
+
+        self.assertEqual(result, expected)
+
+    def test_max_distance_too_big_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            _ = en_words.suggest("recieve", max_distance=3)
+
+
+class TestLexicon(unittest.TestCase):
+    def setUp(self):
+        self.lexicon = en_words.Lexicon.from_words(["Stop", "post", "a", "tops", "cat", "act", "zebra"])
+
+    def test_from_words_sorted_by_length_then_alphabetically(self):
+        result = self.lexicon.sorted_words()
+        expected = ['a', 'act', 'cat', 'post', 'stop', 'tops', 'zebra']
+
+        self.assertEqual(result, expected)
+
+    def test_cached(self):
+        calls = []
+
+        def build():
+            calls.append(1)
+            return len(self.lexicon)
+
+        result = [self.lexicon.cached('count', build), self.lexicon.cached('count', build)]
+        expected = [7, 7]
+
+        self.assertEqual(result, expected)
+        self.assertEqual(len(calls), 1)
+
+    def test_phrase_anagrams(self):
+        lexicon = en_words.Lexicon.from_words(['dirty', 'room', 'dormitory', 'rood', 'try', 'mi', "o'room"])
+        result = list(lexicon.phrase_anagrams("Dormitory", min_word_len=2))
+        expected = [('dirty', 'room'), ('rood', 'try', 'mi')]
+
+        self.assertEqual(result, expected)
+
+    def test_phrase_anagrams_max_words(self):
+        lexicon = en_words.Lexicon.from_words(['dirty', 'room', 'rood', 'try', 'mi'])
+        result = list(lexicon.phrase_anagrams("dormitory", max_words=2, min_word_len=2))
+        expected = [('dirty', 'room')]
+
+        self.assertEqual(result, expected)
+
+    def test_phrase_anagrams_min_word_len(self):
+        lexicon = en_words.Lexicon.from_words(['dirty', 'room', 'rood', 'try', 'mi'])
+        result = list(lexicon.phrase_anagrams("dormitory", min_word_len=3))
+        expected = [('dirty', 'room')]
+
+        self.assertEqual(result, expected)
+
+    def test_phrase_anagrams_invalid_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            _ = self.lexicon.phrase_anagrams("stop", max_words=0)
+
+    def test_words_with_prefix(self):
+        result = list(self.lexicon.words_with_prefix("Po"))
+        expected = ['post']
+
+        self.assertEqual(result, expected)
+
+    def test_words_with_prefix_includes_prefix(self):
+        result = list(self.lexicon.words_with_prefix("a"))
+        expected = ['a', 'act']
+
+        self.assertEqual(result, expected)
+
+    def test_words_with_prefix_limit(self):
+        result = list(self.lexicon.words_with_prefix("", limit=4))
+        expected = ['a', 'act', 'cat', 'post']
+
+        self.assertEqual(result, expected)
+
+    def test_words_with_prefix_length_bounds(self):
+        result = list(self.lexicon.words_with_prefix("", min_len=4, max_len=4))
+        expected = ['post', 'stop', 'tops']
+
+        self.assertEqual(result, expected)
+
+    def test_words_with_suffix(self):
+        result = list(self.lexicon.words_with_suffix("OPS"))
+        expected = ['tops']
+
+        self.assertEqual(result, expected)
+
+    def test_words_with_suffix_order_and_bounds(self):
+        result = list(self.lexicon.words_with_suffix("t", min_len=3))
+        expected = ['cat', 'act', 'post']
+
+        self.assertEqual(result, expected)
+
+    def test_words_with_suffix_limit(self):
+        result = list(self.lexicon.words_with_suffix("", limit=2))
+        expected = ['a', 'zebra']
+
+        self.assertEqual(result, expected)
+
+    def test_length_histogram(self):
+        result = self.lexicon.length_histogram()
+        expected = {1: 1, 3: 2, 4: 3, 5: 1}
+
+        self.assertEqual(result, expected)
+
+    def test_getitem(self):
+        result = (self.lexicon[1], self.lexicon[3:5])
+        expected = ('act', ['post', 'stop'])
+
+        self.assertEqual(result, expected)
+
+    def test_letter_set_index(self):
+        index = self.lexicon.letter_set_index()
+        result = [self.lexicon[i] for i in index[letters.letter_mask('opst')]]
+        expected = ['post', 'stop', 'tops']
+
+        self.assertEqual(result, expected)
+
+    def test_word_count(self):
+        result = self.lexicon.word_count()
+        expected = 7
+
+        self.assertEqual(result, expected)
+
+    def test_contains(self):
+        self.assertIn("stop", self.lexicon)
+        self.assertIn("STOP", self.lexicon)
+        self.assertNotIn("spot", self.lexicon)
+
+    def test_find_largest_word(self):
+        result = self.lexicon.find_largest_word()
+        expected = 'zebra'
+
+        self.assertEqual(result, expected)
+
+    def test_find_largest_word_empty(self):
+        result = en_words.Lexicon.from_words([]).find_largest_word()
+        expected = ''
+
+        self.assertEqual(result, expected)
+
+    def test_anagrams(self):
+        result = self.lexicon.anagrams("opts")
+        expected = ['post', 'stop', 'tops']
+
+        self.assertEqual(result, expected)
+
+    def test_words_of_length(self):
+        result = self.lexicon.words_of_length(4)
+        expected = ['post', 'stop', 'tops']
+
+        self.assertEqual(result, expected)
+
+    def test_words_of_length_no_words_of_that_length(self):
+        result = self.lexicon.words_of_length(2)
+        expected = []
+
+        self.assertEqual(result, expected)
+
+    def test_words_from_letters_longer_than_any_word(self):
+        result = self.lexicon.words_from_letters("abcertz", min_len=10, max_len=None)
+        expected = []
+
+        self.assertEqual(result, expected)
+
+    def test_words_from_letters_reuses_letters(self):
+        lexicon = en_words.Lexicon.from_words(["tee", "tet", "set", "sett", "tees"])
+        result = lexicon.words_from_letters("tes", min_len=3, max_len=None)
+        expected = ['set', 'tee', 'tet', 'sett', 'tees']
+
+        self.assertEqual(result, expected)
+
+    def test_words_from_letters_remove_doubles(self):
+        lexicon = en_words.Lexicon.from_words(["tee", "tet", "set", "sett", "tees"])
+        result = lexicon.words_from_letters("tes", min_len=3, max_len=None, remove_doubles=True)
+        expected = ['set']
+
+        self.assertEqual(result, expected)
+
+    def test_words_from_letters_apostrophe(self):
+        lexicon = en_words.Lexicon.from_words(["i'd", "i'm", "id"])
+        result = lexicon.words_from_letters("i'd", min_len=1, max_len=None)
+        expected = ['id', "i'd"]
+
+        self.assertEqual(result, expected)
+
+    def test_words_from_rack(self):
+        lexicon = en_words.Lexicon.from_words(["tee", "tet", "set", "sett", "tees", "steel"])
+        result = lexicon.words_from_rack("steel")
+        expected = ['set', 'tee', 'tees', 'steel']
+
+        self.assertEqual(result, expected)
+
+    def test_words_from_rack_lengths(self):
+        lexicon = en_words.Lexicon.from_words(["tee", "tet", "set", "sett", "tees", "steel"])
+        result = lexicon.words_from_rack("steel", min_len=4, max_len=4)
+        expected = ['tees']
+
+        self.assertEqual(result, expected)
+
+    def test_words_from_rack_apostrophe(self):
+        lexicon = en_words.Lexicon.from_words(["i'd", "i'd'"])
+        result = lexicon.words_from_rack("di'")
+        expected = ["i'd"]
+
+        self.assertEqual(result, expected)
+
+    def test_words_from_letters_no_max_len(self):
+        result = self.lexicon.words_from_letters("abcertz", min_len=3, max_len=None)
+        expected = ['act', 'cat', 'zebra']
+
+        self.assertEqual(result, expected)
+
+    def test_module_functions_match_lexicon(self):
+        lexicon = en_words.get_lexicon()
+
+        self.assertEqual(en_words.words_of_length(4), lexicon.words_of_length(4))
+        self.assertEqual(en_words.potential_words('_?tt-e'), lexicon.potential_words('_?tt-e'))
+
+    def test_import_does_not_import_numpy(self):
+        code = "import sys, en_words; print('numpy' in sys.modules)"
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout.strip()
+        expected = "False"
+
+        self.assertEqual(result, expected)
+
+    def test_unknown_engine_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            _ = en_words.Lexicon.from_words(["cat"], engine="foo")
+
+    @unittest.skipIf(matrices.np is None, "numpy is not installed")
+    def test_numpy_engine_matches_python_engine(self):
+        lexicon = en_words.Lexicon(engine="numpy")
+        patterns = [('_?tt-e', '', ''), ('?a?e?', 'stmlkdby', 'n'), ('?????', 'steaiy', 'r')]
+
+        for partial_word, ignore_letters, required_letters in patterns:
+            result = lexicon.potential_words(partial_word, ignore_letters, required_letters)
+            expected = en_words.potential_words(partial_word, ignore_letters, required_letters)
+
+            self.assertEqual(result, expected)
+
+        result = lexicon.words_from_letters("beetles", min_len=3, max_len=None)
+        expected = en_words.words_from_letters("beetles", min_len=3, max_len=None)
+
+        self.assertEqual(result, expected)
+
+        result = lexicon.words_from_rack("ljsoeitwo", min_len=3)
+        expected = en_words.words_from_rack("ljsoeitwo", min_len=3)
+
+        self.assertEqual(result, expected)
+
+    def test_trie_engine_matches_python_engine(self):
+        lexicon = en_words.Lexicon(engine="trie")
+
+        self.assertEqual(lexicon.potential_words('_?tt-e'), en_words.potential_words('_?tt-e'))
+        self.assertEqual(lexicon.words_from_letters("beetles", 3, None), en_words.words_from_letters("beetles", 3, None))
+        self.assertEqual(lexicon.words_from_rack("ljsoeitwo", 3), en_words.words_from_rack("ljsoeitwo", 3))
+
+    def test_get_lexicon_is_shared(self):
+        self.assertIs(en_words.get_lexicon(), en_words.get_lexicon())
+
+
 if __name__ == '__main__': # pragma no cover
     unittest.main()
\ No newline at end of file
@@ -216,6 +216,52 @@ class TestLetters(unittest.TestCase):
         self.assertEqual(letters.random_letter(), 'Z')
 
 
+class TestLetterCounts(unittest.TestCase):
+    def test_letter_counts_empty(self):
+        result = letters.letter_counts('')
+        expected = bytes(26)
+
+        self.assertEqual(result, expected)
+
+    def test_letter_counts(self):
+        result = letters.letter_counts("abba'z")
+        expected = bytes([2, 2] + [0] * 23 + [1])
+
+        self.assertEqual(result, expected)
+
+
+class TestLetterMask(unittest.TestCase):
+    def test_letter_mask_empty(self):
+        result = letters.letter_mask('')
+        expected = 0
+
+        self.assertEqual(result, expected)
+
+    def test_letter_mask(self):
+        result = letters.letter_mask('cab')
+        expected = 0b111
+
+        self.assertEqual(result, expected)
+
+    def test_letter_mask_repeated_letters(self):
+        result = letters.letter_mask('abba')
+        expected = letters.letter_mask('ab')
+
+        self.assertEqual(result, expected)
+
+    def test_letter_mask_z(self):
+        result = letters.letter_mask('z')
+        expected = 1 << 25
+
+        self.assertEqual(result, expected)
+
+    def test_letter_mask_other_character(self):
+        result = letters.letter_mask("i'd")
+        expected = letters.letter_mask('id') | letters.OTHER_CHARACTER_BIT
+
+        self.assertEqual(result, expected)
+
+
 class TestLetterFrequencies(unittest.TestCase):
     def test_letters_frequency_is_float(self):
         result = letters.LetterFrequency.percentage("e")
@@ -0,0 +1,92 @@
+import unittest
+
+from array import array
+
+from en_words import letters
+from en_words import matrices
+
+
+@unittest.skipIf(matrices.np is None, "numpy is not installed")
+class TestWordMatrix(unittest.TestCase):
+    def test_shape(self):
+        result = matrices.word_matrix(['bat', 'cat'], 3).shape
+        expected = (2, 3)
+
+        self.assertEqual(result, expected)
+
+    def test_ascii_is_uint8(self):
+        result = matrices.word_matrix(['bat', 'cat'], 3).dtype
+        expected = matrices.np.uint8
+
+        self.assertEqual(result, expected)
+
+    def test_not_ascii(self):
+        result = matrices.word_matrix(['café'], 4)[0, 3]
+        expected = ord('é')
+
+        self.assertEqual(result, expected)
+
+    def test_bytes_matrix(self):
+        data = bytearray(b'batcat')
+        matrix = matrices.bytes_matrix(data, 3)
+        data[3:] = b'cot'
+
+        self.assertEqual(matrix.shape, (2, 3))
+        self.assertEqual(matrix[1].tobytes(), b'cot')
+
+
+@unittest.skipIf(matrices.np is None, "numpy is not installed")
+class TestMatchMask(unittest.TestCase):
+    def setUp(self):
+        self.matrix = matrices.word_matrix(['bat', 'cat', 'cot', 'dog', 'tab'], 3)
+
+    def test_pattern(self):
+        result = matrices.match_mask(self.matrix, 'c?t').tolist()
+        expected = [False, True, True, False, False]
+
+        self.assertEqual(result, expected)
+
+    def test_ignore_letters(self):
+        result = matrices.match_mask(self.matrix, '??t', ignore_letters='o').tolist()
+        expected = [True, True, False, False, False]
+
+        self.assertEqual(result, expected)
+
+    def test_required_letters(self):
+        result = matrices.match_mask(self.matrix, '???', required_letters='ab').tolist()
+        expected = [True, False, False, False, True]
+
+        self.assertEqual(result, expected)
+
+
+@unittest.skipIf(matrices.np is None, "numpy is not installed")
+class TestMasksWithout(unittest.TestCase):
+    def setUp(self):
+        self.masks = array('I', [0b001, 0b011, 0b100, 0b110])
+
+    def test_masks_without(self):
+        result = matrices.masks_without(self.masks, 0b100)
+        expected = [0, 1]
+
+        self.assertEqual(result, expected)
+
+    def test_masks_without_range(self):
+        result = matrices.masks_without(self.masks, 0b010, 1, 3)
+        expected = [2]
+
+        self.assertEqual(result, expected)
+
+
+@unittest.skipIf(matrices.np is None, "numpy is not installed")
+class TestCountsWithin(unittest.TestCase):
+    def test_counts_within(self):
+        words = ['tee', 'set', 'tees', 'sett']
+        counts = b''.join(letters.letter_counts(word) for word in words)
+        result = matrices.counts_within(counts, letters.letter_counts('steel'), [0, 1, 2, 3])
+        expected = [0, 1, 2]
+
+        self.assertEqual(result, expected)
+
+
+if __name__ == '__main__': # pragma no cover
+    unittest.main()
@@ -0,0 +1,90 @@
+import pickle
+import unittest
+
+from en_words import spelling
+from en_words.spelling import DeletionIndex
+
+
+class TestDeletes(unittest.TestCase):
+    def test_one_delete(self):
+        result = spelling.deletes('cat', 1)
+        expected = {'cat', 'at', 'ct', 'ca'}
+
+        self.assertEqual(result, expected)
+
+    def test_two_deletes(self):
+        result = spelling.deletes('cat', 2)
+        expected = {'cat', 'at', 'ct', 'ca', 'a', 'c', 't'}
+
+        self.assertEqual(result, expected)
+
+    def test_repeated_letters(self):
+        result = spelling.deletes('too', 1)
+        expected = {'too', 'oo', 'to'}
+
+        self.assertEqual(result, expected)
+
+
+class TestEditDistance(unittest.TestCase):
+    def test_same(self):
+        result = spelling.edit_distance('cat', 'cat')
+        expected = 0
+
+        self.assertEqual(result, expected)
+
+    def test_substitution_insertion_deletion(self):
+        result = spelling.edit_distance('kitten', 'sitting')
+        expected = 3
+
+        self.assertEqual(result, expected)
+
+    def test_transposition(self):
+        result = spelling.edit_distance('form', 'from')
+        expected = 1
+
+        self.assertEqual(result, expected)
+
+    def test_empty(self):
+        result = spelling.edit_distance('', 'cat')
+        expected = 3
+
+        self.assertEqual(result, expected)
+
+    def test_max_distance(self):
+        result = spelling.edit_distance('kitten', 'sitting', 1)
+        expected = 2
+
+        self.assertEqual(result, expected)
+
+
+class TestDeletionIndex(unittest.TestCase):
+    def setUp(self):
+        self.words = ['cat', 'cart', 'dog', 'catalogue', 'catalogues', 'zebra']
+        self.index = DeletionIndex(self.words)
+
+    def candidates(self, word, max_distance=None):
+        return {self.words[i] for i in self.index.candidates(word, max_distance)}
+
+    def test_candidates(self):
+        result = self.candidates('cta')
+
+        self.assertIn('cat', result)
+        self.assertIn('cart', result)
+        self.assertNotIn('zebra', result)
+
+    def test_finds_every_match(self):
+        for word in ['cat', 'catt', 'ca', 'dgo', 'katalogue', 'catalouges', 'xcatalogue', 'zebras']:
+            result = self.candidates(word)
+            expected = {w for w in self.words if spelling.edit_distance(word, w) <= 2}
+
+            self.assertTrue(expected <= result, word)
+
+    def test_max_distance_too_big_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            _ = list(self.index.candidates('cat', 3))
+
+    def test_pickle(self):
+        index = pickle.loads(pickle.dumps(self.index))
+
+        self.assertEqual(len(index), len(self.index))
+        self.assertEqual(sorted(index.candidates('dgo')), sorted(self.index.candidates('dgo')))
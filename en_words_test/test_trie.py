@@ -0,0 +1,112 @@
+import pickle
+import unittest
+
+from en_words.trie import Trie
+
+
+class TestTrie(unittest.TestCase):
+    def setUp(self):
+        self.words = ['cat', 'cats', 'cot', 'dog', 'nation', 'station', 'tee', 'tees']
+        self.trie = Trie(reversed(self.words))
+
+    def test_len(self):
+        result = len(self.trie)
+        expected = 8
+
+        self.assertEqual(result, expected)
+
+    def test_len_ignores_duplicates(self):
+        result = len(Trie(['cat', 'cat', '']))
+        expected = 1
+
+        self.assertEqual(result, expected)
+
+    def test_iter_alphabetical(self):
+        result = list(self.trie)
+        expected = self.words
+
+        self.assertEqual(result, expected)
+
+    def test_contains(self):
+        self.assertIn('cat', self.trie)
+        self.assertIn('station', self.trie)
+        self.assertNotIn('ca', self.trie)
+        self.assertNotIn('ation', self.trie)
+
+    def test_shares_endings(self):
+        result = self.trie.node('na') == self.trie.node('sta')
+        expected = True
+
+        self.assertEqual(result, expected)
+
+    def test_node_count(self):
+        result = Trie(['nation', 'station']).node_count()
+        expected = 8
+
+        self.assertEqual(result, expected)
+
+    def test_has_prefix(self):
+        self.assertTrue(self.trie.has_prefix('sta'))
+        self.assertFalse(self.trie.has_prefix('sto'))
+
+    def test_words_with_prefix(self):
+        result = list(self.trie.words_with_prefix('ca'))
+        expected = ['cat', 'cats']
+
+        self.assertEqual(result, expected)
+
+    def test_words_with_prefix_missing(self):
+        result = list(self.trie.words_with_prefix('x'))
+        expected = []
+
+        self.assertEqual(result, expected)
+
+    def test_words_from_letters(self):
+        result = self.trie.words_from_letters('etsa')
+        expected = ['tee', 'tees']
+
+        self.assertEqual(result, expected)
+
+    def test_words_from_letters_lengths(self):
+        result = self.trie.words_from_letters('acts', min_len=4, max_len=4)
+        expected = ['cats']
+
+        self.assertEqual(result, expected)
+
+    def test_words_from_letters_remove_doubles(self):
+        result = self.trie.words_from_letters('acest', remove_doubles=True)
+        expected = ['cat', 'cats']
+
+        self.assertEqual(result, expected)
+
+    def test_words_from_rack(self):
+        result = self.trie.words_from_rack('etse')
+        expected = ['tee', 'tees']
+
+        self.assertEqual(result, expected)
+
+    def test_words_from_rack_letters_used_once(self):
+        result = self.trie.words_from_rack('tes')
+        expected = []
+
+        self.assertEqual(result, expected)
+
+    def test_potential_words(self):
+        result = self.trie.potential_words('c?t')
+        expected = ['cat', 'cot']
+
+        self.assertEqual(result, expected)
+
+    def test_potential_words_ignore_and_required_letters(self):
+        self.assertEqual(self.trie.potential_words('c?t', ignore_letters='a'), ['cot'])
+        self.assertEqual(self.trie.potential_words('???', required_letters='e'), ['tee'])
+
+    def test_pickle(self):
+        result = list(pickle.loads(pickle.dumps(self.trie)))
+        expected = self.words
+
+        self.assertEqual(result, expected)
+
+
+if __name__ == '__main__': # pragma no cover
+    unittest.main()
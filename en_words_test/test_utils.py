@@ -87,4 +87,34 @@ class TestIsSublist(unittest.TestCase):
         result = is_sublist(["A", "B", "B"], ["A", "B", "C"])
         expected = False
 
-        self.assertEqual(result, expected)
\ No newline at end of file
+        self.assertEqual(result, expected)
+
+    # str
+    def test_str_true(self):
+        result = is_sublist("ABB", "BCAB")
+        expected = True
+
+        self.assertEqual(result, expected)
+
+    def test_str_false(self):
+        result = is_sublist("ABB", "ABC")
+        expected = False
+
+        self.assertEqual(result, expected)
+
+    def test_str_empty(self):
+        result = is_sublist("", "")
+        expected = True
+
+        self.assertEqual(result, expected)
+    def test_str_case_sensitive(self):
+        result = is_sublist("Ab", "ab")
+        expected = False
+
+        self.assertEqual(result, expected)
+
+    def test_str_not_letters(self):
+        result = is_sublist("a'b", "b'ac")
+        expected = True
+
+        self.assertEqual(result, expected)
@@ -1,6 +1,201 @@
+import gc
+import os
+import tempfile
 import unittest
+import weakref
+
+from en_words.en_words import Lexicon, create_sorted_dict, get_lexicon
+from en_words.word_games import (
+    BOGGLE_DICE, 
+    Countdown, 
+    LadderBand, 
+    PolygonPuzzle, 
+    SCRABBLE_BINGO_BONUS, 
+    ScrabbleWord, 
+    SpellingBee, 
+    WordGrid, 
+    boggle, 
+    boggle_batch, 
+    boggle_score, 
+    cash_square, 
+    ladder_components, 
+    ladder_neighbors, 
+    ladder_report, 
+    polygon_batch, 
+    polygon_puzzles, 
+    random_boggle, 
+    scrabble, 
+    word_grid, 
+    word_ladder, 
+    word_square)
+
+
+#region Polygon Tests
+
+class TestPolygonBatch(unittest.TestCase):
+    def setUp(self):
+        self.lexicon = Lexicon.from_words([
+            'regretful', 'fluter', 'gruel', 'tree', 'true', 'feet', 'fret', 'glee', 'greet', 
+            'teeter', 'elf', "e'er"])
+
+    def test_counts_every_center(self):
+        result = polygon_batch(['regretful'], lexicon=self.lexicon)
+        expected = [{'e': 9, 'f': 4, 'g': 4, 'l': 4, 'r': 7, 't': 7, 'u': 4}]
 
-from en_words.word_games import Countdown
+        self.assertEqual(result, expected)
+
+    def test_letters_used_once(self):
+        result = polygon_batch(['tree'], lexicon=self.lexicon)
+        expected = [{'e': 1, 'r': 1, 't': 1}]
+
+        self.assertEqual(result, expected)
+
+    def test_empty_lexicon(self):
+        result = polygon_batch(['tree'], lexicon=Lexicon.from_words([]))
+        expected = [{'e': 0, 'r': 0, 't': 0}]
+
+        self.assertEqual(result, expected)
+
+    def test_lexicon_not_kept_alive(self):
+        lexicon = Lexicon.from_words(['tree'])
+        _ = polygon_batch(['tree'], lexicon=lexicon)
+        reference = weakref.ref(lexicon)
+        del lexicon
+        gc.collect()
+
+        self.assertIsNone(reference())
+
+    def test_order_and_case_ignored(self):
+        result = polygon_batch(['GLUTFREER'], lexicon=self.lexicon)
+        expected = polygon_batch(['regretful'], lexicon=self.lexicon)
+
+        self.assertEqual(result, expected)
+
+    def test_processes(self):
+        racks = ['regretful', 'tree', 'fluter']
+        result = polygon_batch(racks, processes=2, lexicon=self.lexicon)
+        expected = polygon_batch(racks, lexicon=self.lexicon)
+
+        self.assertEqual(result, expected)
+
+
+class TestPolygonPuzzles(unittest.TestCase):
+    def setUp(self):
+        self.lexicon = Lexicon.from_words(['regretful', 'fluter', 'gruel', 'tree', 'true', 'greet'])
+
+    def test_puzzles(self):
+        result = list(polygon_puzzles(min_answers=5, lexicon=self.lexicon))
+        expected = [
+            PolygonPuzzle('e', 'eefglrrtu', 6, ('regretful',)),
+            PolygonPuzzle('r', 'eefglrrtu', 6, ('regretful',)),
+            PolygonPuzzle('t', 'eefglrrtu', 5, ('regretful',))]
+
+        self.assertEqual(result, expected)
+
+    def test_max_answers(self):
+        result = [puzzle.center for puzzle in polygon_puzzles(max_answers=3, lexicon=self.lexicon)]
+        expected = ['f', 'g', 'l']
+
+        self.assertEqual(result, expected)
+
+#endregion
+
+
+#region Cash Square Tests
+
+class TestCashSquare(unittest.TestCase):
+    def test_solution(self):
+        result = cash_square(['aver', 'flap', 'gent', 'lime', 'newt'])
+        expected = [(('flap', 'lime', 'aver', 'gent'), ('flag', 'live', 'amen', 'pert'), ('newt',))]
+
+        self.assertEqual(result, expected)
+
+    def test_solution_fields(self):
+        result = cash_square(['AVER', 'FLAP', 'GENT', 'LIME', 'NEWT'])[0]
+
+        self.assertEqual(result.rows, ('flap', 'lime', 'aver', 'gent'))
+        self.assertEqual(result.unused, ('newt',))
+
+    def test_no_solution(self):
+        result = cash_square(['seat', 'east', 'teas', 'sate', 'eats'])
+        expected = []
+
+        self.assertEqual(result, expected)
+
+    def test_different_lengths_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            _ = cash_square(['aver', 'flap', 'gents'])
+
+#endregion
+
+
+#region Word Grid Tests
+
+class TestWordGrid(unittest.TestCase):
+    def setUp(self):
+        self.lexicon = Lexicon.from_words([
+            'bit', 'ice', 'ten', 'bat', 'ace', 'zoo', 'can', "o'e",
+            'flap', 'lime', 'aver', 'gent', 'flag', 'live', 'amen', 'pert'])
+
+    def test_word_square(self):
+        result = word_square(3, limit=None, lexicon=self.lexicon)
+        expected = [
+            WordGrid(('bat', 'ace', 'ten'), ('bat', 'ace', 'ten')), 
+            WordGrid(('bit', 'ice', 'ten'), ('bit', 'ice', 'ten'))]
+
+        self.assertEqual(result, expected)
+
+    def test_empty_lexicon(self):
+        result = word_square(3, limit=None, lexicon=Lexicon.from_words([]))
+        expected = []
+
+        self.assertEqual(result, expected)
+
+    def test_grid_rows_and_columns_are_words(self):
+        for grid in word_grid(4, lexicon=self.lexicon):
+            for word in grid.rows + grid.columns:
+                self.assertIn(word, self.lexicon)
+
+    def test_grid_words_unique(self):
+        result = list(word_grid(4, lexicon=self.lexicon))
+        expected = [
+            WordGrid(('flag', 'live', 'amen', 'pert'), ('flap', 'lime', 'aver', 'gent')), 
+            WordGrid(('flap', 'lime', 'aver', 'gent'), ('flag', 'live', 'amen', 'pert'))]
+
+        self.assertEqual(result, expected)
+
+    def test_pattern(self):
+        result = list(word_grid(3, pattern=['?i?', '???', '???'], symmetric=True, lexicon=self.lexicon))
+        expected = [WordGrid(('bit', 'ice', 'ten'), ('bit', 'ice', 'ten'))]
+
+        self.assertEqual(result, expected)
+
+    def test_rectangle(self):
+        result = next(word_grid(3, 4))
+
+        self.assertEqual(len(result.rows), 3)
+        self.assertEqual(len(result.columns), 4)
+
+    def test_limit(self):
+        result = list(word_grid(5, symmetric=True, limit=2))
+
+        self.assertEqual(len(result), 2)
+
+    def test_no_solution(self):
+        result = list(word_grid(2, lexicon=self.lexicon))
+        expected = []
+
+        self.assertEqual(result, expected)
+
+    def test_symmetric_rectangle_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            _ = word_grid(3, 4, symmetric=True)
+
+    def test_invalid_pattern_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            _ = word_grid(3, pattern=['???', '???'])
+
+#endregion
 
 
 #region Countdown Tests
@@ -134,7 +329,27 @@ class TestCountdownFromVowelCount(unittest.TestCase):
             self.assertEqual(Countdown.is_valid_selection(c.letters), expected)
 
 
-# class TestCountdownSolve(unittest.TestCase):
+class TestCountdownSolve(unittest.TestCase):
+    def test_solve_groups_by_length(self):
+        result = Countdown("ljsoeitwo").solve()
+
+        for length, words in result.items():
+            for word in words:
+                self.assertEqual(len(word), length)
+
+    def test_solve_best_answer(self):
+        result = Countdown("ljsoeitwo").solve()[8]
+        expected = ['jowliest']
+
+        self.assertEqual(result, expected)
+
+    def test_solve_letters_used_once(self):
+        result = Countdown("ljsoeitwo").solve()[3]
+
+        self.assertIn('too', result)
+        self.assertNotIn('see', result)
+
+
 # class TestCountdownSolveAndDisplay(unittest.TestCase):
 
 
@@ -145,6 +360,58 @@ class TestCountdownFind9LetterGame(unittest.TestCase):
 
         self.assertEqual(Countdown.is_valid_selection(c.letters), expected)
 
+    def test_has_9_letter_solution(self):
+        c = Countdown.find_9_letter_game()
+
+        self.assertGreater(len(c.solve()[9]), 0)
+
+    def test_rebuilt_dictionary(self):
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, "words.txt")
+            filename_sorted = os.path.join(directory, "words_sorted.txt")
+
+            with open(filename, 'w') as f:
+                f.write("education\ncat\n")
+
+            create_sorted_dict(filename, filename_sorted, build_indexes=False)
+            result = sorted(Countdown.find_9_letter_game(get_lexicon(filename_sorted)).letters)
+
+            self.assertEqual(result, sorted("EDUCATION"))
+
+            with open(filename, 'w') as f:
+                f.write("regretful\ncat\n")
+
+            create_sorted_dict(filename, filename_sorted, build_indexes=False)
+            result = sorted(Countdown.find_9_letter_game(get_lexicon(filename_sorted)).letters)
+
+            self.assertEqual(result, sorted("REGRETFUL"))
+
+
+class TestCountdownDrawProbability(unittest.TestCase):
+    def test_invalid_selection(self):
+        result = Countdown.draw_probability("KK" + "AEO" + "JKLM")
+        expected = 0.0
+
+        self.assertEqual(result, expected)
+
+    def test_valid_selection(self):
+        result = Countdown.draw_probability("CAITDEHON")
+
+        self.assertGreater(result, 0.0)
+        self.assertLess(result, 1.0)
+
+    def test_order_and_case_ignored(self):
+        result = Countdown.draw_probability("caitdehon")
+        expected = Countdown.draw_probability("ACDEHINOT")
+
+        self.assertEqual(result, expected)
+
+    def test_rarer_letters_less_likely(self):
+        common = Countdown.draw_probability("AEI" + "RSTNDC")
+        rare = Countdown.draw_probability("AEI" + "RSTNDQ")
+
+        self.assertLess(rare, common)
+
 
 class TestCountdownStringRepresentation(unittest.TestCase):
     def test_repr(self):
@@ -154,4 +421,345 @@ class TestCountdownStringRepresentation(unittest.TestCase):
         self.assertEqual(result, expected)
 
 
-#endregion
\ No newline at end of file
+#endregion
+
+#region Spelling Bee Tests
+
+class TestSpellingBee(unittest.TestCase):
+    def setUp(self):
+        self.lexicon = Lexicon.from_words([
+            'gig', 'grin', 'grain', 'gamin', 'origami', 'roaming', 'moringa', 'ramming',
+            'main', 'margin', 'marino', "o'grain", 'gaming', 'going', 'zing'])
+
+    def test_solve(self):
+        result = SpellingBee('g', 'aimnor', self.lexicon).solve()
+        expected = ['grin', 'gamin', 'going', 'grain', 'gaming', 'margin', 'moringa', 'origami', 'ramming', 'roaming']
+
+        self.assertEqual(result, expected)
+
+    def test_empty_lexicon(self):
+        result = SpellingBee('g', 'aimnor', Lexicon.from_words([])).solve()
+        expected = []
+
+        self.assertEqual(result, expected)
+
+    def test_solve_any_case(self):
+        result = SpellingBee('G', 'AIMNOR', self.lexicon).solve()
+        expected = SpellingBee('g', 'aimnor', self.lexicon).solve()
+
+        self.assertEqual(result, expected)
+
+    def test_pangrams(self):
+        result = SpellingBee('a', 'gimnor', self.lexicon).pangrams()
+        expected = ['moringa', 'roaming']
+
+        self.assertEqual(result, expected)
+
+    def test_word_score(self):
+        self.assertEqual(SpellingBee.word_score('grin'), 1)
+        self.assertEqual(SpellingBee.word_score('grain'), 5)
+        self.assertEqual(SpellingBee.word_score('roaming'), 14)
+
+    def test_score(self):
+        result = SpellingBee('g', 'aimnor', self.lexicon).score()
+        expected = 1 + 5 + 5 + 5 + 6 + 6 + 14 + 7 + 7 + 14
+
+        self.assertEqual(result, expected)
+
+    def test_repeated_letters_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            _ = SpellingBee('g', 'aimnog')
+
+    def test_wrong_letter_count_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            _ = SpellingBee('g', 'aimno')
+
+    def test_not_letters_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            _ = SpellingBee('g', "aimno'")
+
+
+class TestSpellingBeePuzzles(unittest.TestCase):
+    def setUp(self):
+        self.lexicon = Lexicon.from_words([
+            'grin', 'grain', 'gamin', 'origami', 'roaming', 'moringa', 'ramming', 'margin', 'aspiring'])
+
+    def test_empty_lexicon(self):
+        result = list(SpellingBee.puzzles(lexicon=Lexicon.from_words([])))
+        expected = []
+
+        self.assertEqual(result, expected)
+
+    def test_lexicon_not_kept_alive(self):
+        lexicon = Lexicon.from_words(['grin', 'roaming'])
+        _ = list(SpellingBee.puzzles(lexicon=lexicon))
+        reference = weakref.ref(lexicon)
+        del lexicon
+        gc.collect()
+
+        self.assertIsNone(reference())
+
+    def test_every_center(self):
+        result = [puzzle.center for puzzle in SpellingBee.puzzles(lexicon=self.lexicon)]
+        expected = list('agimnor')
+
+        self.assertEqual(result, expected)
+
+    def test_matches_solve(self):
+        for puzzle in SpellingBee.puzzles(lexicon=self.lexicon):
+            bee = SpellingBee(puzzle.center, puzzle.letters.replace(puzzle.center, ''), self.lexicon)
+
+            self.assertEqual(puzzle.answer_count, len(bee.solve()))
+            self.assertEqual(puzzle.score, bee.score())
+            self.assertEqual(puzzle.pangram_count, len(bee.pangrams()))
+
+    def test_answer_limits(self):
+        result = [puzzle.center for puzzle in SpellingBee.puzzles(min_answers=6, max_answers=7, lexicon=self.lexicon)]
+        expected = ['a', 'm', 'n', 'r']
+
+        self.assertEqual(result, expected)
+
+    def test_exclude_s_by_default(self):
+        result = {puzzle.letters for puzzle in SpellingBee.puzzles(lexicon=self.lexicon)}
+        expected = {'agimnor'}
+
+        self.assertEqual(result, expected)
+
+    def test_exclude_nothing(self):
+        result = {puzzle.letters for puzzle in SpellingBee.puzzles(exclude='', lexicon=self.lexicon)}
+        expected = {'agimnor', 'aginprs'}
+
+        self.assertEqual(result, expected)
+
+#endregion
+
+
+#region Word Ladder Tests
+
+class TestWordLadder(unittest.TestCase):
+    def setUp(self):
+        self.lexicon = Lexicon.from_words([
+            'cold', 'cord', 'card', 'ward', 'warm', 'wore', 'word', 'core', 'worm', 'corm', 'able', "o'er", 
+            'cat', 'cot', 'dog', 'dot', 'cog'])
+
+    def is_ladder(self, ladder):
+        return all(sum(a != b for a, b in zip(x, y)) == 1 for x, y in zip(ladder, ladder[1:]))
+
+    def shortest_length(self, start, end):
+        # Plain breadth first search, to check the ladders are the shortest
+        seen, frontier, steps = {start}, [start], 1
+
+        while frontier:
+            if end in frontier:
+                return steps
+
+            frontier = [n for word in frontier for n in ladder_neighbors(word, self.lexicon) if n not in seen]
+            seen.update(frontier)
+            steps += 1
+
+        return None
+
+    def test_ladder_neighbors(self):
+        result = ladder_neighbors('cord', self.lexicon)
+        expected = ['card', 'cold', 'core', 'corm', 'word']
+
+        self.assertEqual(result, expected)
+
+    def test_word_ladder(self):
+        result = word_ladder('cold', 'warm', self.lexicon)
+
+        self.assertEqual(len(result), 5)
+        self.assertEqual((result[0], result[-1]), ('cold', 'warm'))
+        self.assertTrue(self.is_ladder(result))
+
+    def test_shortest(self):
+        words = self.lexicon.words_of_length(4)
+
+        for start in words:
+            for end in words:
+                if start.isalpha() and end.isalpha():
+                    result = word_ladder(start, end, self.lexicon)
+
+                    self.assertEqual(None if result is None else len(result), self.shortest_length(start, end))
+
+    def test_empty_lexicon(self):
+        lexicon = Lexicon.from_words([])
+
+        self.assertEqual(ladder_neighbors('cat', lexicon), [])
+        self.assertIsNone(word_ladder('cat', 'cot', lexicon))
+        self.assertEqual(ladder_components(3, lexicon), [])
+        self.assertEqual(ladder_report(lexicon=lexicon), [])
+
+    def test_same_word(self):
+        result = word_ladder('cat', 'cat', self.lexicon)
+        expected = ['cat']
+
+        self.assertEqual(result, expected)
+
+    def test_no_ladder(self):
+        result = word_ladder('able', 'cold', self.lexicon)
+        expected = None
+
+        self.assertEqual(result, expected)
+
+    def test_different_lengths_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            _ = word_ladder('cat', 'cold', self.lexicon)
+
+    def test_ladder_components(self):
+        result = ladder_components(4, self.lexicon)
+        expected = [['card', 'cold', 'cord', 'core', 'corm', 'ward', 'warm', 'word', 'wore', 'worm'], ['able']]
+
+        self.assertEqual(result, expected)
+
+    def test_ladder_report(self):
+        result = ladder_report(lexicon=self.lexicon)
+        expected = [LadderBand(3, 5, 1, 5, 0), LadderBand(4, 11, 2, 10, 1)]
+
+        self.assertEqual(result, expected)
+
+#endregion
+
+
+#region Boggle Tests
+
+class TestBoggle(unittest.TestCase):
+    def setUp(self):
+        self.lexicon = Lexicon.from_words([
+            'cat', 'coat', 'coater', 'tore', 'dog', 'god', 'cog', 'rot', 'at', 'tot', 'quit', 'quai', 'qat', "o'er"])
+        self.grid = ['cat', 'ore', 'dog']
+
+    def test_boggle(self):
+        result = boggle(self.grid, lexicon=self.lexicon)
+        expected = ['cat', 'coat', 'coater', 'dog', 'god']
+
+        self.assertEqual(result, expected)
+
+    def test_min_len(self):
+        result = boggle(self.grid, min_len=5, lexicon=self.lexicon)
+        expected = ['coater']
+
+        self.assertEqual(result, expected)
+
+    def test_letters_used_once(self):
+        result = boggle(['to', 'xx'], min_len=2, lexicon=self.lexicon)
+        expected = []
+
+        self.assertEqual(result, expected)
+
+    def test_uppercase_and_cells(self):
+        result = boggle([['C', 'A'], ['X', 'T']], lexicon=self.lexicon)
+        expected = ['cat']
+
+        self.assertEqual(result, expected)
+
+    def test_q_is_qu(self):
+        result = boggle(['qa', 'it'], lexicon=self.lexicon)
+        expected = ['quai', 'quit']
+
+        self.assertEqual(result, expected)
+
+    def test_empty_lexicon(self):
+        lexicon = Lexicon.from_words([])
+
+        self.assertEqual(boggle(self.grid, lexicon=lexicon), [])
+        self.assertEqual(boggle_batch([self.grid], lexicon=lexicon), [[]])
+
+    def test_uneven_rows_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            _ = boggle(['cat', 'or'], lexicon=self.lexicon)
+
+    def test_boggle_batch(self):
+        grids = [self.grid, ['qa', 'it']]
+        result = boggle_batch(grids, lexicon=self.lexicon)
+        expected = [boggle(grid, lexicon=self.lexicon) for grid in grids]
+
+        self.assertEqual(result, expected)
+
+    def test_boggle_batch_processes(self):
+        grids = [self.grid, ['qa', 'it']]
+        result = boggle_batch(grids, processes=2, lexicon=self.lexicon)
+        expected = boggle_batch(grids, lexicon=self.lexicon)
+
+        self.assertEqual(result, expected)
+
+    def test_boggle_score(self):
+        result = boggle_score(['cat', 'coat', 'tore', 'coater', 'coaters', 'diagonals'])
+        expected = 1 + 1 + 1 + 3 + 5 + 11
+
+        self.assertEqual(result, expected)
+
+    def test_random_boggle(self):
+        result = random_boggle(5)
+
+        self.assertEqual(len(result), 5)
+        self.assertTrue(all(len(row) == 5 for row in result))
+        self.assertEqual(len(BOGGLE_DICE), 16)
+
+#endregion
+
+
+#region Scrabble Tests
+
+class TestScrabble(unittest.TestCase):
+    def setUp(self):
+        self.lexicon = Lexicon.from_words([
+            'at', 'cat', 'act', 'tax', 'zax', 'axe', 'taxes', 'exacts', 'extract', 'ex', 'ta', "ca'", 'xi'])
+
+    def test_scrabble(self):
+        result = scrabble('taxec', top=3, lexicon=self.lexicon)
+        expected = [ScrabbleWord('axe', 10, ()), ScrabbleWord('ex', 9, ()), ScrabbleWord('tax', 10, ())]
+
+        self.assertEqual(sorted(result), expected)
+        self.assertEqual(result[0].score, 10)
+
+    def test_ties_alphabetical(self):
+        result = [word.word for word in scrabble('taxec', top=2, lexicon=self.lexicon)]
+        expected = ['axe', 'tax']
+
+        self.assertEqual(result, expected)
+
+    def test_blank_scores_nothing(self):
+        result = scrabble('ta?', top=1, lexicon=self.lexicon)
+        expected = [ScrabbleWord('act', 2, (1,))]
+
+        self.assertEqual(result, expected)
+
+    def test_real_tile_before_blank(self):
+        result = scrabble('z?x', top=1, lexicon=self.lexicon)
+        expected = [ScrabbleWord('zax', 18, (1,))]
+
+        self.assertEqual(result, expected)
+
+    def test_bingo_bonus(self):
+        result = scrabble('extr?ct', top=1, lexicon=self.lexicon)
+        expected = [ScrabbleWord('extract', 1 + 8 + 1 + 1 + 3 + 1 + SCRABBLE_BINGO_BONUS, (4,))]
+
+        self.assertEqual(result, expected)
+
+    def test_top_matches_every_word(self):
+        for rack in ['taxec', 'ta?', '?x?', 'eaxstc?']:
+            every = scrabble(rack, top=None, lexicon=self.lexicon)
+
+            for top in range(1, 5):
+                result = [word.score for word in scrabble(rack, top=top, lexicon=self.lexicon)]
+                expected = [word.score for word in every[:top]]
+
+                self.assertEqual(result, expected)
+
+    def test_blank_is_a_letter(self):
+        result = [word.word for word in scrabble('ca?', top=None, lexicon=self.lexicon)]
+
+        self.assertNotIn("ca'", result)
+
+    def test_empty_lexicon(self):
+        result = scrabble('cat', lexicon=Lexicon.from_words([]))
+        expected = []
+
+        self.assertEqual(result, expected)
+
+    def test_invalid_rack_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            _ = scrabble('ab1', lexicon=self.lexicon)
+
+#endregion
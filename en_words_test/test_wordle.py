@@ -0,0 +1,248 @@
+import math
+import os
+import tempfile
+import unittest
+
+from en_words import matrices
+from en_words import wordle
+from en_words.en_words import Lexicon
+from en_words.wordle import WordleConstraints, WordleSolver
+
+
+class TestWordleFeedback(unittest.TestCase):
+    def test_all_green(self):
+        result = wordle.wordle_feedback('crane', 'crane')
+        expected = 'ggggg'
+
+        self.assertEqual(result, expected)
+
+    def test_all_grey(self):
+        result = wordle.wordle_feedback('crane', 'fluid')
+        expected = 'bbbbb'
+
+        self.assertEqual(result, expected)
+
+    def test_yellow(self):
+        result = wordle.wordle_feedback('tares', 'crane')
+        expected = 'byyyb'
+
+        self.assertEqual(result, expected)
+
+    def test_repeated_letter_green_first(self):
+        result = wordle.wordle_feedback('speed', 'abide')
+        expected = 'bbyby'
+
+        self.assertEqual(result, expected)
+
+    def test_repeated_letter_only_yellow_once(self):
+        result = wordle.wordle_feedback('eerie', 'there')
+        expected = 'ybybg'
+
+        self.assertEqual(result, expected)
+
+
+class TestWordlePattern(unittest.TestCase):
+    def test_pattern_from_feedback(self):
+        result = wordle.pattern_from_feedback('gybbb')
+        expected = 5
+
+        self.assertEqual(result, expected)
+
+    def test_round_trip(self):
+        for pattern in range(wordle.PATTERN_COUNT):
+            self.assertEqual(wordle.pattern_from_feedback(wordle.feedback_from_pattern(pattern)), pattern)
+
+    def test_invalid_feedback_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            _ = wordle.pattern_from_feedback('gyxbb')
+
+
+@unittest.skipIf(matrices.np is None, "numpy is not installed")
+class TestFeedbackMatrix(unittest.TestCase):
+    def test_matches_wordle_feedback(self):
+        words = ['abide', 'crane', 'eerie', 'erase', 'geese', 'speed', 'steep', 'there']
+        matrix = wordle.feedback_matrix(words, words)
+
+        for i, guess in enumerate(words):
+            for j, answer in enumerate(words):
+                self.assertEqual(wordle.feedback_from_pattern(int(matrix[i, j])), wordle.wordle_feedback(guess, answer))
+
+    def test_shape_and_type(self):
+        result = wordle.feedback_matrix(['crane', 'tares'], ['crane', 'fluid', 'speed'])
+
+        self.assertEqual(result.shape, (2, 3))
+        self.assertEqual(result.dtype, matrices.np.uint8)
+
+
+@unittest.skipIf(matrices.np is None, "numpy is not installed")
+class TestWordleSolver(unittest.TestCase):
+    def setUp(self):
+        self.solver = WordleSolver(['crane', 'crate', 'trace', 'react', 'caret', 'fluid'])
+
+    def test_feedback(self):
+        result = self.solver.feedback('trace', 'crate')
+        expected = 'yggyg'
+
+        self.assertEqual(result, expected)
+
+    def test_candidates(self):
+        result = self.solver.candidates([('crane', 'gggbg')])
+        expected = ['crate']
+
+        self.assertEqual(result, expected)
+
+    def test_candidates_no_history(self):
+        result = self.solver.candidates([])
+
+        self.assertEqual(result, self.solver.words)
+
+    def test_rank_guesses_best_first(self):
+        result = self.solver.rank_guesses()
+        entropies = [entropy for _, entropy in result]
+
+        self.assertEqual(entropies, sorted(entropies, reverse=True))
+
+    def test_single_candidate_no_information(self):
+        result = self.solver.rank_guesses(['fluid'], top=1)
+        expected = [('fluid', 0.0)]
+
+        self.assertEqual(result, expected)
+
+    def test_hard_mode_only_guesses_candidates(self):
+        candidates = ['crate', 'trace']
+        result = [guess for guess, _ in self.solver.rank_guesses(candidates, top=None, hard_mode=True)]
+
+        self.assertEqual(sorted(result), candidates)
+
+    def test_best_guess_splits_candidates(self):
+        result = self.solver.best_guess()
+
+        self.assertNotEqual(result, 'fluid')
+
+    def test_unknown_word_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            _ = self.solver.feedback('zzzzz', 'crane')
+
+    def test_different_lengths_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            _ = WordleSolver(['crane', 'cranes'])
+
+    def test_six_letter_words(self):
+        solver = WordleSolver(['abcdef', 'abcdeg', 'zzzzzz'])
+
+        result = [solver.feedback('abcdef', 'abcdef'), solver.feedback('abcdef', 'abcdeg')]
+        expected = ['gggggg', 'gggggb']
+
+        self.assertEqual(result, expected)
+
+    def test_six_letter_matrix(self):
+        solver = WordleSolver(['cranes', 'crates', 'traces', 'grated', 'planes'])
+
+        result = solver.matrix.tolist()
+        expected = [[wordle.pattern_from_feedback(wordle.wordle_feedback(guess, answer)) for answer in solver.words] for guess in solver.words]
+
+        self.assertEqual(result, expected)
+
+    def test_six_letter_ranking(self):
+        # Patterns above 242 must be counted apart, not wrapped onto others
+        solver = WordleSolver(['cranes', 'crates', 'traces', 'grated', 'planes'])
+
+        result = {guess for guess, entropy in solver.rank_guesses() if math.isclose(entropy, math.log2(5))}
+        expected = {'cranes', 'crates', 'grated', 'traces'}
+
+        self.assertEqual(result, expected)
+
+    def test_too_long_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            _ = WordleSolver(['abcdefghijk'])
+
+
+@unittest.skipIf(matrices.np is None, "numpy is not installed")
+class TestWordleSolverCache(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.filename_sorted = os.path.join(self.directory.name, "words_sorted.txt")
+
+        with open(self.filename_sorted, 'w') as f:
+            f.write("cat\ncrane\ncrate\nfluid\nhello\ntrace\n")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_writes_matrix_file(self):
+        _ = WordleSolver(filename_sorted=self.filename_sorted)
+
+        self.assertTrue(os.path.exists(wordle.matrix_filename(self.filename_sorted)))
+
+    def test_loads_matrix_file(self):
+        built = WordleSolver(filename_sorted=self.filename_sorted)
+        loaded = WordleSolver(filename_sorted=self.filename_sorted)
+
+        self.assertIsInstance(loaded.matrix, matrices.np.memmap)
+        self.assertTrue((built.matrix == loaded.matrix).all())
+        self.assertEqual(loaded.words, ['crane', 'crate', 'fluid', 'hello', 'trace'])
+
+
+class TestWordleConstraints(unittest.TestCase):
+    def setUp(self):
+        self.lexicon = Lexicon.from_words([
+            'crane', 'crate', 'trace', 'react', 'caret', 'fluid', 'speed', 'spend', 'abide', "o'tea"])
+
+    def test_starts_with_every_word(self):
+        result = WordleConstraints(lexicon=self.lexicon).words()
+        expected = ['abide', 'caret', 'crane', 'crate', 'fluid', 'react', 'speed', 'spend', 'trace']
+
+        self.assertEqual(result, expected)
+
+    def test_empty_lexicon(self):
+        result = WordleConstraints(lexicon=Lexicon.from_words([])).words()
+        expected = []
+
+        self.assertEqual(result, expected)
+
+    def test_green(self):
+        result = WordleConstraints(lexicon=self.lexicon).add('crane', 'gggbg').words()
+        expected = ['crate']
+
+        self.assertEqual(result, expected)
+
+    def test_yellow_not_at_position(self):
+        result = WordleConstraints(lexicon=self.lexicon).add('react', 'yygyy').words()
+        expected = ['crate']
+
+        self.assertEqual(result, expected)
+
+    def test_repeated_letter_count(self):
+        result = WordleConstraints(lexicon=self.lexicon).add('speed', 'gggbg').words()
+        expected = ['spend']
+
+        self.assertEqual(result, expected)
+
+    def test_incremental(self):
+        constraints = WordleConstraints(lexicon=self.lexicon).add('fluid', 'bbbbb')
+
+        self.assertEqual(len(constraints), 5)
+
+        constraints.add('trace', 'yyggy')
+
+        self.assertEqual(constraints.words(), ['react'])
+        self.assertEqual(constraints.history, [('fluid', 'bbbbb'), ('trace', 'yyggy')])
+
+    def test_matches_wordle_feedback(self):
+        words = WordleConstraints(lexicon=self.lexicon).words()
+
+        for answer in words:
+            for guess in words:
+                feedback = wordle.wordle_feedback(guess, answer)
+                result = WordleConstraints(lexicon=self.lexicon).add(guess, feedback).words()
+                expected = [word for word in words if wordle.wordle_feedback(guess, word) == feedback]
+
+                self.assertEqual(result, expected)
+
+    def test_wrong_length_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            _ = WordleConstraints(lexicon=self.lexicon).add('crane', 'ggg')
+
+    def test_invalid_feedback_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            _ = WordleConstraints(lexicon=self.lexicon).add('crane', 'ggxgg')
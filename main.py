@@ -44,7 +44,7 @@ def word_games():
     wg.spelling_bee('t', 'wnidal')
     wg.wordle("?a?e?", "STMLkdBY", "n") 
     wg.polygon('F', 'lretgure')
-    wg.cash_square(['aver', 'flap', 'gent', 'lime', 'newt']) 
+    wg.cash_square_and_display(['aver', 'flap', 'gent', 'lime', 'newt']) 
     wg.countdown('ljsoeitwo') # 'jowliest', 8 letters, best answer
 
 if __name__ == '__main__':